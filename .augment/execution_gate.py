@@ -12,6 +12,7 @@ Purpose: Prevent narration drift after execution failure
 Maps to: ChatGPT suggestion for hard execution authority gate
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -21,6 +22,7 @@ REQUIRED_EVIDENCE = [
 ]
 
 EVIDENCE_DIR = Path(".augment/evidence")
+EVIDENCE_DIR_STR = str(EVIDENCE_DIR)
 
 
 def fail(msg: str) -> None:
@@ -31,16 +33,21 @@ def fail(msg: str) -> None:
 
 def check_execution_evidence() -> None:
     """Verify execution evidence exists before allowing state advancement."""
-    if not EVIDENCE_DIR.exists():
+    if not os.access(EVIDENCE_DIR_STR, os.F_OK):
         fail("Evidence directory missing")
 
-    missing = []
-    for file in REQUIRED_EVIDENCE:
-        if not (EVIDENCE_DIR / file).exists():
-            missing.append(file)
+    # One directory listing instead of a stat() per evidence file
+    try:
+        present = set(os.listdir(EVIDENCE_DIR_STR))
+    except OSError as e:
+        fail(f"Evidence directory unreadable: {e}")
 
-    if missing:
-        fail(f"Missing execution evidence: {', '.join(missing)}")
+    # Common case: everything present, no list built
+    if all(file in present for file in REQUIRED_EVIDENCE):
+        return
+
+    missing = [file for file in REQUIRED_EVIDENCE if file not in present]
+    fail(f"Missing execution evidence: {', '.join(missing)}")
 
 
 if __name__ == "__main__":
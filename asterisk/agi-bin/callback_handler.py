@@ -6,32 +6,95 @@ Handles callback requests initiated by the Python Flask backend
 This script is executed by Asterisk when a callback is initiated.
 It receives parameters from the dialplan and handles the call flow.
 
+Run with --fastagi to serve calls from one persistent process over
+FastAGI (agi://host:4573) instead of one process per call.
+
 Per Rule 25: Comprehensive logging for troubleshooting
+
+Environment:
+- AGI_LOG_FILE: Append logs to this file (e.g. /tmp/asterisk_agi.log); unset = stderr only
+- AGI_LOG_LEVEL: Log level name (default: INFO)
+- FASTAGI_HOST / FASTAGI_PORT: FastAGI listen address (default: 127.0.0.1:4573;
+  the compose fastagi service binds 0.0.0.0)
 """
 
+import io
+import os
 import sys
 import logging
+import socketserver
+from functools import lru_cache
 from asterisk.agi import AGI
 
 # Configure comprehensive logging per Rule 25
+# Log calls use lazy %-style arguments: nothing is formatted for disabled levels
 LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(funcName)s | %(message)s"
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Asterisk already timestamps its console, so skip asctime on stderr
+CONSOLE_LOG_FORMAT = "%(levelname)-8s | %(name)s | %(funcName)s | %(message)s"
+
+# The dialplan normally reaches the persistent FastAGI server; when the
+# script is run per call instead (fallback), module setup is per-call
+# cost, so the persistent log file is opt-in via AGI_LOG_FILE
+AGI_LOG_FILE = os.environ.get("AGI_LOG_FILE", "")
+AGI_LOG_LEVEL = os.environ.get("AGI_LOG_LEVEL", "INFO").upper()
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+logger.setLevel(getattr(logging, AGI_LOG_LEVEL, logging.INFO))
+logger.propagate = False
 
 if not logger.handlers:
-    # Console handler - visible in Asterisk logs
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.DEBUG)
-    console_handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT))
+    # Console handler - stderr is shown in Asterisk logs; stdout is the
+    # AGI command channel and must never carry log lines
+    console_handler = logging.StreamHandler(sys.stderr)
+    console_handler.setFormatter(logging.Formatter(CONSOLE_LOG_FORMAT))
     logger.addHandler(console_handler)
-    
-    # File handler - persistent logs
-    file_handler = logging.FileHandler("/tmp/asterisk_agi.log", mode="a")
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT))
-    logger.addHandler(file_handler)
+
+    # File handler - persistent logs, only when requested
+    if AGI_LOG_FILE:
+        file_formatter = logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT)
+        file_formatter.default_msec_format = None
+        file_handler = logging.FileHandler(AGI_LOG_FILE, mode="a")
+        file_handler.setFormatter(file_formatter)
+        logger.addHandler(file_handler)
+
+# Dialplan argument keys, interned once instead of per call
+_ARG1_KEY = sys.intern('agi_arg_1')
+_ARG2_KEY = sys.intern('agi_arg_2')
+
+
+def handle_call(agi):
+    """
+    Run the callback call flow on an initialized AGI session.
+
+    Shared by the per-call script (main) and the FastAGI server, so the
+    call logic is identical in both modes.
+    """
+    # Get arguments from dialplan
+    env = agi.env
+    destination = env.get(_ARG1_KEY, 'unknown')
+    caller_id = env.get(_ARG2_KEY, 'unknown')
+
+    logger.info("Callback request - Destination: %s, CallerID: %s", destination, caller_id)
+
+    # Answer the call
+    agi.answer()
+
+    # Play hold music or greeting
+    # In production, this would connect to the visitor
+    agi.stream_file('beep')
+
+    # In a real implementation, you would:
+    # 1. Dial the visitor's number
+    # 2. Bridge the calls together
+    # 3. Handle call status and failures
+
+    # For now, just log success
+    logger.info("Callback to %s completed successfully", destination)
+
+    # Hangup
+    agi.hangup()
+    logger.debug("Call answered, beep played, call hung up")
 
 
 def main():
@@ -47,36 +110,11 @@ def main():
         
         # Initialize AGI
         agi = AGI()
-        
-        # Get arguments from dialplan
-        destination = agi.env.get('agi_arg_1', 'unknown')
-        caller_id = agi.env.get('agi_arg_2', 'unknown')
-        
-        logger.info(f"Callback request - Destination: {destination}, CallerID: {caller_id}")
-        
-        # Answer the call
-        agi.answer()
-        logger.debug("Call answered")
-        
-        # Play hold music or greeting
-        # In production, this would connect to the visitor
-        agi.stream_file('beep')
-        logger.debug("Played beep sound")
-        
-        # In a real implementation, you would:
-        # 1. Dial the visitor's number
-        # 2. Bridge the calls together
-        # 3. Handle call status and failures
-        
-        # For now, just log success
-        logger.info(f"Callback to {destination} completed successfully")
-        
-        # Hangup
-        agi.hangup()
-        logger.debug("Call hung up")
+
+        handle_call(agi)
         
     except Exception as e:
-        logger.error(f"AGI script error: {str(e)}", exc_info=True)
+        logger.error("AGI script error: %s", e, exc_info=True)
         try:
             agi.verbose(f"ERROR: {str(e)}")
         except:
@@ -84,6 +122,83 @@ def main():
         sys.exit(1)
 
 
-if __name__ == "__main__":
-    main()
+# ============================================================================
+# FASTAGI SERVER
+# ============================================================================
+# One long-running process serves every call over AGI-over-TCP, so the
+# interpreter start-up, imports and logger setup above are paid once
+# instead of per call. Dialplan: AGI(agi://fastagi:4573,${EXTEN},...), with
+# the server run as its own restartable compose service
+
+FASTAGI_HOST = os.environ.get("FASTAGI_HOST", "127.0.0.1")
+FASTAGI_PORT = int(os.environ.get("FASTAGI_PORT", "4573"))
+
+
+@lru_cache(maxsize=None)
+def _pyst_debug_sink():
+    """
+    pyst2 echoes every protocol line to stderr; discard that chatter in the
+    daemon. Opened on first use so per-call runs never pay for it.
+    """
+    return open(os.devnull, "w")
+
+
+class FastAGI(AGI):
+    """
+    AGI session bound to a FastAGI socket instead of stdin/stdout.
+
+    pyst2's AGI.__init__ installs a SIGHUP handler, which only works in the
+    main thread; over FastAGI a hangup arrives on the socket instead, so
+    the handler is skipped.
+    """
+
+    def __init__(self, stdin, stdout):
+        self.stdin = stdin
+        self.stdout = stdout
+        self.stderr = _pyst_debug_sink()
+        self._got_sighup = False
+        self.env = {}
+        self._get_agi_env()
 
+
+class FastAGIRequestHandler(socketserver.StreamRequestHandler):
+    """Handle one Asterisk FastAGI connection (one call)."""
+
+    def handle(self):
+        agi = None
+        try:
+            logger.info("FastAGI call from %s", self.client_address[0])
+            stdin = io.TextIOWrapper(self.rfile, encoding="utf-8", newline="\n")
+            stdout = io.TextIOWrapper(self.wfile, encoding="utf-8", write_through=True)
+            agi = FastAGI(stdin, stdout)
+            handle_call(agi)
+        except Exception as e:
+            logger.error("FastAGI call error: %s", e, exc_info=True)
+            try:
+                agi.verbose(f"ERROR: {str(e)}")
+            except:
+                pass
+
+
+class FastAGIServer(socketserver.ThreadingTCPServer):
+    """Threaded FastAGI server; each call runs in its own daemon thread."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+def serve_fastagi(host=FASTAGI_HOST, port=FASTAGI_PORT):
+    """Run the FastAGI server until interrupted."""
+    with FastAGIServer((host, port), FastAGIRequestHandler) as server:
+        logger.info("FastAGI server listening on %s:%s", host, port)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("FastAGI server stopped")
+
+
+if __name__ == "__main__":
+    if "--fastagi" in sys.argv:
+        serve_fastagi()
+    else:
+        main()
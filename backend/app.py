@@ -16,30 +16,57 @@ Features:
 import os
 import sys
 import json
+import hashlib
+import hmac
+import ipaddress
+import pathlib
 import base64
 import sqlite3
 import logging
-import uuid
+import logging.handlers
 import requests
 import secrets
 import time
+import queue
+import random
+import re
+import string
+import threading
+import selectors
 import signal
+import socket
 import atexit
 from enum import Enum
-from datetime import datetime, timedelta
-from flask import Flask, request, redirect, jsonify
+from contextlib import contextmanager
+import functools
+from functools import cached_property, lru_cache
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from datetime import time as dt_time
+from urllib.parse import quote_plus, urlencode
+from zoneinfo import ZoneInfo
+from flask import Flask, Response, request, redirect, jsonify
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from werkzeug.middleware.proxy_fix import ProxyFix
 from twilio.rest import Client
+from twilio.http.http_client import TwilioHttpClient
 from twilio.base.exceptions import TwilioRestException
 from twilio.request_validator import RequestValidator
-from oauth_providers import get_user_info
+from twilio.twiml.messaging_response import MessagingResponse
+from twilio.twiml.voice_response import VoiceResponse, Dial
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.cron import CronTrigger
+from oauth_providers import get_user_info, http_session
+from rate_limit_storage import StripedMemoryStorage  # registers memory-striped://
 import phonenumbers
-import pytz
-from datetime import time as dt_time
+import yaml
+import orjson
 from prometheus_client import Counter, Gauge, Histogram, generate_latest, CONTENT_TYPE_LATEST
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from requests.exceptions import ConnectionError, Timeout
 from urllib3.exceptions import NameResolutionError
 
@@ -195,6 +222,28 @@ LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 VERBOSE = "--verbose" in sys.argv
 QUIET = "--quiet" in sys.argv
 
+# Full tracebacks from request handlers are opt-in (they are formatted for
+# every failing request); background workers always log them
+LOG_REQUEST_TRACEBACKS = VERBOSE or os.environ.get("VERBOSE_ERRORS", "false").lower() == "true"
+
+
+class DeferredFormatQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves traceback formatting to the listener thread.
+
+    The stock prepare() formats the whole record, traceback included, on
+    the logging thread. Here only the message is merged (so later changes
+    to the arguments cannot leak in); exc_info travels with the record and
+    the listener's handlers format it.
+    """
+
+    def prepare(self, record):
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 logger = logging.getLogger(__name__)
 
 # Set log level based on flags
@@ -209,12 +258,20 @@ if not logger.handlers:
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.DEBUG if VERBOSE else logging.INFO)
     console_handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT))
-    logger.addHandler(console_handler)
 
     file_handler = logging.FileHandler("/tmp/app.log", mode="a")
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT))
-    logger.addHandler(file_handler)
+
+    # Request threads only enqueue records; one listener thread does the
+    # stdout and file I/O. Stopped (and drained) at exit.
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(DeferredFormatQueueHandler(log_queue))
+    log_listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    log_listener.start()
+    atexit.register(log_listener.stop)
 
 # Graceful shutdown handling (will be registered at end of file)
 shutdown_requested = False
@@ -243,13 +300,37 @@ allowed_origins = os.environ.get("ALLOWED_ORIGINS", "*").split(",")
 CORS(app, resources={r"/*": {"origins": allowed_origins}})
 
 # Rate limiting configuration - prevent abuse and control costs
+# A shared store (e.g. redis://redis:6379/0) keeps counts global across
+# workers and restarts; Redis moving windows are sorted-set backed.
+# memory-striped:// (rate_limit_storage.py, fixed-window only) stays the
+# default for single-process development.
+RATE_LIMIT_STORAGE_URI = os.environ.get("RATE_LIMIT_STORAGE_URI", "memory-striped://")
+RATE_LIMIT_STRATEGY = os.environ.get(
+    "RATE_LIMIT_STRATEGY",
+    "fixed-window" if RATE_LIMIT_STORAGE_URI.startswith("memory") else "moving-window"
+)
+
 limiter = Limiter(
     app=app,
     key_func=get_remote_address,
     default_limits=["200 per day", "50 per hour"],
-    storage_uri="memory://"
+    storage_uri=RATE_LIMIT_STORAGE_URI,
+    strategy=RATE_LIMIT_STRATEGY,
+    # Keep limiting (per process) if the shared store becomes unreachable
+    in_memory_fallback_enabled=True
 )
 
+# Hot endpoints parse and serialize with orjson: it reads and emits bytes
+# directly instead of going through stdlib json plus str.encode().
+def read_json():
+    """Parse the request body as JSON; the raw body is not kept afterwards."""
+    return orjson.loads(request.get_data(cache=False))
+
+
+def json_response(obj, status=200):
+    """Build an application/json response from obj using orjson."""
+    return app.response_class(orjson.dumps(obj), status=status, mimetype="application/json")
+
 # UX Invariants Check - runs before every request
 # Ensures UX guarantees are never violated
 @app.before_request
@@ -289,6 +370,30 @@ def check_ux_invariants():
         }), 503
 
 # Prometheus metrics collectors
+# Every label value fed from data or configuration (rather than a literal
+# at the call site) must be listed here; safe_labels() records anything
+# else as "other" so a typo or bad input cannot mint new time series.
+METRIC_LABEL_VALUES = {
+    "status": frozenset({
+        "pending", "verified", "calling", "connected", "retry_scheduled",
+        "completed", "failed", "dead_letter"
+    }),
+    "priority": frozenset({PRIORITY_HIGH, PRIORITY_DEFAULT, PRIORITY_LOW}),
+    "action": frozenset({"queue", "reject", "delay"}),
+    "mode": frozenset({"on_db_commit", "auto", "request_finished"}),
+    "level": frozenset(str(level) for level in range(1, 10)),
+}
+
+
+def safe_labels(metric, **labels):
+    """metric.labels(**labels) with values outside METRIC_LABEL_VALUES coerced to "other"."""
+    for name, value in labels.items():
+        allowed = METRIC_LABEL_VALUES.get(name)
+        if allowed is not None and value not in allowed:
+            labels[name] = "other"
+    return metric.labels(**labels)
+
+
 # Track callback requests by status
 callback_requests_total = Counter(
     'callback_requests_total',
@@ -382,6 +487,12 @@ concurrent_sms_gauge = Gauge(
     'Current number of concurrent SMS sends in progress'
 )
 
+provider_requests_in_flight = Gauge(
+    'provider_requests_in_flight',
+    'Provider API requests currently in flight',
+    ['type']  # type: calls/sms
+)
+
 concurrency_limit_hits_total = Counter(
     'concurrency_limit_hits_total',
     'Total times concurrency limit was hit',
@@ -402,7 +513,21 @@ TWILIO_NUMBER = os.environ.get("TWILIO_NUMBER", "")
 BUSINESS_NUMBER = os.environ.get("BUSINESS_NUMBER", "")
 FRONTEND_URL = os.environ.get("FRONTEND_URL", "http://localhost:3000")
 DATABASE_PATH = os.environ.get("DATABASE_PATH", "/tmp/callbacks.db")
-RECAPTCHA_SECRET = os.environ.get("RECAPTCHA_SECRET", "6LeIxAcTAAAAAGG-vFI1TnRWxMZNFuojJ4WifJWe")  # Test key
+# Google's documented test secret: siteverify accepts every token with it
+RECAPTCHA_TEST_SECRET = "6LeIxAcTAAAAAGG-vFI1TnRWxMZNFuojJ4WifJWe"
+RECAPTCHA_SECRET = os.environ.get("RECAPTCHA_SECRET", RECAPTCHA_TEST_SECRET)  # Test key
+# With the test secret the answer is always "success", so skip the round-trip
+# unless RECAPTCHA_STRICT asks for real verification anyway
+RECAPTCHA_SKIP_REMOTE = (
+    RECAPTCHA_SECRET == RECAPTCHA_TEST_SECRET
+    and os.environ.get("RECAPTCHA_STRICT", "false").lower() != "true"
+)
+if RECAPTCHA_SKIP_REMOTE:
+    logger.warning("reCAPTCHA test secret in use - tokens are accepted without verification")
+RECAPTCHA_VERIFY_URL = "https://www.google.com/recaptcha/api/siteverify"
+# The secret never changes, so its form encoding is done once
+RECAPTCHA_FORM_PREFIX = urlencode({"secret": RECAPTCHA_SECRET}) + "&response="
+RECAPTCHA_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
 
 # Google OAuth configuration
 GOOGLE_CLIENT_ID = os.environ.get("GOOGLE_CLIENT_ID", "")
@@ -421,13 +546,64 @@ BUSINESS_WEEKDAYS_ONLY = os.environ.get("BUSINESS_WEEKDAYS_ONLY", "true").lower(
 # Escalation policy configuration
 ESCALATION_ENABLED = os.environ.get("ESCALATION_ENABLED", "false").lower() == "true"
 ESCALATION_TIMEOUT_MINUTES = int(os.environ.get("ESCALATION_TIMEOUT_MINUTES", "5"))  # Escalate after 5 minutes of no answer
-ESCALATION_CHAIN = os.environ.get("ESCALATION_CHAIN", "")  # Comma-separated backup numbers: +1234567890,+0987654321
+# Comma-separated backup numbers: +1234567890,+0987654321 (split once here, not per escalation)
+ESCALATION_CHAIN = tuple(
+    num.strip() for num in os.environ.get("ESCALATION_CHAIN", "").split(",") if num.strip()
+)
 ESCALATION_MAX_LEVEL = int(os.environ.get("ESCALATION_MAX_LEVEL", "2"))  # Max escalation levels (0=primary, 1=first backup, 2=second backup)
 
+# VIP phone numbers get high priority (comma-separated, parsed once at startup)
+VIP_PHONE_NUMBERS = frozenset(
+    num.strip() for num in os.environ.get("VIP_PHONE_NUMBERS", "").split(",") if num.strip()
+)
+
 # Concurrency control configuration
 MAX_CONCURRENT_CALLS = int(os.environ.get("MAX_CONCURRENT_CALLS", "3"))  # Max simultaneous calls to business
 MAX_CONCURRENT_SMS = int(os.environ.get("MAX_CONCURRENT_SMS", "10"))  # Max simultaneous SMS sends
 CONCURRENCY_OVERFLOW_ACTION = os.environ.get("CONCURRENCY_OVERFLOW_ACTION", "queue")  # queue, reject, or delay
+# How long "queue" waits for a free slot, and the mean back-off for "delay"
+CONCURRENCY_QUEUE_TIMEOUT_SECONDS = float(os.environ.get("CONCURRENCY_QUEUE_TIMEOUT_SECONDS", "30"))
+CONCURRENCY_DELAY_SECONDS = float(os.environ.get("CONCURRENCY_DELAY_SECONDS", "2"))
+
+# In-process caps on provider API requests in flight. The DB-based checks
+# in check_concurrency_limit() count calls in progress; these gates bound
+# how many calls.create/messages.create requests run at once.
+_CALL_SEM = threading.BoundedSemaphore(MAX_CONCURRENT_CALLS)
+_SMS_SEM = threading.BoundedSemaphore(MAX_CONCURRENT_SMS)
+
+
+class ConcurrencyLimitExceeded(Exception):
+    """Raised by concurrency_gate() when no provider slot could be taken"""
+
+
+@contextmanager
+def concurrency_gate(semaphore, kind):
+    """
+    Hold one provider slot (kind: "calls" or "sms") for the enclosed request.
+
+    When every slot is busy CONCURRENCY_OVERFLOW_ACTION decides: "reject"
+    fails at once, "queue" waits up to CONCURRENCY_QUEUE_TIMEOUT_SECONDS,
+    "delay" backs off once for a jittered CONCURRENCY_DELAY_SECONDS and
+    retries. ConcurrencyLimitExceeded is raised if no slot was taken.
+    """
+    if not semaphore.acquire(blocking=False):
+        safe_labels(concurrency_limit_hits_total, type=kind, action=CONCURRENCY_OVERFLOW_ACTION).inc()
+        if CONCURRENCY_OVERFLOW_ACTION == "queue":
+            acquired = semaphore.acquire(timeout=CONCURRENCY_QUEUE_TIMEOUT_SECONDS)
+        elif CONCURRENCY_OVERFLOW_ACTION == "delay":
+            time.sleep(CONCURRENCY_DELAY_SECONDS * random.uniform(0.5, 1.5))
+            acquired = semaphore.acquire(blocking=False)
+        else:
+            acquired = False
+        if not acquired:
+            raise ConcurrencyLimitExceeded(f"Too many concurrent {kind} requests. Please try again later.")
+
+    provider_requests_in_flight.labels(type=kind).inc()
+    try:
+        yield
+    finally:
+        provider_requests_in_flight.labels(type=kind).dec()
+        semaphore.release()
 
 # Commit mode configuration (transactional integrity)
 # on_db_commit: Ensure callback is only initiated after verification is committed to DB (default, safest)
@@ -440,8 +616,95 @@ MAX_CALLS_PER_DAY = int(os.environ.get("MAX_CALLS_PER_DAY", "100"))
 MAX_SMS_PER_DAY = int(os.environ.get("MAX_SMS_PER_DAY", "200"))
 ALERT_EMAIL = os.environ.get("ALERT_EMAIL", "")  # Email for cost alerts
 
+# Take one unit of today's (UTC) call or SMS budget, only while under the
+# cap: the increment and the comparison are one statement, so concurrent
+# placements cannot all pass at cap-1. No row comes back when the cap is hit.
+DAILY_USAGE_RESERVE_SQL = {
+    "calls": """
+        INSERT INTO daily_usage (day, calls, sms) VALUES (?, 1, 0)
+        ON CONFLICT(day) DO UPDATE SET calls = calls + 1 WHERE calls < ?
+        RETURNING calls
+    """,
+    "sms": """
+        INSERT INTO daily_usage (day, calls, sms) VALUES (?, 0, 1)
+        ON CONFLICT(day) DO UPDATE SET sms = sms + 1 WHERE sms < ?
+        RETURNING sms
+    """,
+}
+DAILY_USAGE_RELEASE_SQL = {
+    "calls": "UPDATE daily_usage SET calls = MAX(calls - 1, 0) WHERE day = ?",
+    "sms": "UPDATE daily_usage SET sms = MAX(sms - 1, 0) WHERE day = ?",
+}
+
+
+def reserve_daily_usage(kind):
+    """
+    Count one call or SMS (kind: "calls" or "sms") against today's limit.
+
+    Returns:
+        tuple: (reserved: bool, day: str or None). day is passed back to
+        release_daily_usage() if the placement fails. A database error
+        fails open with day None, like check_daily_limits().
+    """
+    limit = MAX_CALLS_PER_DAY if kind == "calls" else MAX_SMS_PER_DAY
+    if limit <= 0:
+        return False, None
+    day = utc_now().date().isoformat()
+    try:
+        with get_db_connection() as conn:
+            row = conn.execute(DAILY_USAGE_RESERVE_SQL[kind], (day, limit)).fetchone()
+    except Exception as e:
+        logger.error(f"Error reserving daily {kind} usage: {str(e)}")
+        return True, None
+    return row is not None, day
+
+
+def release_daily_usage(kind, day):
+    """Give back a reservation whose call or SMS was not placed."""
+    if day is None:
+        return
+    try:
+        with get_db_connection() as conn:
+            conn.execute(DAILY_USAGE_RELEASE_SQL[kind], (day,))
+    except Exception as e:
+        logger.error(f"Error releasing daily {kind} usage: {str(e)}")
+
+
+def counts_against_daily_limit(kind, sid_key):
+    """
+    Decorate a provider make_call/send_sms with the daily cost limit.
+
+    A unit is reserved before the provider is contacted and released when
+    the result is not a success, so only placed calls/SMS are counted.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            reserved, day = reserve_daily_usage(kind)
+            if not reserved:
+                logger.error(f"Daily {kind} limit reached; not placing request")
+                label = "call" if kind == "calls" else "SMS"
+                return {'success': False, sid_key: None,
+                        'message': f"Daily {label} limit reached. Please try again tomorrow."}
+            result = None
+            try:
+                result = method(self, *args, **kwargs)
+            finally:
+                if not (result and result.get('success')):
+                    release_daily_usage(kind, day)
+            return result
+        return wrapper
+    return decorator
+
 # Admin dashboard authentication
 ADMIN_API_TOKEN = os.environ.get("ADMIN_API_TOKEN", "")  # Bearer token for admin endpoints
+# Networks allowed to scrape /metrics, e.g. "10.0.0.0/8,127.0.0.1/32";
+# empty allows any address (the admin token is still required)
+ALLOWED_SCRAPE_CIDRS = tuple(
+    ipaddress.ip_network(cidr.strip(), strict=False)
+    for cidr in os.environ.get("ALLOWED_SCRAPE_CIDRS", "").split(",")
+    if cidr.strip()
+)
 
 # Provider selection configuration
 CALLBACK_PROVIDER = os.environ.get("CALLBACK_PROVIDER", "twilio").lower()
@@ -451,6 +714,37 @@ ASTERISK_HOST = os.environ.get("ASTERISK_HOST", "localhost")
 ASTERISK_AMI_PORT = int(os.environ.get("ASTERISK_AMI_PORT", "5038"))
 ASTERISK_AMI_USER = os.environ.get("ASTERISK_AMI_USER", "callback_manager")
 ASTERISK_AMI_SECRET = os.environ.get("ASTERISK_AMI_SECRET", "callback_secret_2026")
+# Logged-in AMI sessions kept open between calls, and how often idle ones are pinged
+ASTERISK_AMI_POOL_SIZE = int(os.environ.get("ASTERISK_AMI_POOL_SIZE", "2"))
+ASTERISK_AMI_KEEPALIVE_SECONDS = 20
+# Total wait for all responses to one write, however slowly bytes trickle in
+ASTERISK_AMI_RESPONSE_TIMEOUT_SECONDS = 10
+
+
+class CachedKeyRequestValidator(RequestValidator):
+    """
+    Twilio RequestValidator that keys HMAC-SHA1 once.
+
+    The auth token never changes, so the keyed HMAC state is built at
+    construction and copied per signature; only the URL and parameters
+    are hashed per request. Signatures are identical to the base class.
+    """
+
+    def __init__(self, token):
+        super().__init__(token)
+        self._mac_prototype = hmac.new(self.token, digestmod=hashlib.sha1)
+
+    def compute_signature(self, uri, params):
+        parts = [uri]
+        if params:
+            for param_name in sorted(set(params)):
+                for value in sorted(set(self.get_values(params, param_name))):
+                    parts.append(param_name)
+                    parts.append(value)
+
+        mac = self._mac_prototype.copy()
+        mac.update("".join(parts).encode("utf-8"))
+        return base64.b64encode(mac.digest()).decode("utf-8").strip()
 
 
 # ============================================================================
@@ -515,6 +809,62 @@ class CallbackProvider:
         raise NotImplementedError("Subclasses must implement is_configured()")
 
 
+# Twilio webhook URLs and call parameters shared by every outbound call
+TWILIO_WEBHOOK_BASE = "https://api.swipswaps.com/twilio/"
+STATUS_CALLBACK_URL_PREFIX = TWILIO_WEBHOOK_BASE + "status_callback?request_id="
+VOICEMAIL_CONNECT_URL = TWILIO_WEBHOOK_BASE + "voicemail_connect"
+VOICEMAIL_STATUS_URL = TWILIO_WEBHOOK_BASE + "voicemail_status"
+HOLD_MUSIC_URL = "http://twimlets.com/holdmusic?Bucket=com.twilio.music.classical"
+# A list, not a tuple: the Twilio client only expands list parameters
+STATUS_CALLBACK_EVENTS = ["completed", "no-answer", "busy", "failed"]
+
+
+@lru_cache(maxsize=1)
+def _get_twilio_http_client():
+    """
+    Build the process-wide keep-alive HTTP client for the Twilio API.
+
+    Failed connection attempts are retried, as are GETs answered with 429
+    or a gateway error. urllib3 never re-sends a POST that reached the
+    server, so a call or SMS is not created twice.
+    """
+    http_client = TwilioHttpClient()
+    http_client.session.mount("https://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(429, 502, 503, 504),
+            raise_on_status=False
+        )
+    ))
+    return http_client
+
+
+def close_twilio_http_client():
+    """Close the Twilio API connection pool, if one was ever opened."""
+    if _get_twilio_http_client.cache_info().currsize:
+        _get_twilio_http_client().session.close()
+
+
+@lru_cache(maxsize=1)
+def _get_twilio_client(sid, auth_token):
+    """
+    Build the process-wide Twilio client for these credentials.
+
+    The provider and the legacy twilio_client global share it, so every
+    call and SMS reuses one keep-alive connection pool to api.twilio.com.
+    """
+    return Client(sid, auth_token, http_client=_get_twilio_http_client())
+
+
+@lru_cache(maxsize=1)
+def _get_twilio_validator(auth_token):
+    """Build the process-wide webhook signature validator for this auth token"""
+    return CachedKeyRequestValidator(auth_token)
+
+
 class TwilioProvider(CallbackProvider):
     """
     Twilio callback provider.
@@ -528,18 +878,24 @@ class TwilioProvider(CallbackProvider):
         self.auth_token = auth_token
         self.twilio_number = twilio_number
         self.client = None
-        self.validator = None
 
         if sid and auth_token:
             try:
-                self.client = Client(sid, auth_token)
-                self.validator = RequestValidator(auth_token)
+                self.client = _get_twilio_client(sid, auth_token)
                 self.logger.info("Twilio provider initialized successfully")
             except Exception as e:
                 self.logger.error(f"Failed to initialize Twilio provider: {str(e)}")
         else:
             self.logger.warning("Twilio credentials not configured")
 
+    @cached_property
+    def validator(self):
+        """Webhook signature validator, built on first use; None when unconfigured"""
+        if not self.client:
+            return None
+        return _get_twilio_validator(self.auth_token)
+
+    @counts_against_daily_limit("calls", "call_sid")
     def make_call(self, to_number, from_number, request_id):
         """Initiate Twilio call to business number with self-healing retry logic"""
         if not self.client:
@@ -549,28 +905,35 @@ class TwilioProvider(CallbackProvider):
         try:
             self.logger.info(f"Initiating Twilio call for request {request_id}: {from_number} -> {to_number}")
 
+            status_callback = STATUS_CALLBACK_URL_PREFIX + request_id
+
             # Wrap Twilio API call with exponential backoff retry
-            call = retry_with_exponential_backoff(
-                lambda: self.client.calls.create(
-                    to=to_number,
-                    from_=from_number,
-                    url=f"http://twimlets.com/holdmusic?Bucket=com.twilio.music.classical",
-                    status_callback=f"https://api.swipswaps.com/twilio/status_callback?request_id={request_id}",
-                    status_callback_event=["completed", "no-answer", "busy", "failed"],
-                    timeout=20
-                ),
-                max_retries=3,
-                base_delay=1,
-                max_delay=5
-            )
+            with concurrency_gate(_CALL_SEM, "calls"):
+                call = retry_with_exponential_backoff(
+                    lambda: self.client.calls.create(
+                        to=to_number,
+                        from_=from_number,
+                        url=HOLD_MUSIC_URL,
+                        status_callback=status_callback,
+                        status_callback_event=STATUS_CALLBACK_EVENTS,
+                        timeout=20
+                    ),
+                    max_retries=3,
+                    base_delay=1,
+                    max_delay=5
+                )
 
             self.logger.info(f"Twilio call initiated successfully: {call.sid}")
             return {'success': True, 'call_sid': call.sid, 'message': 'Call initiated'}
 
+        except ConcurrencyLimitExceeded as e:
+            self.logger.warning(f"Twilio call for request {request_id} not placed: {str(e)}")
+            return {'success': False, 'call_sid': None, 'message': str(e)}
         except (TwilioRestException, ConnectionError, Timeout, NameResolutionError) as e:
             self.logger.error(f"Twilio call failed after retries: {str(e)}")
             return {'success': False, 'call_sid': None, 'message': f"Call failed after retries: {str(e)}"}
 
+    @counts_against_daily_limit("sms", "sms_sid")
     def send_sms(self, to_number, from_number, message):
         """Send SMS via Twilio with self-healing retry logic"""
         if not self.client:
@@ -581,20 +944,24 @@ class TwilioProvider(CallbackProvider):
             self.logger.info(f"Sending Twilio SMS: {from_number} -> {to_number}")
 
             # Wrap Twilio API call with exponential backoff retry
-            msg = retry_with_exponential_backoff(
-                lambda: self.client.messages.create(
-                    to=to_number,
-                    from_=from_number,
-                    body=message
-                ),
-                max_retries=3,
-                base_delay=1,
-                max_delay=5
-            )
+            with concurrency_gate(_SMS_SEM, "sms"):
+                msg = retry_with_exponential_backoff(
+                    lambda: self.client.messages.create(
+                        to=to_number,
+                        from_=from_number,
+                        body=message
+                    ),
+                    max_retries=3,
+                    base_delay=1,
+                    max_delay=5
+                )
 
             self.logger.info(f"Twilio SMS sent successfully: {msg.sid}")
             return {'success': True, 'sms_sid': msg.sid, 'message': 'SMS sent'}
 
+        except ConcurrencyLimitExceeded as e:
+            self.logger.warning(f"Twilio SMS not sent: {str(e)}")
+            return {'success': False, 'sms_sid': None, 'message': str(e)}
         except (TwilioRestException, ConnectionError, Timeout, NameResolutionError) as e:
             self.logger.error(f"Twilio SMS failed after retries: {str(e)}")
             return {'success': False, 'sms_sid': None, 'message': f"SMS failed after retries: {str(e)}"}
@@ -604,11 +971,86 @@ class TwilioProvider(CallbackProvider):
         return self.client is not None
 
 
+class AMISession:
+    """
+    One AMI connection with frame-based reads.
+
+    AMI messages are header lines ending in a blank line. Bytes are read
+    through a preallocated receive buffer into a reusable bytearray, and
+    each complete message is parsed into a dict with lower-cased keys, so
+    a response split across TCP segments (or several pipelined responses
+    in one segment) is handled the same way.
+
+    Reads wait on a selector (epoll on Linux) against an overall deadline,
+    so a peer sending a byte at a time cannot stretch the wait past it.
+    """
+
+    RECV_SIZE = 8192
+
+    def __init__(self, sock):
+        self.sock = sock
+        self._buffer = bytearray()
+        self._chunk = bytearray(self.RECV_SIZE)
+        self._chunk_view = memoryview(self._chunk)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(sock, selectors.EVENT_READ)
+
+    def _fill(self, deadline):
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._selector.select(remaining):
+                raise socket.timeout("AMI response timed out")
+        received = self.sock.recv_into(self._chunk)
+        if not received:
+            raise ConnectionAbortedError("AMI connection closed")
+        self._buffer += self._chunk_view[:received]
+
+    def read_until(self, delimiter, deadline=None):
+        """Return the bytes before delimiter, consuming both."""
+        start = 0
+        while True:
+            index = self._buffer.find(delimiter, start)
+            if index >= 0:
+                data = bytes(self._buffer[:index])
+                del self._buffer[:index + len(delimiter)]
+                return data
+            # Only the tail can hold the start of a delimiter split across reads
+            start = max(0, len(self._buffer) - len(delimiter) + 1)
+            self._fill(deadline)
+
+    def read_frame(self, deadline=None):
+        """Read the next message as a {lower-cased header: value} dict."""
+        headers = {}
+        for line in self.read_until(b"\r\n\r\n", deadline).decode('utf-8', 'replace').split("\r\n"):
+            key, separator, value = line.partition(":")
+            if separator:
+                headers[key.strip().lower()] = value.strip()
+        return headers
+
+    def send(self, data):
+        self.sock.sendall(data)
+
+    def close(self):
+        self._selector.close()
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+
 class AsteriskProvider(CallbackProvider):
     """
     Asterisk PBX callback provider.
     Uses Asterisk Manager Interface (AMI) to originate calls.
     Per Rule 25: Comprehensive logging for troubleshooting.
+
+    Logged-in AMI sessions are pooled (up to ASTERISK_AMI_POOL_SIZE idle)
+    and pinged every ASTERISK_AMI_KEEPALIVE_SECONDS, so an Originate does
+    not pay for a TCP connect and login each time. Concurrent make_call()
+    requests are pipelined: whichever caller finds no batch in flight
+    sends everything queued so far in one write, and callers arriving
+    meanwhile go out together in the next batch, sent by the oldest of
+    them once the current batch is answered.
     """
 
     def __init__(self, host, port, username, secret):
@@ -617,12 +1059,18 @@ class AsteriskProvider(CallbackProvider):
         self.port = port
         self.username = username
         self.secret = secret
+        self._pool = queue.LifoQueue(maxsize=ASTERISK_AMI_POOL_SIZE)
+        self._action_counter = 0
+        self._action_lock = threading.Lock()
+        self._pending_calls = deque()
+        self._batch_lock = threading.Lock()
+        self._batch_in_flight = False
         self._test_connection()
+        threading.Thread(target=self._keepalive_worker, name="ami-keepalive", daemon=True).start()
 
     def _test_connection(self):
         """Test AMI connection on initialization"""
         try:
-            import socket
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(5)
             sock.connect((self.host, self.port))
@@ -634,54 +1082,138 @@ class AsteriskProvider(CallbackProvider):
     def _ami_connect(self):
         """
         Connect to Asterisk Manager Interface.
-        Returns socket connection or None on failure.
+        Returns a logged-in AMISession or None on failure.
         """
-        import socket
-
+        session = None
         try:
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(10)
+            session = AMISession(sock)
             sock.connect((self.host, self.port))
 
-            # Read welcome message
-            welcome = sock.recv(1024).decode('utf-8')
-            self.logger.debug(f"AMI welcome: {welcome.strip()}")
+            # Read welcome line ("Asterisk Call Manager/<version>")
+            welcome = session.read_until(b"\r\n")
+            self.logger.debug(f"AMI welcome: {welcome.decode('utf-8', 'replace')}")
 
-            # Login
+            # Login. Events are off: a pooled session only ever carries
+            # responses to its own actions.
             login_cmd = (
                 f"Action: Login\r\n"
                 f"Username: {self.username}\r\n"
                 f"Secret: {self.secret}\r\n"
+                f"Events: off\r\n"
                 f"\r\n"
             )
-            sock.send(login_cmd.encode('utf-8'))
+            session.send(login_cmd.encode('utf-8'))
 
             # Read login response
-            response = sock.recv(1024).decode('utf-8')
-            self.logger.debug(f"AMI login response: {response.strip()}")
+            response = session.read_frame()
+            self.logger.debug(f"AMI login response: {response}")
 
-            if "Success" in response:
+            if response.get("response") == "Success":
                 self.logger.info("AMI login successful")
-                return sock
+                return session
             else:
-                self.logger.error(f"AMI login failed: {response}")
-                sock.close()
+                self.logger.error(f"AMI login failed: {response.get('message', response)}")
+                session.close()
                 return None
 
         except Exception as e:
             self.logger.error(f"AMI connection failed: {str(e)}")
+            if session:
+                session.close()
             return None
 
-    def _ami_disconnect(self, sock):
+    def _ami_disconnect(self, session):
         """Disconnect from AMI"""
         try:
-            logoff_cmd = "Action: Logoff\r\n\r\n"
-            sock.send(logoff_cmd.encode('utf-8'))
-            sock.close()
+            session.send(b"Action: Logoff\r\n\r\n")
+            session.close()
             self.logger.debug("AMI disconnected")
         except Exception as e:
             self.logger.error(f"AMI disconnect error: {str(e)}")
 
+    def _checkout(self):
+        """
+        Take an idle logged-in session, or log in a new one.
+
+        Returns:
+            tuple: (AMISession or None, pooled: bool)
+        """
+        try:
+            return self._pool.get_nowait(), True
+        except queue.Empty:
+            return self._ami_connect(), False
+
+    def _checkin(self, session):
+        """Return a healthy session to the pool, logging off any surplus"""
+        try:
+            self._pool.put_nowait(session)
+        except queue.Full:
+            self._ami_disconnect(session)
+
+    def _discard(self, session):
+        """Drop a session that failed mid-action"""
+        session.close()
+
+    def _next_action_id(self, prefix):
+        with self._action_lock:
+            self._action_counter += 1
+            return f"{prefix}_{self._action_counter}"
+
+    def _send_actions(self, session, commands, action_ids):
+        """
+        Write several AMI actions at once and collect their responses.
+
+        Responses are matched by ActionID; messages for other IDs (left
+        over from an earlier action that timed out) are skipped. Socket
+        errors, ASTERISK_AMI_RESPONSE_TIMEOUT_SECONDS passing and a closed
+        connection raise OSError.
+
+        Args:
+            commands (bytes): the encoded actions, back to back
+
+        Returns:
+            dict: ActionID -> response headers
+        """
+        session.send(commands)
+        deadline = time.monotonic() + ASTERISK_AMI_RESPONSE_TIMEOUT_SECONDS
+        wanted = set(action_ids)
+        responses = {}
+        while wanted:
+            response = session.read_frame(deadline)
+            action_id = response.get("actionid")
+            if action_id in wanted:
+                wanted.discard(action_id)
+                responses[action_id] = response
+        return responses
+
+    def _send_action(self, session, command, action_id):
+        """Send one encoded AMI action and return its response headers."""
+        return self._send_actions(session, command, [action_id])[action_id]
+
+    def _keepalive_worker(self):
+        """Ping idle sessions so Asterisk keeps them open; drop dead ones"""
+        while True:
+            time.sleep(ASTERISK_AMI_KEEPALIVE_SECONDS)
+            idle = []
+            while True:
+                try:
+                    idle.append(self._pool.get_nowait())
+                except queue.Empty:
+                    break
+            for session in idle:
+                action_id = self._next_action_id("ping")
+                ping_cmd = f"Action: Ping\r\nActionID: {action_id}\r\n\r\n".encode('utf-8')
+                try:
+                    self._send_action(session, ping_cmd, action_id)
+                except OSError as e:
+                    self.logger.debug(f"Dropping dead AMI session: {str(e)}")
+                    self._discard(session)
+                    continue
+                self._checkin(session)
+
+    @counts_against_daily_limit("calls", "call_sid")
     def make_call(self, to_number, from_number, request_id):
         """
         Initiate call via Asterisk AMI Originate command.
@@ -689,20 +1221,68 @@ class AsteriskProvider(CallbackProvider):
         This originates a call to the business number, and when answered,
         connects to the AGI script which handles the callback logic.
         """
-        sock = self._ami_connect()
-        if not sock:
-            return {'success': False, 'call_sid': None, 'message': 'AMI connection failed'}
+        self.logger.info(f"Originating Asterisk call for request {request_id}: {from_number} -> {to_number}")
+
+        job = {'call': (to_number, from_number, request_id), 'done': threading.Event(), 'result': None, 'lead': False}
+        with self._batch_lock:
+            self._pending_calls.append(job)
+            if self._batch_in_flight:
+                leader = False
+            else:
+                leader = self._batch_in_flight = True
+
+        if not leader:
+            job['done'].wait()
+            if not job['lead']:
+                return job['result']
+
+        # Send one batch (our own call is in it), then hand the next batch
+        # to the oldest waiting caller so no caller sends more than its own
+        with self._batch_lock:
+            batch = list(self._pending_calls)
+            self._pending_calls.clear()
 
         try:
-            self.logger.info(f"Originating Asterisk call for request {request_id}: {from_number} -> {to_number}")
+            results = self.originate_batch([queued['call'] for queued in batch])
+        except Exception as e:
+            self.logger.error(f"Asterisk call failed: {str(e)}")
+            results = [{'success': False, 'call_sid': None, 'message': str(e)}] * len(batch)
+
+        for queued, result in zip(batch, results):
+            queued['result'] = result
+            queued['done'].set()
+
+        with self._batch_lock:
+            if self._pending_calls:
+                successor = self._pending_calls[0]
+                successor['lead'] = True
+                successor['done'].set()
+            else:
+                self._batch_in_flight = False
+
+        return job['result']
 
+    def originate_batch(self, calls):
+        """
+        Originate several calls over one AMI session in a single write.
+
+        Args:
+            calls (list): (to_number, from_number, request_id) tuples
+
+        Returns:
+            list: one make_call()-style result dict per call, in order
+        """
+        action_ids = []
+        commands = []
+        for to_number, from_number, request_id in calls:
             # Generate unique action ID for tracking
             action_id = f"callback_{request_id}"
+            action_ids.append(action_id)
 
             # Originate call via AMI using Twilio SIP trunk (PJSIP)
             # This calls the business number (to_number) via Twilio SIP trunk
             # and then connects to the customer (from_number)
-            originate_cmd = (
+            commands.append(
                 f"Action: Originate\r\n"
                 f"ActionID: {action_id}\r\n"
                 f"Channel: PJSIP/{to_number}@twilio-trunk\r\n"
@@ -715,25 +1295,41 @@ class AsteriskProvider(CallbackProvider):
                 f"\r\n"
             )
 
-            sock.send(originate_cmd.encode('utf-8'))
+        payload = "".join(commands).encode('utf-8')
 
-            # Read response
-            response = sock.recv(2048).decode('utf-8')
-            self.logger.debug(f"AMI originate response: {response.strip()}")
+        while True:
+            session, pooled = self._checkout()
+            if not session:
+                return [{'success': False, 'call_sid': None, 'message': 'AMI connection failed'}] * len(calls)
 
-            self._ami_disconnect(sock)
-
-            if "Success" in response:
+            try:
+                responses = self._send_actions(session, payload, action_ids)
+            except Exception as e:
+                self._discard(session)
+                # A pooled session Asterisk already closed never ran the
+                # actions, so retry on a fresh login. After a timeout they
+                # may have run; resending would place duplicate calls.
+                if pooled and not isinstance(e, socket.timeout):
+                    self.logger.debug(f"Pooled AMI session failed, reconnecting: {str(e)}")
+                    continue
+                self.logger.error(f"Asterisk call failed: {str(e)}")
+                return [{'success': False, 'call_sid': None, 'message': str(e)}] * len(calls)
+
+            self._checkin(session)
+            break
+
+        results = []
+        for action_id in action_ids:
+            response = responses[action_id]
+            self.logger.debug(f"AMI originate response: {response}")
+            if response.get("response") == "Success":
                 self.logger.info(f"Asterisk call originated successfully: {action_id}")
-                return {'success': True, 'call_sid': action_id, 'message': 'Call originated'}
+                results.append({'success': True, 'call_sid': action_id, 'message': 'Call originated'})
             else:
-                self.logger.error(f"Asterisk call originate failed: {response}")
-                return {'success': False, 'call_sid': None, 'message': response}
-
-        except Exception as e:
-            self.logger.error(f"Asterisk call failed: {str(e)}")
-            self._ami_disconnect(sock)
-            return {'success': False, 'call_sid': None, 'message': str(e)}
+                message = response.get("message", "Originate failed")
+                self.logger.error(f"Asterisk call originate failed: {message}")
+                results.append({'success': False, 'call_sid': None, 'message': message})
+        return results
 
     def send_sms(self, to_number, from_number, message):
         """
@@ -783,27 +1379,88 @@ else:
 logger.info(f"Callback provider initialized: {callback_provider.__class__.__name__}")
 logger.info(f"Provider configured: {callback_provider.is_configured()}")
 
+# The provider is fixed at boot, so its capabilities are resolved once here
+# instead of with isinstance() chains on every call path.
+_PROVIDER_IS_TWILIO = isinstance(callback_provider, TwilioProvider)
+# Asterisk presents the visitor's number as caller ID
+_PROVIDER_ASTERISK_USES_VISITOR = isinstance(callback_provider, AsteriskProvider)
+_PROVIDER_FROM_NUMBER = TWILIO_NUMBER if _PROVIDER_IS_TWILIO else (
+    None if _PROVIDER_ASTERISK_USES_VISITOR else BUSINESS_NUMBER
+)
+
 
 # Initialize Twilio client (legacy - for backward compatibility)
 twilio_client = None
-twilio_validator = None
 if TWILIO_SID and TWILIO_AUTH_TOKEN:
     try:
-        twilio_client = Client(TWILIO_SID, TWILIO_AUTH_TOKEN)
-        twilio_validator = RequestValidator(TWILIO_AUTH_TOKEN)
-        logger.info("Twilio client and validator initialized successfully")
+        # Same instance as the Twilio provider (when it is the active one)
+        twilio_client = _get_twilio_client(TWILIO_SID, TWILIO_AUTH_TOKEN)
+        logger.info("Twilio client initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize Twilio client: {str(e)}")
 else:
     logger.warning("Twilio credentials not configured - callback functionality will be limited")
 
 
-def verify_recaptcha(token):
+def get_twilio_validator():
+    """
+    Webhook signature validator for the configured auth token.
+
+    Built on the first webhook and shared with TwilioProvider.validator;
+    None when Twilio is not configured.
+    """
+    if twilio_client is None:
+        return None
+    return _get_twilio_validator(TWILIO_AUTH_TOKEN)
+
+
+# Verification results by (token, client IP) hash. Long enough to absorb
+# double-submits and retries, short enough that a leaked token is not
+# reusable from the same address for long.
+RECAPTCHA_CACHE_TTL_SECONDS = 30
+RECAPTCHA_CACHE_MAX_ENTRIES = 4096
+
+_recaptcha_cache = OrderedDict()
+_recaptcha_cache_lock = threading.Lock()
+
+# Remote verifications run here so /request_callback can do its local
+# checks during the round-trip to Google
+RECAPTCHA_VERIFY_WORKERS = int(os.environ.get("RECAPTCHA_VERIFY_WORKERS", "16"))
+
+recaptcha_executor = ThreadPoolExecutor(
+    max_workers=RECAPTCHA_VERIFY_WORKERS,
+    thread_name_prefix="recaptcha-verify"
+)
+
+
+def start_recaptcha_verification(token, remote_ip=None):
+    """
+    Begin verify_recaptcha(token, remote_ip) and return a Future for its result.
+
+    Tokens that need no round-trip (empty, or the test secret in use) are
+    answered on the caller's thread; the rest go to recaptcha_executor.
+    """
+    if not token or RECAPTCHA_SKIP_REMOTE:
+        future = Future()
+        future.set_result(verify_recaptcha(token, remote_ip))
+        return future
+    return recaptcha_executor.submit(verify_recaptcha, token, remote_ip)
+
+
+def verify_recaptcha(token, remote_ip=None):
     """
     Verify Google reCAPTCHA v2 token.
 
+    Results are cached by token and client IP for
+    RECAPTCHA_CACHE_TTL_SECONDS, so a client retrying with the same token
+    skips the round-trip to Google; the same token from another address is
+    verified again. Network errors are not cached. With the test secret
+    (and no RECAPTCHA_STRICT) any non-empty token passes without a
+    round-trip.
+
     Args:
         token (str): reCAPTCHA response token from frontend
+        remote_ip (str): Client IP address, also sent to Google (optional)
 
     Returns:
         bool: True if verification successful, False otherwise
@@ -812,13 +1469,42 @@ def verify_recaptcha(token):
         logger.warning("reCAPTCHA token missing")
         return False
 
+    if RECAPTCHA_SKIP_REMOTE:
+        return True
+
+    key = hashlib.sha256(f"{token}\0{remote_ip}".encode()).digest()
+    now = time.monotonic()
+
+    with _recaptcha_cache_lock:
+        cached = _recaptcha_cache.get(key)
+        if cached is not None:
+            if now - cached[1] < RECAPTCHA_CACHE_TTL_SECONDS:
+                logger.debug("reCAPTCHA result served from cache")
+                return cached[0]
+            del _recaptcha_cache[key]
+
+    success = _verify_recaptcha_remote(token, remote_ip)
+    if success is None:
+        return False
+
+    with _recaptcha_cache_lock:
+        _recaptcha_cache[key] = (success, now)
+        while len(_recaptcha_cache) > RECAPTCHA_CACHE_MAX_ENTRIES:
+            _recaptcha_cache.popitem(last=False)
+
+    return success
+
+
+def _verify_recaptcha_remote(token, remote_ip=None):
+    """Ask Google to verify a token; None when no answer was obtained."""
+    body = RECAPTCHA_FORM_PREFIX + quote_plus(token)
+    if remote_ip:
+        body += "&remoteip=" + quote_plus(remote_ip)
     try:
-        response = requests.post(
-            'https://www.google.com/recaptcha/api/siteverify',
-            data={
-                'secret': RECAPTCHA_SECRET,
-                'response': token
-            },
+        response = http_session.post(
+            RECAPTCHA_VERIFY_URL,
+            data=body,
+            headers=RECAPTCHA_FORM_HEADERS,
             timeout=10
         )
         result = response.json()
@@ -834,10 +1520,10 @@ def verify_recaptcha(token):
     except requests.exceptions.RequestException as e:
         logger.error(f"reCAPTCHA verification request failed: {str(e)}")
         # Fail open in case of network issues (configurable)
-        return False
+        return None
     except Exception as e:
         logger.error(f"reCAPTCHA verification error: {str(e)}")
-        return False
+        return None
 
 
 def generate_request_fingerprint(ip_address, user_agent, phone_number):
@@ -852,12 +1538,70 @@ def generate_request_fingerprint(ip_address, user_agent, phone_number):
         phone_number (str): Submitted phone number
 
     Returns:
-        str: SHA256 hash fingerprint
+        str: 32-character BLAKE2b (128-bit) hash fingerprint
+    """
+    # A lookup key, not a security boundary: BLAKE2b is faster than SHA256
+    # and the shorter digest keeps idx_callbacks_fingerprint_created_ts compact
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(ip_address).encode())  # remote_addr can be None
+    digest.update(b"|")
+    digest.update(user_agent.encode())
+    digest.update(b"|")
+    digest.update(phone_number.encode())
+    return digest.hexdigest()
+
+
+def generate_request_fingerprints_bulk(rows):
+    """
+    Fingerprint many (ip_address, user_agent, phone_number) rows at once.
+
+    Produces the same values as generate_request_fingerprint(). Inputs are
+    far too short for hashlib to release the GIL, so this stays on one
+    thread and hashes each joined row in a single call instead.
+
+    Args:
+        rows (list): (ip_address, user_agent, phone_number) tuples
+
+    Returns:
+        list: Fingerprints in the order of rows
+    """
+    blake2b = hashlib.blake2b
+    return [
+        blake2b(f"{ip_address}|{user_agent}|{phone_number}".encode(), digest_size=16).hexdigest()
+        for ip_address, user_agent, phone_number in rows
+    ]
+
+
+UNIX_EPOCH = datetime(1970, 1, 1)
+
+
+def utc_now():
+    """
+    Current UTC time as a naive datetime.
+
+    Same value and isoformat() text as the deprecated datetime.utcnow(),
+    which every stored timestamp and text cutoff in this module relies on.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# SQL equivalent of epoch_us() for an ISO-8601 UTC text column
+CREATED_AT_TS_SQL = "CAST(ROUND((julianday({column}) - 2440587.5) * 86400000000) AS INTEGER)"
+
+
+def epoch_us(dt=None):
     """
-    import hashlib
+    UNIX epoch microseconds, the unit of callbacks.created_at_ts.
 
-    fingerprint_data = f"{ip_address}|{user_agent}|{phone_number}"
-    return hashlib.sha256(fingerprint_data.encode()).hexdigest()
+    Args:
+        dt (datetime): Naive UTC datetime (default: now)
+
+    Returns:
+        int: Microseconds since 1970-01-01T00:00:00 UTC
+    """
+    if dt is None:
+        return time.time_ns() // 1000
+    return (dt - UNIX_EPOCH) // timedelta(microseconds=1)
 
 
 def cleanup_stuck_requests(timeout_minutes=5):
@@ -871,10 +1615,11 @@ def cleanup_stuck_requests(timeout_minutes=5):
         timeout_minutes (int): Minutes before marking stuck request as failed
     """
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
-        cutoff_time = datetime.utcnow() - timedelta(minutes=timeout_minutes)
+        now = utc_now()
+        cutoff_time = now - timedelta(minutes=timeout_minutes)
 
         cursor.execute("""
             UPDATE callbacks
@@ -883,13 +1628,14 @@ def cleanup_stuck_requests(timeout_minutes=5):
                 updated_at = ?
             WHERE request_status = 'calling'
             AND created_at < ?
-        """, (datetime.utcnow().isoformat(), cutoff_time.isoformat()))
+        """, (now.isoformat(), cutoff_time.isoformat()))
 
         cleared_count = cursor.rowcount
         conn.commit()
         conn.close()
 
         if cleared_count > 0:
+            forget_status()
             logger.info(f"Auto-cleanup: cleared {cleared_count} stuck request(s)")
 
         return cleared_count
@@ -916,33 +1662,28 @@ def check_duplicate_request(phone_number, time_window_minutes=60):
         # Auto-cleanup stuck requests before checking duplicates
         cleanup_stuck_requests(timeout_minutes=5)
 
-        conn = sqlite3.connect(DATABASE_PATH)
-        cursor = conn.cursor()
-
         # Calculate cutoff time
-        cutoff_time = datetime.utcnow() - timedelta(minutes=time_window_minutes)
+        now_ts = epoch_us()
+        cutoff_ts = now_ts - time_window_minutes * 60_000_000
 
         # Check for recent requests from this phone number (exclude cancelled)
-        cursor.execute("""
-            SELECT request_id, request_status, created_at
-            FROM callbacks
-            WHERE visitor_phone = ?
-            AND created_at > ?
-            AND request_status IN ('pending', 'calling', 'connected', 'verified')
-            ORDER BY created_at DESC
-            LIMIT 1
-        """, (phone_number, cutoff_time.isoformat()))
-
-        result = cursor.fetchone()
-        conn.close()
+        with get_db_connection() as conn:
+            result = conn.execute("""
+                SELECT request_id, request_status, created_at_ts
+                FROM callbacks
+                WHERE visitor_phone = ?
+                AND created_at_ts > ?
+                AND request_status IN ('pending', 'calling', 'connected', 'verified')
+                ORDER BY created_at_ts DESC
+                LIMIT 1
+            """, (phone_number, cutoff_ts)).fetchone()
 
         if result:
-            request_id, status, created_at_str = result
+            request_id, status, created_at_ts = result
             logger.warning(f"Duplicate request detected for {phone_number}: existing {request_id} ({status})")
 
             # Calculate time remaining until user can retry
-            created_at = datetime.fromisoformat(created_at_str)
-            elapsed_minutes = (datetime.utcnow() - created_at).total_seconds() / 60
+            elapsed_minutes = (now_ts - created_at_ts) / 60_000_000
             remaining_minutes = max(0, time_window_minutes - elapsed_minutes)
 
             return True, f"You already have a {status} callback request. Please wait.", request_id, remaining_minutes
@@ -955,36 +1696,78 @@ def check_duplicate_request(phone_number, time_window_minutes=60):
         return False, "", None
 
 
-def check_fingerprint_abuse(fingerprint, max_requests_per_day=20):
+# 24h request counts by fingerprint. A repeat offender is rejected from
+# memory; stored requests drop their entry so counts never run low.
+FINGERPRINT_CACHE_TTL_SECONDS = 60
+FINGERPRINT_CACHE_MAX_ENTRIES = 10000
+
+_fingerprint_cache = OrderedDict()
+_fingerprint_cache_lock = threading.Lock()
+
+
+def forget_fingerprint_count(fingerprint):
+    """Drop the cached count after a request with this fingerprint is stored."""
+    with _fingerprint_cache_lock:
+        _fingerprint_cache.pop(fingerprint, None)
+
+
+def cached_fingerprint_count(fingerprint):
+    """Return the cached 24h count for a fingerprint, or None if absent or expired."""
+    now = time.monotonic()
+    with _fingerprint_cache_lock:
+        cached = _fingerprint_cache.get(fingerprint)
+        if cached is None:
+            return None
+        if now - cached[1] >= FINGERPRINT_CACHE_TTL_SECONDS:
+            del _fingerprint_cache[fingerprint]
+            return None
+        return cached[0]
+
+
+def fingerprint_window_start():
+    """created_at_ts cutoff for the 24h fingerprint window."""
+    return epoch_us() - 24 * 3600 * 1_000_000
+
+
+def check_fingerprint_abuse(fingerprint, max_requests_per_day=20, count=None):
     """
     Check if request fingerprint shows abuse pattern.
 
     Detects if same IP+UserAgent+Phone combination is making too many requests.
+    Counts are cached for FINGERPRINT_CACHE_TTL_SECONDS, so a blocked
+    client retrying in a loop does not reach the database.
 
     Args:
         fingerprint (str): Request fingerprint hash
         max_requests_per_day (int): Maximum requests allowed per day (default: 20, increased for testing)
+        count (int): 24h count already read from the database (optional)
 
     Returns:
         tuple: (is_abuse: bool, message: str, request_count: int)
     """
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
-        cursor = conn.cursor()
-
-        # Calculate cutoff time (24 hours ago)
-        cutoff_time = datetime.utcnow() - timedelta(hours=24)
-
-        # Count requests with this fingerprint in last 24 hours
-        cursor.execute("""
-            SELECT COUNT(*)
-            FROM callbacks
-            WHERE fingerprint = ?
-            AND created_at > ?
-        """, (fingerprint, cutoff_time.isoformat()))
-
-        count = cursor.fetchone()[0]
-        conn.close()
+        now = time.monotonic()
+        if count is None:
+            count = cached_fingerprint_count(fingerprint)
+            fresh = count is None
+        else:
+            fresh = True
+
+        if count is None:
+            # Count requests with this fingerprint in last 24 hours
+            with get_db_connection() as conn:
+                count = conn.execute("""
+                    SELECT COUNT(*)
+                    FROM callbacks
+                    WHERE fingerprint = ?
+                    AND created_at_ts > ?
+                """, (fingerprint, fingerprint_window_start())).fetchone()[0]
+
+        if fresh:
+            with _fingerprint_cache_lock:
+                _fingerprint_cache[fingerprint] = (count, now)
+                while len(_fingerprint_cache) > FINGERPRINT_CACHE_MAX_ENTRIES:
+                    _fingerprint_cache.popitem(last=False)
 
         if count >= max_requests_per_day:
             logger.warning(f"Fingerprint abuse detected: {fingerprint} has {count} requests in 24h")
@@ -1006,7 +1789,7 @@ def get_concurrent_calls_count():
         int: Number of requests currently in 'calling' or 'connected' status
     """
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -1036,11 +1819,11 @@ def get_concurrent_sms_count():
         int: Number of requests currently sending SMS (verified status within last 5 minutes)
     """
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
         # Count recent SMS sends (within last 5 minutes)
-        cutoff_time = datetime.utcnow() - timedelta(minutes=5)
+        cutoff_time = utc_now() - timedelta(minutes=5)
 
         cursor.execute("""
             SELECT COUNT(*)
@@ -1079,7 +1862,7 @@ def check_concurrency_limit(operation_type):
 
             if current_count >= max_limit:
                 logger.warning(f"Concurrent call limit reached: {current_count}/{max_limit}")
-                concurrency_limit_hits_total.labels(type='calls', action=CONCURRENCY_OVERFLOW_ACTION).inc()
+                safe_labels(concurrency_limit_hits_total, type='calls', action=CONCURRENCY_OVERFLOW_ACTION).inc()
 
                 if CONCURRENCY_OVERFLOW_ACTION == 'reject':
                     return False, f"System is at capacity ({current_count} concurrent calls). Please try again later.", current_count, max_limit
@@ -1094,7 +1877,7 @@ def check_concurrency_limit(operation_type):
 
             if current_count >= max_limit:
                 logger.warning(f"Concurrent SMS limit reached: {current_count}/{max_limit}")
-                concurrency_limit_hits_total.labels(type='sms', action=CONCURRENCY_OVERFLOW_ACTION).inc()
+                safe_labels(concurrency_limit_hits_total, type='sms', action=CONCURRENCY_OVERFLOW_ACTION).inc()
 
                 if CONCURRENCY_OVERFLOW_ACTION == 'reject':
                     return False, f"System is at capacity ({current_count} concurrent SMS). Please try again later.", current_count, max_limit
@@ -1124,49 +1907,40 @@ def check_honeypot(honeypot_value):
     Returns:
         bool: True if bot detected (honeypot filled), False if legitimate
     """
-    if honeypot_value and honeypot_value.strip():
+    # isspace() answers "blank?" without building a stripped copy; the
+    # common empty/None case never reaches it
+    if honeypot_value and not honeypot_value.isspace():
         logger.warning(f"Honeypot triggered: bot detected (value: {honeypot_value[:50]})")
         return True
     return False
 
 
-def check_daily_limits():
+def check_daily_limits(usage=None):
     """
     Check if daily call/SMS limits have been reached.
 
-    Prevents runaway costs from spam or misconfiguration.
+    Prevents runaway costs from spam or misconfiguration. Usage comes from
+    the daily_usage counter row for the current UTC day, a primary-key
+    lookup that does not grow with the callbacks table. This is the early
+    check at intake; the cap itself is enforced atomically when a call or
+    SMS is placed (reserve_daily_usage).
+
+    Args:
+        usage (tuple): (calls, sms) already read for today (optional)
 
     Returns:
         tuple: (within_limits: bool, message: str, stats: dict)
     """
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
-        cursor = conn.cursor()
-
-        # Calculate cutoff time (24 hours ago)
-        cutoff_time = datetime.utcnow() - timedelta(hours=24)
-
-        # Count calls in last 24 hours
-        cursor.execute("""
-            SELECT COUNT(*)
-            FROM callbacks
-            WHERE created_at > ?
-            AND request_status IN ('calling', 'connected', 'completed')
-        """, (cutoff_time.isoformat(),))
-
-        calls_24h = cursor.fetchone()[0]
-
-        # Count SMS in last 24 hours (approximate - based on status)
-        cursor.execute("""
-            SELECT COUNT(*)
-            FROM callbacks
-            WHERE created_at > ?
-            AND sms_sid IS NOT NULL
-        """, (cutoff_time.isoformat(),))
+        if usage is None:
+            with get_db_connection() as conn:
+                usage = conn.execute(
+                    "SELECT calls, sms FROM daily_usage WHERE day = ?",
+                    (utc_now().date().isoformat(),)
+                ).fetchone()
 
-        sms_24h = cursor.fetchone()[0]
-
-        conn.close()
+        # Keys kept for existing consumers; values are today's (UTC) counts
+        calls_24h, sms_24h = usage if usage else (0, 0)
 
         stats = {
             'calls_24h': calls_24h,
@@ -1199,23 +1973,106 @@ def check_daily_limits():
         return True, "", {}
 
 
-def is_business_hours():
-    """
-    Check if current time is within business hours.
+# Today's usage and a fingerprint's 24h request count in one statement
+REQUEST_LIMITS_SQL = """
+    SELECT
+        (SELECT calls FROM daily_usage WHERE day = ?),
+        (SELECT sms FROM daily_usage WHERE day = ?),
+        (SELECT COUNT(*) FROM callbacks WHERE fingerprint = ? AND created_at_ts > ?)
+"""
+
+
+def check_request_limits(fingerprint, max_requests_per_day=20):
+    """
+    Run check_daily_limits() and check_fingerprint_abuse() together.
+
+    Both read from one query; when the fingerprint count is cached only
+    today's usage is read.
 
     Returns:
-        tuple: (is_open: bool, message: str) where message explains the status
+        tuple: (check_daily_limits result, check_fingerprint_abuse result)
     """
+    if cached_fingerprint_count(fingerprint) is not None:
+        return check_daily_limits(), check_fingerprint_abuse(fingerprint, max_requests_per_day)
+
     try:
-        tz = pytz.timezone(BUSINESS_TIMEZONE)
-        now = datetime.now(tz)
-        current_time = now.time()
+        today = utc_now().date().isoformat()
+        with get_db_read_connection() as conn:
+            calls, sms, count = conn.execute(
+                REQUEST_LIMITS_SQL, (today, today, fingerprint, fingerprint_window_start())
+            ).fetchone()
+    except Exception as e:
+        logger.error(f"Error reading request limits: {str(e)}")
+        return check_daily_limits(), check_fingerprint_abuse(fingerprint, max_requests_per_day)
+
+    return (
+        check_daily_limits(usage=(calls or 0, sms or 0)),
+        check_fingerprint_abuse(fingerprint, max_requests_per_day, count=count)
+    )
 
-        # Parse business hours
+
+# Business hours result is reused this long to collapse request bursts
+BUSINESS_HOURS_CACHE_SECONDS = 30
+
+
+def _parse_business_hours():
+    """
+    Resolve the business-hours settings once.
+
+    Uses stdlib zoneinfo: datetime.now(ZoneInfo) is cheaper than going
+    through pytz and needs no localize()/normalize() handling.
+
+    Returns:
+        tuple: (tz, start_time, end_time), or None when the settings are
+        invalid (is_business_hours then fails open)
+    """
+    try:
         start_hour, start_min = map(int, BUSINESS_HOURS_START.split(':'))
         end_hour, end_min = map(int, BUSINESS_HOURS_END.split(':'))
-        start_time = dt_time(start_hour, start_min)
-        end_time = dt_time(end_hour, end_min)
+        return (
+            ZoneInfo(BUSINESS_TIMEZONE),
+            dt_time(start_hour, start_min),
+            dt_time(end_hour, end_min),
+        )
+    except Exception as e:
+        logger.error(f"Invalid business hours configuration: {str(e)}")
+        return None
+
+
+_business_hours = _parse_business_hours()
+_business_hours_cache = (0.0, None)  # (expires_at monotonic, result)
+
+
+def is_business_hours():
+    """
+    Check if current time is within business hours.
+
+    Returns:
+        tuple: (is_open: bool, message: str) where message explains the status
+    """
+    global _business_hours_cache
+
+    now_monotonic = time.monotonic()
+    expires_at, cached = _business_hours_cache
+    if cached is not None and now_monotonic < expires_at:
+        return cached
+
+    result = _check_business_hours()
+    _business_hours_cache = (now_monotonic + BUSINESS_HOURS_CACHE_SECONDS, result)
+    return result
+
+
+def _check_business_hours():
+    """Evaluate business hours against the current time (uncached)."""
+    if _business_hours is None:
+        # Fail open - allow calls if business hours check fails
+        return True, "Business hours check unavailable"
+
+    tz, start_time, end_time = _business_hours
+
+    try:
+        now = datetime.now(tz)
+        current_time = now.time()
 
         # Check if weekend
         if BUSINESS_WEEKDAYS_ONLY and now.weekday() >= 5:  # Saturday=5, Sunday=6
@@ -1236,6 +2093,37 @@ def is_business_hours():
         return True, "Business hours check unavailable"
 
 
+# Already-E.164 input ("+" and 8-15 digits) skips sanitizing entirely
+E164_PATTERN = re.compile(r"^\+[1-9]\d{7,14}$")
+# Formatting characters stripped from submitted numbers, in one C-level pass
+PHONE_FORMATTING_CHARS = str.maketrans('', '', '() -.')
+# Anything else must at least look like a phone number (digits, an optional
+# leading "+", formatting characters) before phonenumbers is asked to parse it
+PHONE_SHAPE_PATTERN = re.compile(r"^\+?[0-9\s\-().]{7,20}$")
+
+
+@lru_cache(maxsize=4096)
+def _validate_e164_candidate(sanitized):
+    """
+    Parse and validate a sanitized number with phonenumbers.
+
+    Memoized on the sanitized string, so repeat submissions of the same
+    number skip the metadata-driven parse. Parse errors are returned
+    rather than raised, so unparseable input is cached too.
+
+    Returns:
+        tuple: (is_valid: bool, result: str) as for validate_phone_number
+    """
+    try:
+        parsed = phonenumbers.parse(sanitized, "US")
+    except phonenumbers.NumberParseException as e:
+        logger.warning(f"Phone number parse error: {sanitized} - {str(e)}")
+        return False, f"Invalid phone number format: {str(e)}"
+    if not phonenumbers.is_valid_number(parsed):
+        return False, "Invalid phone number"
+    return True, phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+
+
 def validate_phone_number(number):
     """
     Validate and format phone number to E.164 format.
@@ -1249,145 +2137,324 @@ def validate_phone_number(number):
     Returns:
         tuple: (is_valid: bool, result: str) where result is formatted number or error message
     """
-    try:
-        # Sanitize input: remove common formatting characters
-        sanitized = number.strip()
-        # Remove parentheses, spaces, dashes, dots
-        sanitized = sanitized.replace('(', '').replace(')', '').replace(' ', '').replace('-', '').replace('.', '')
-
-        # If number doesn't start with +, assume US and prepend +1
-        if not sanitized.startswith('+'):
-            # If it's 10 digits, it's likely a US number without country code
-            if len(sanitized) == 10 and sanitized.isdigit():
-                sanitized = '+1' + sanitized
-            # If it's 11 digits starting with 1, add the +
-            elif len(sanitized) == 11 and sanitized.startswith('1') and sanitized.isdigit():
-                sanitized = '+' + sanitized
-
-        # Parse with US as default region
-        parsed = phonenumbers.parse(sanitized, "US")
-        if not phonenumbers.is_valid_number(parsed):
-            return False, "Invalid phone number"
-        formatted = phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
-        logger.debug(f"Phone number validated: {number} -> {sanitized} -> {formatted}")
-        return True, formatted
-    except phonenumbers.NumberParseException as e:
-        logger.warning(f"Phone number parse error: {number} - {str(e)}")
-        return False, f"Invalid phone number format: {str(e)}"
+    if E164_PATTERN.match(number):
+        # Fast path: phonenumbers still checks country metadata, but
+        # the result is cached per number
+        return _validate_e164_candidate(number)
+
+    if not PHONE_SHAPE_PATTERN.match(number.strip()):
+        return False, "Invalid phone number format: expected digits with an optional leading +"
+
+    # Sanitize input: remove parentheses, spaces, dashes, dots
+    sanitized = number.strip().translate(PHONE_FORMATTING_CHARS)
+
+    # If number doesn't start with +, assume US and prepend +1
+    if not sanitized.startswith('+'):
+        # If it's 10 digits, it's likely a US number without country code
+        if len(sanitized) == 10 and sanitized.isdigit():
+            sanitized = '+1' + sanitized
+        # If it's 11 digits starting with 1, add the +
+        elif len(sanitized) == 11 and sanitized.startswith('1') and sanitized.isdigit():
+            sanitized = '+' + sanitized
+
+    # Parse with US as default region
+    is_valid, result = _validate_e164_candidate(sanitized)
+    if is_valid:
+        logger.debug(f"Phone number validated: {number} -> {sanitized} -> {result}")
+    return is_valid, result
+
+
+# Idle connections kept per thread; extra ones are really closed on release
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "4"))
+# Prepared statements kept per connection; queries use constant SQL text
+# so repeat executions reuse the compiled statement
+DB_STATEMENT_CACHE_SIZE = 256
+
+# Applied to every new connection. WAL lets readers run alongside the
+# writer and, with synchronous=NORMAL, fsyncs at checkpoints rather than
+# on every commit. journal_mode is persistent in the file; the rest are
+# per-connection settings.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+# Read-only connections cannot change journal_mode; the writer side
+# already made the file WAL
+SQLITE_READ_PRAGMAS = tuple(p for p in SQLITE_PRAGMAS if "journal_mode" not in p)
 
+_db_local = threading.local()
 
-def migrate_database():
+
+class PooledCursor(sqlite3.Cursor):
+    """Cursor that refuses to run once its PooledConnection is released."""
+
+    def execute(self, *args):
+        self.connection._check_checked_out()
+        return super().execute(*args)
+
+    def executemany(self, *args):
+        self.connection._check_checked_out()
+        return super().executemany(*args)
+
+
+class PooledConnection(sqlite3.Connection):
     """
-    Migrate existing database to add new security columns.
+    SQLite connection whose close() returns it to the calling thread's pool.
+
+    Write transactions start with BEGIN IMMEDIATE, so a writer waits for
+    the lock (busy_timeout) up front instead of failing to upgrade a read
+    transaction halfway through.
 
-    Adds ip_address, user_agent, and fingerprint columns if they don't exist.
+    Callers keep the plain connect/commit/close pattern. On release any
+    uncommitted transaction is rolled back and row_factory is reset, so the
+    next caller gets a clean handle without reopening the database file
+    (and its -wal/-shm sidecars). Used as a context manager it commits (or
+    rolls back on error) and then releases itself.
+
+    A released handle refuses further use (ProgrammingError), like a closed
+    sqlite3 connection, so a query after close() fails loudly instead of
+    running on a connection that is back in the idle pool.
     """
-    try:
-        conn = sqlite3.connect(DATABASE_PATH)
-        cursor = conn.cursor()
 
-        # Check if migration is needed
-        cursor.execute("PRAGMA table_info(callbacks)")
-        columns = [row[1] for row in cursor.fetchall()]
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._checked_out = True
 
-        needs_migration = False
+    def _check_checked_out(self):
+        if not self._checked_out:
+            raise sqlite3.ProgrammingError("Cannot operate on a released pooled connection.")
 
-        # Add ip_address column if missing
-        if 'ip_address' not in columns:
-            logger.info("Adding ip_address column to callbacks table")
-            cursor.execute("ALTER TABLE callbacks ADD COLUMN ip_address TEXT")
-            needs_migration = True
+    def cursor(self, factory=PooledCursor):
+        self._check_checked_out()
+        return super().cursor(factory)
 
-        # Add user_agent column if missing
-        if 'user_agent' not in columns:
-            logger.info("Adding user_agent column to callbacks table")
-            cursor.execute("ALTER TABLE callbacks ADD COLUMN user_agent TEXT")
-            needs_migration = True
+    def execute(self, *args):
+        self._check_checked_out()
+        return super().execute(*args)
 
-        # Add fingerprint column if missing
-        if 'fingerprint' not in columns:
-            logger.info("Adding fingerprint column to callbacks table")
-            cursor.execute("ALTER TABLE callbacks ADD COLUMN fingerprint TEXT")
-            needs_migration = True
+    def executemany(self, *args):
+        self._check_checked_out()
+        return super().executemany(*args)
 
-        # Add retry columns if missing
-        if 'retry_count' not in columns:
-            logger.info("Adding retry_count column to callbacks table")
-            cursor.execute("ALTER TABLE callbacks ADD COLUMN retry_count INTEGER DEFAULT 0")
-            needs_migration = True
+    def executescript(self, script):
+        self._check_checked_out()
+        return super().executescript(script)
 
-        if 'max_retries' not in columns:
-            logger.info("Adding max_retries column to callbacks table")
-            cursor.execute("ALTER TABLE callbacks ADD COLUMN max_retries INTEGER DEFAULT 3")
-            needs_migration = True
+    def commit(self):
+        self._check_checked_out()
+        return super().commit()
 
-        if 'retry_at' not in columns:
-            logger.info("Adding retry_at column to callbacks table")
-            cursor.execute("ALTER TABLE callbacks ADD COLUMN retry_at TEXT")
-            needs_migration = True
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            return super().__exit__(exc_type, exc_value, traceback)
+        finally:
+            self.close()
 
-        if 'last_retry_at' not in columns:
-            logger.info("Adding last_retry_at column to callbacks table")
-            cursor.execute("ALTER TABLE callbacks ADD COLUMN last_retry_at TEXT")
-            needs_migration = True
+    def close(self):
+        if not self._checked_out:
+            return
+        self._checked_out = False
 
-        # Add priority column if missing
-        if 'priority' not in columns:
-            logger.info("Adding priority column to callbacks table")
-            cursor.execute("ALTER TABLE callbacks ADD COLUMN priority TEXT DEFAULT 'default'")
-            needs_migration = True
+        if self.in_transaction:
+            self.rollback()
+        self.row_factory = None
 
-        # Add escalation columns if missing
-        if 'escalation_level' not in columns:
-            logger.info("Adding escalation_level column to callbacks table")
-            cursor.execute("ALTER TABLE callbacks ADD COLUMN escalation_level INTEGER DEFAULT 0")
-            needs_migration = True
+        idle = self._idle
+        if self._path == DATABASE_PATH and len(idle) < DB_POOL_SIZE:
+            idle.append(self)
+        else:
+            super().close()
 
-        if 'escalation_at' not in columns:
-            logger.info("Adding escalation_at column to callbacks table")
-            cursor.execute("ALTER TABLE callbacks ADD COLUMN escalation_at TEXT")
-            needs_migration = True
 
-        if 'escalated_to' not in columns:
-            logger.info("Adding escalated_to column to callbacks table")
-            cursor.execute("ALTER TABLE callbacks ADD COLUMN escalated_to TEXT")
-            needs_migration = True
+def configure_connection(conn, pragmas=SQLITE_PRAGMAS):
+    """Apply SQLITE_PRAGMAS (or the given pragmas) to a freshly opened connection."""
+    for pragma in pragmas:
+        conn.execute(pragma)
 
-        if needs_migration:
-            # Create indexes for new columns
-            try:
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_callbacks_fingerprint
-                    ON callbacks(fingerprint)
-                """)
-                logger.info("Created fingerprint index")
-            except Exception as e:
-                logger.warning(f"Could not create fingerprint index: {e}")
 
-            # Create index on retry_at for efficient retry job queries
-            try:
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_callbacks_retry_at
-                    ON callbacks(retry_at)
-                """)
-                logger.info("Created retry_at index")
-            except Exception as e:
-                logger.warning(f"Could not create retry_at index: {e}")
+def _open_pooled_connection(readonly):
+    """Open a PooledConnection on DATABASE_PATH, read-write or read-only."""
+    if readonly:
+        conn = sqlite3.connect(
+            pathlib.Path(DATABASE_PATH).absolute().as_uri() + "?mode=ro",
+            uri=True,
+            factory=PooledConnection,
+            cached_statements=DB_STATEMENT_CACHE_SIZE
+        )
+        configure_connection(conn, SQLITE_READ_PRAGMAS)
+    else:
+        conn = sqlite3.connect(
+            DATABASE_PATH,
+            factory=PooledConnection,
+            cached_statements=DB_STATEMENT_CACHE_SIZE,
+            isolation_level="IMMEDIATE"
+        )
+        configure_connection(conn)
+    return conn
+
+
+def _checkout_connection(pool, readonly=False):
+    """Take an idle connection from this thread's named pool, or open one."""
+    idle = getattr(_db_local, pool, None)
+    if idle is None:
+        idle = []
+        setattr(_db_local, pool, idle)
+
+    while idle:
+        conn = idle.pop()
+        if conn._path == DATABASE_PATH:
+            break
+        sqlite3.Connection.close(conn)
+    else:
+        conn = _open_pooled_connection(readonly)
+        conn._idle = idle
+        conn._path = DATABASE_PATH
+
+    conn._checked_out = True
+    return conn
+
+
+def get_db_connection():
+    """
+    Check out a SQLite connection from the per-thread pool.
+
+    Connections are thread-local (sqlite3 objects are bound to their
+    creating thread) and a nested caller on the same thread gets its own
+    connection, so transactions never interleave. Release with close(), or
+    use ``with get_db_connection() as conn:`` to commit and release.
+    """
+    return _checkout_connection("idle")
+
+
+def get_db_read_connection():
+    """
+    Check out a read-only SQLite connection from the per-thread reader pool.
+
+    For hot lookups that never write: the database is opened with
+    mode=ro, so a stray write fails instead of taking the write lock.
+    Released the same way as get_db_connection().
+    """
+    return _checkout_connection("read_idle", readonly=True)
+
+
+# Columns added to callbacks after the first release. New installs get
+# them from init_database(); existing databases are migrated.
+CALLBACK_MIGRATION_COLUMNS = (
+    ("ip_address", "TEXT"),
+    ("user_agent", "TEXT"),
+    ("fingerprint", "TEXT"),
+    ("retry_count", "INTEGER DEFAULT 0"),
+    ("max_retries", "INTEGER DEFAULT 3"),
+    ("retry_at", "TEXT"),
+    ("last_retry_at", "TEXT"),
+    ("priority", "TEXT DEFAULT 'default'"),
+    ("escalation_level", "INTEGER DEFAULT 0"),
+    ("escalation_at", "TEXT"),
+    ("escalated_to", "TEXT"),
+    # Epoch-microsecond copy of created_at for integer window cutoffs
+    ("created_at_ts", "INTEGER"),
+)
 
-            # Create index on priority and retry_at for efficient queue processing
+
+def migrate_database():
+    """
+    Migrate existing database to the current callbacks schema.
+
+    All missing columns are added in one transaction, so an upgrade
+    commits once however many columns it adds. Indexes, triggers and
+    data fixes follow after that commit.
+    """
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        # Check if migration is needed
+        cursor.execute("PRAGMA table_info(callbacks)")
+        columns = {row[1] for row in cursor.fetchall()}
+        missing = [(name, ddl) for name, ddl in CALLBACK_MIGRATION_COLUMNS if name not in columns]
+
+        needs_migration = bool(missing)
+
+        if missing:
+            cursor.execute("BEGIN")
             try:
-                cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_callbacks_priority_retry
-                    ON callbacks(priority, retry_at, request_status)
-                """)
-                logger.info("Created priority_retry index")
-            except Exception as e:
-                logger.warning(f"Could not create priority_retry index: {e}")
-                logger.info("Created retry_at index")
-            except Exception as e:
-                logger.warning(f"Could not create retry_at index: {e}")
+                for name, ddl in missing:
+                    logger.info(f"Adding {name} column to callbacks table")
+                    cursor.execute(f"ALTER TABLE callbacks ADD COLUMN {name} {ddl}")
+
+                if 'created_at_ts' not in columns:
+                    cursor.execute(f"""
+                        UPDATE callbacks
+                        SET created_at_ts = {CREATED_AT_TS_SQL.format(column='created_at')}
+                        WHERE created_at_ts IS NULL
+                    """)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        # Rows inserted without created_at_ts (older writers, manual inserts)
+        # are filled from created_at so window checks never miss them
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_callbacks_created_at_ts
+            AFTER INSERT ON callbacks
+            WHEN NEW.created_at_ts IS NULL
+            BEGIN
+                UPDATE callbacks
+                SET created_at_ts = {CREATED_AT_TS_SQL.format(column='NEW.created_at')}
+                WHERE request_id = NEW.request_id;
+            END
+        """)
 
+        # Duplicate detection: newest active request for a phone within a
+        # window is an index range scan with no sort. Fingerprint counts are
+        # answered from the index alone. Both supersede older indexes.
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_callbacks_phone_created_ts_status
+            ON callbacks(visitor_phone, created_at_ts DESC, request_status)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_callbacks_fingerprint_created_ts
+            ON callbacks(fingerprint, created_at_ts)
+        """)
+        cursor.execute("DROP INDEX IF EXISTS idx_callbacks_phone_created_status")
+        cursor.execute("DROP INDEX IF EXISTS idx_callbacks_fingerprint")
+
+        # Retry queue: due retries, highest priority first
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_callbacks_retry_at
+            ON callbacks(retry_at)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_callbacks_priority_retry
+            ON callbacks(priority, retry_at, request_status)
+        """)
+
+        # Rows fingerprinted with the old 64-character SHA256 digest would
+        # never match new requests; recompute them so abuse counts carry over
+        legacy = cursor.execute("""
+            SELECT request_id, ip_address, user_agent, visitor_phone
+            FROM callbacks
+            WHERE length(fingerprint) = 64
+            AND user_agent IS NOT NULL
+        """).fetchall()
+        if legacy:
+            fingerprints = generate_request_fingerprints_bulk(
+                [(ip_address, user_agent, phone) for _, ip_address, user_agent, phone in legacy]
+            )
+            cursor.executemany(
+                "UPDATE callbacks SET fingerprint = ? WHERE request_id = ?",
+                zip(fingerprints, (row[0] for row in legacy))
+            )
             conn.commit()
+            logger.info(f"Recomputed {len(legacy)} legacy request fingerprint(s)")
+            needs_migration = True
+
+        if needs_migration:
             logger.info("Database migration completed successfully")
         else:
             logger.info("Database schema is up to date")
@@ -1403,7 +2470,7 @@ def init_database():
     """Initialize SQLite database with proper schema per Rule 11."""
     logger.info(f"Initializing database at {DATABASE_PATH}")
 
-    conn = sqlite3.connect(DATABASE_PATH)
+    conn = get_db_connection()
     cursor = conn.cursor()
     
     # Create callbacks table - avoid SQL reserved keywords per Rule 11
@@ -1418,6 +2485,7 @@ def init_database():
             status_message TEXT,
             created_at TEXT NOT NULL,
             updated_at TEXT NOT NULL,
+            created_at_ts INTEGER,
             call_sid TEXT,
             sms_sid TEXT,
             ip_address TEXT,
@@ -1434,12 +2502,8 @@ def init_database():
         )
     """)
 
-    # Create index on phone number for duplicate detection
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_callbacks_phone
-        ON callbacks(visitor_phone)
-    """)
-    
+    cursor.execute("DROP INDEX IF EXISTS idx_callbacks_phone")
+
     # Create audit log table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS audit_log (
@@ -1473,6 +2537,57 @@ def init_database():
         ON verification_codes(request_id)
     """)
 
+    # Per-day call/SMS counters for the daily cost limits
+    daily_usage_exists = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'daily_usage'"
+    ).fetchone()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS daily_usage (
+            day TEXT PRIMARY KEY,
+            calls INTEGER NOT NULL DEFAULT 0,
+            sms INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    if not daily_usage_exists:
+        # Upgrading mid-day: seed today's row from callbacks so calls and
+        # SMS already placed today still count against the limits
+        today = utc_now().date().isoformat()
+        cursor.execute("""
+            INSERT INTO daily_usage (day, calls, sms)
+            SELECT ?,
+                (SELECT COUNT(*) FROM callbacks
+                 WHERE created_at >= ? AND request_status IN ('calling', 'connected', 'completed')),
+                (SELECT COUNT(*) FROM callbacks
+                 WHERE created_at >= ? AND sms_sid IS NOT NULL)
+        """, (today, today, today))
+
+    # Status-filtered scans (concurrency counts, retry queue, stuck-call
+    # cleanup) and date-windowed stats/cleanup on callbacks
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_callbacks_status_updated
+        ON callbacks(request_status, updated_at)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_callbacks_created_at
+        ON callbacks(created_at)
+    """)
+
+    # Audit trail lookups per request and retention cleanup by age
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_audit_log_request_id
+        ON audit_log(request_id)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_audit_log_timestamp
+        ON audit_log(timestamp)
+    """)
+
+    conn.commit()
+
+    # Refresh planner statistics so the composite indexes are chosen;
+    # analysis_limit keeps this cheap on large tables
+    cursor.execute("PRAGMA analysis_limit=400")
+    cursor.execute("ANALYZE")
     conn.commit()
     conn.close()
 
@@ -1547,7 +2662,7 @@ def send_sms_verification(request_id, phone, visitor_name):
             logger.info(f"SMS concurrency handling: {concurrency_message}")
 
         # Check if code already exists and is still valid
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -1559,7 +2674,7 @@ def send_sms_verification(request_id, phone, visitor_name):
         """, (request_id,))
 
         row = cursor.fetchone()
-        now = datetime.utcnow()
+        now = utc_now()
 
         # Reuse existing code if still valid (within 10 minutes)
         if row:
@@ -1567,7 +2682,6 @@ def send_sms_verification(request_id, phone, visitor_name):
             expires_at = datetime.fromisoformat(expires_at_str)
             if now < expires_at:
                 logger.info(f"Reusing existing SMS verification code for {request_id}")
-                conn.close()
                 # Still send the SMS again
                 code = existing_code
             else:
@@ -1597,16 +2711,17 @@ def send_sms_verification(request_id, phone, visitor_name):
 
         # Wrap Twilio API call with exponential backoff retry
         try:
-            sms = retry_with_exponential_backoff(
-                lambda: twilio_client.messages.create(
-                    to=phone,
-                    from_=TWILIO_NUMBER,
-                    body=message
-                ),
-                max_retries=3,
-                base_delay=1,
-                max_delay=5
-            )
+            with concurrency_gate(_SMS_SEM, "sms"):
+                sms = retry_with_exponential_backoff(
+                    lambda: twilio_client.messages.create(
+                        to=phone,
+                        from_=TWILIO_NUMBER,
+                        body=message
+                    ),
+                    max_retries=3,
+                    base_delay=1,
+                    max_delay=5
+                )
         except Exception as retry_error:
             # All retries exhausted - return error
             logger.error(f"Failed to send SMS after retries: {str(retry_error)}")
@@ -1637,7 +2752,7 @@ def verify_code(request_id, channel, code):
         tuple: (success: bool, error: str or None)
     """
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
         # Get the most recent unverified code for this request and channel
@@ -1657,7 +2772,7 @@ def verify_code(request_id, channel, code):
 
         code_id, stored_code, expires_at_str, attempts = row
         expires_at = datetime.fromisoformat(expires_at_str)
-        now = datetime.utcnow()
+        now = utc_now()
 
         # Check if code expired
         if now > expires_at:
@@ -1716,7 +2831,7 @@ def check_verification_status(request_id):
         tuple: (verified: bool, channel: str or None)
     """
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -1738,30 +2853,104 @@ def check_verification_status(request_id):
         return False, None
 
 
-def log_audit_event(request_id, event_type, event_data=None):
-    """Log audit events to database."""
-    try:
-        conn = sqlite3.connect(DATABASE_PATH)
-        cursor = conn.cursor()
+# Audit rows are written behind the request by one writer thread, in
+# batches of up to AUDIT_BATCH_SIZE rows per transaction
+AUDIT_BATCH_SIZE = 256
+AUDIT_FLUSH_INTERVAL_SECONDS = 0.2
 
-        cursor.execute("""
-            INSERT INTO audit_log (request_id, event_type, event_data, timestamp)
-            VALUES (?, ?, ?, ?)
-        """, (
-            request_id,
-            event_type,
-            json.dumps(event_data) if event_data else None,
-            datetime.utcnow().isoformat()
-        ))
+_audit_queue = queue.Queue()
+_audit_write_lock = threading.Lock()
 
-        conn.commit()
-        conn.close()
 
-        logger.debug(f"Audit event logged: {event_type} for request {request_id}")
+AUDIT_INSERT_SQL = """
+    INSERT INTO audit_log (request_id, event_type, event_data, timestamp)
+    VALUES (?, ?, ?, ?)
+"""
+
+
+def audit_row(request_id, event_type, event_data=None, timestamp=None):
+    """Build an audit_log row tuple for AUDIT_INSERT_SQL.
+
+    timestamp lets callers reuse the ISO time they already computed.
+    """
+    return (
+        request_id,
+        event_type,
+        orjson.dumps(event_data, option=orjson.OPT_NON_STR_KEYS).decode() if event_data else None,
+        timestamp or utc_now().isoformat()
+    )
+
+
+def log_audit_event(request_id, event_type, event_data=None, timestamp=None):
+    """
+    Queue an audit event for the background audit writer.
+
+    Only the timestamp is taken here; event_data is JSON-encoded by the
+    writer thread, so callers must not mutate it after the call.
+    """
+    try:
+        _audit_queue.put((request_id, event_type, event_data, timestamp or utc_now().isoformat()))
+
+        logger.debug(f"Audit event queued: {event_type} for request {request_id}")
     except Exception as e:
         logger.error(f"Failed to log audit event: {str(e)}")
 
 
+def _write_audit_rows(rows):
+    """Encode and insert a batch of queued audit events in a single transaction."""
+    try:
+        with get_db_connection() as conn:
+            conn.executemany(AUDIT_INSERT_SQL, [audit_row(*row) for row in rows])
+    except Exception as e:
+        logger.error(f"Failed to write {len(rows)} audit event(s): {str(e)}")
+
+
+def _drain_audit_queue(rows, deadline=None):
+    """Move queued rows into rows until the batch is full (or the deadline passes)."""
+    while len(rows) < AUDIT_BATCH_SIZE:
+        try:
+            if deadline is None:
+                rows.append(_audit_queue.get_nowait())
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                rows.append(_audit_queue.get(timeout=remaining))
+        except queue.Empty:
+            break
+    return rows
+
+
+def audit_writer_worker():
+    """Background writer: block for the first row, then batch for up to 200 ms."""
+    while True:
+        first = _audit_queue.get()
+        with _audit_write_lock:
+            rows = _drain_audit_queue([first], time.monotonic() + AUDIT_FLUSH_INTERVAL_SECONDS)
+            _write_audit_rows(rows)
+        for _ in rows:
+            _audit_queue.task_done()
+
+
+def flush_audit_log():
+    """Write every queued audit event now (used at exit and by tests)."""
+    with _audit_write_lock:
+        while True:
+            rows = _drain_audit_queue([])
+            if not rows:
+                break
+            _write_audit_rows(rows)
+            for _ in rows:
+                _audit_queue.task_done()
+
+    # Wait for a batch the writer thread already took off the queue
+    _audit_queue.join()
+
+
+threading.Thread(target=audit_writer_worker, name="audit-writer", daemon=True).start()
+atexit.register(flush_audit_log)
+
+
 def determine_priority(visitor_phone, visitor_email=None):
     """
     Determine callback priority based on visitor information.
@@ -1778,12 +2967,8 @@ def determine_priority(visitor_phone, visitor_email=None):
     Returns:
         str: Priority level ('high', 'default', or 'low')
     """
-    # VIP phone numbers (could be loaded from env var or database)
-    vip_phones = os.environ.get("VIP_PHONE_NUMBERS", "").split(",")
-    vip_phones = [p.strip() for p in vip_phones if p.strip()]
-
     # Check if visitor is VIP
-    if visitor_phone in vip_phones:
+    if visitor_phone in VIP_PHONE_NUMBERS:
         logger.info(f"VIP customer detected: {visitor_phone}")
         return PRIORITY_HIGH
 
@@ -1793,17 +2978,12 @@ def determine_priority(visitor_phone, visitor_email=None):
 
 def get_escalation_chain():
     """
-    Parse escalation chain from environment variable.
+    Escalation chain parsed from the ESCALATION_CHAIN environment variable.
 
     Returns:
-        list: List of backup phone numbers in escalation order
+        tuple: Backup phone numbers in escalation order
     """
-    if not ESCALATION_CHAIN:
-        return []
-
-    chain = [num.strip() for num in ESCALATION_CHAIN.split(",") if num.strip()]
-    logger.debug(f"Escalation chain configured with {len(chain)} backup number(s)")
-    return chain
+    return ESCALATION_CHAIN
 
 
 def get_escalation_target(escalation_level):
@@ -1845,7 +3025,7 @@ def should_escalate(request_id):
         return False, 0, None
 
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -1870,7 +3050,7 @@ def should_escalate(request_id):
         reference_time = escalation_at if escalation_at else created_at
         reference_dt = datetime.fromisoformat(reference_time)
         timeout_dt = reference_dt + timedelta(minutes=ESCALATION_TIMEOUT_MINUTES)
-        now = datetime.utcnow()
+        now = utc_now()
 
         if now < timeout_dt:
             # Not yet time to escalate
@@ -1915,7 +3095,7 @@ def escalate_request(request_id, new_level, target_number):
         logger.info(f"Escalating request {request_id} to level {new_level} (calling {target_number})")
 
         # Update escalation tracking in database
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -1927,17 +3107,18 @@ def escalate_request(request_id, new_level, target_number):
             WHERE request_id = ?
         """, (
             new_level,
-            datetime.utcnow().isoformat(),
+            utc_now().isoformat(),
             target_number,
-            datetime.utcnow().isoformat(),
+            utc_now().isoformat(),
             request_id
         ))
 
         conn.commit()
         conn.close()
+        forget_status(request_id)
 
         # Get visitor info for the call
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         cursor.execute("""
             SELECT visitor_name, visitor_phone
@@ -1955,12 +3136,7 @@ def escalate_request(request_id, new_level, target_number):
         # Initiate call to escalation target
         if callback_provider and callback_provider.is_configured():
             # Determine from_number based on provider
-            if isinstance(callback_provider, TwilioProvider):
-                from_number = TWILIO_NUMBER
-            elif isinstance(callback_provider, AsteriskProvider):
-                from_number = visitor_phone
-            else:
-                from_number = target_number
+            from_number = visitor_phone if _PROVIDER_ASTERISK_USES_VISITOR else _PROVIDER_FROM_NUMBER
 
             call_result = callback_provider.make_call(
                 to_number=target_number,
@@ -1995,30 +3171,121 @@ def escalate_request(request_id, new_level, target_number):
         return {"success": False, "error": str(e)}
 
 
+# In-memory view of each request's (status, message, updated_at), kept
+# alongside the database so /status polls and streams rarely touch SQLite.
+# Writers call publish_status() after committing; writes that touch many
+# rows at once call forget_status() and readers fall back to the database.
+STATUS_CACHE_MAX_ENTRIES = 4096
+STATUS_STREAM_MAX_SECONDS = int(os.environ.get("STATUS_STREAM_MAX_SECONDS", "60"))
+STATUS_STREAM_HEARTBEAT_SECONDS = 15
+# Each open stream holds a server thread; beyond this clients keep polling
+STATUS_STREAM_MAX_CLIENTS = int(os.environ.get("STATUS_STREAM_MAX_CLIENTS", "8"))
+# Statuses after which a stream has nothing more to report
+FINAL_STATUSES = frozenset({"completed", "failed", "sms_sent", "cancelled", "dead_letter"})
+
+_status_cache = OrderedDict()
+_status_changed = threading.Condition()
+# Bumped on every write so a reader never caches a row older than a publish
+_status_generation = 0
+status_stream_slots = threading.BoundedSemaphore(STATUS_STREAM_MAX_CLIENTS)
+
+
+def _store_status(request_id, entry):
+    """Insert into the status cache, evicting the oldest entries. Caller holds _status_changed."""
+    _status_cache[request_id] = entry
+    _status_cache.move_to_end(request_id)
+    while len(_status_cache) > STATUS_CACHE_MAX_ENTRIES:
+        _status_cache.popitem(last=False)
+
+
+def publish_status(request_id, status, message, updated_at):
+    """Record a committed status change and wake any streams waiting on it."""
+    global _status_generation
+    with _status_changed:
+        _status_generation += 1
+        _store_status(request_id, (status, message, updated_at))
+        _status_changed.notify_all()
+
+
+def forget_status(request_id=None):
+    """Drop one cached status, or all of them, after a write that bypassed publish_status()."""
+    global _status_generation
+    with _status_changed:
+        _status_generation += 1
+        if request_id is None:
+            _status_cache.clear()
+        else:
+            _status_cache.pop(request_id, None)
+
+
+STATUS_SELECT_SQL = """
+    SELECT request_status, status_message, updated_at
+    FROM callbacks
+    WHERE request_id = ?
+"""
+
+
+def lookup_status(request_id):
+    """
+    Get a request's current status, from the cache or else the database.
+
+    Returns:
+        tuple: (status, message, updated_at), or None if the request is unknown
+    """
+    with _status_changed:
+        entry = _status_cache.get(request_id)
+        generation = _status_generation
+    if entry is not None:
+        return entry
+
+    conn = get_db_read_connection()
+    try:
+        row = conn.execute(STATUS_SELECT_SQL, (request_id,)).fetchone()
+    finally:
+        conn.close()
+
+    if row is None:
+        return None
+    entry = tuple(row)
+    with _status_changed:
+        # Skip caching if a write landed while we were reading
+        if generation == _status_generation:
+            _store_status(request_id, entry)
+    return entry
+
+
+def wait_for_status_change(request_id, last, timeout):
+    """Block until the cached status differs from last. Returns False on timeout."""
+    with _status_changed:
+        return _status_changed.wait_for(
+            lambda: _status_cache.get(request_id, last) != last, timeout
+        )
+
+
 def update_callback_status(request_id, status, message=None, call_sid=None, sms_sid=None):
     """Update callback status in database."""
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
-        cursor = conn.cursor()
+        now_iso = utc_now().isoformat()
 
-        cursor.execute("""
-            UPDATE callbacks
-            SET request_status = ?, status_message = ?, updated_at = ?, call_sid = ?, sms_sid = ?
-            WHERE request_id = ?
-        """, (
-            status,
-            message,
-            datetime.utcnow().isoformat(),
-            call_sid,
-            sms_sid,
-            request_id
-        ))
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE callbacks
+                SET request_status = ?, status_message = ?, updated_at = ?, call_sid = ?, sms_sid = ?
+                WHERE request_id = ?
+            """, (
+                status,
+                message,
+                now_iso,
+                call_sid,
+                sms_sid,
+                request_id
+            ))
 
-        conn.commit()
-        conn.close()
+        publish_status(request_id, status, message, now_iso)
 
         logger.info(f"Callback status updated: {request_id} -> {status}")
-        log_audit_event(request_id, "status_update", {"status": status, "message": message})
+        log_audit_event(request_id, "status_update", {"status": status, "message": message}, now_iso)
     except Exception as e:
         logger.error(f"Failed to update callback status: {str(e)}")
 
@@ -2051,9 +3318,12 @@ def schedule_retry(request_id, retry_count):
     """
     try:
         delay_seconds = calculate_retry_delay(retry_count)
-        retry_at = datetime.utcnow() + timedelta(seconds=delay_seconds)
+        now = utc_now()
+        retry_at = now + timedelta(seconds=delay_seconds)
+        now_iso = now.isoformat()
+        status_message = f"Retry {retry_count} scheduled in {delay_seconds}s"
 
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -2068,14 +3338,15 @@ def schedule_retry(request_id, retry_count):
         """, (
             retry_count,
             retry_at.isoformat(),
-            datetime.utcnow().isoformat(),
-            f"Retry {retry_count} scheduled in {delay_seconds}s",
-            datetime.utcnow().isoformat(),
+            now_iso,
+            status_message,
+            now_iso,
             request_id
         ))
 
         conn.commit()
         conn.close()
+        publish_status(request_id, 'retry_scheduled', status_message, now_iso)
 
         logger.info(f"Retry scheduled for {request_id}: attempt {retry_count} at {retry_at.isoformat()} (delay: {delay_seconds}s)")
         log_audit_event(request_id, "retry_scheduled", {
@@ -2097,7 +3368,8 @@ def mark_as_dead_letter(request_id, reason):
     This happens when max retries are exhausted.
     """
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
+        now_iso = utc_now().isoformat()
+        conn = get_db_connection()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -2108,12 +3380,13 @@ def mark_as_dead_letter(request_id, reason):
             WHERE request_id = ?
         """, (
             reason,
-            datetime.utcnow().isoformat(),
+            now_iso,
             request_id
         ))
 
         conn.commit()
         conn.close()
+        publish_status(request_id, 'dead_letter', reason, now_iso)
 
         logger.warning(f"Request {request_id} moved to dead letter queue: {reason}")
         log_audit_event(request_id, "dead_letter", {"reason": reason})
@@ -2138,11 +3411,11 @@ def process_retry_queue():
     This function should be called periodically (e.g., every minute) by a background job.
     """
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
         # Find requests that are due for retry, ordered by priority then time
-        now = datetime.utcnow().isoformat()
+        now = utc_now().isoformat()
         cursor.execute("""
             SELECT request_id, visitor_name, visitor_email, visitor_phone, retry_count, max_retries, priority
             FROM callbacks
@@ -2193,16 +3466,33 @@ except Exception as e:
     logger.error(f"Migration failed, but continuing: {e}")
 
 
+# Provider fields are fixed once the module has loaded. The response body
+# is rendered at most once per HEALTH_CACHE_SECONDS however often
+# liveness probes arrive.
+HEALTH_CACHE_SECONDS = 1.0
+HEALTH_STATIC_FIELDS = {
+    "status": "healthy",
+    "provider": callback_provider.__class__.__name__ if callback_provider else "None",
+    "provider_configured": callback_provider.is_configured() if callback_provider else False,
+    "twilio_configured": twilio_client is not None  # Legacy compatibility
+}
+_health_body = (0.0, b"")  # (expires_at monotonic, serialized JSON)
+
+
 @app.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint."""
-    return jsonify({
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "provider": callback_provider.__class__.__name__ if callback_provider else "None",
-        "provider_configured": callback_provider.is_configured() if callback_provider else False,
-        "twilio_configured": twilio_client is not None  # Legacy compatibility
-    })
+    global _health_body
+
+    now = time.monotonic()
+    expires_at, body = _health_body
+    if now >= expires_at:
+        # Same serialization as jsonify: sorted keys, compact, trailing newline
+        payload = dict(HEALTH_STATIC_FIELDS, timestamp=utc_now().isoformat())
+        body = (json.dumps(payload, sort_keys=True, separators=(",", ":")) + "\n").encode()
+        _health_body = (now + HEALTH_CACHE_SECONDS, body)
+
+    return Response(body, mimetype="application/json")
 
 
 @app.route("/stats", methods=["GET"])
@@ -2212,24 +3502,18 @@ def public_stats():
     Returns basic stats about the system.
     """
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
-        cursor = conn.cursor()
-
-        # Get total requests
-        cursor.execute("SELECT COUNT(*) FROM callbacks")
-        total_requests = cursor.fetchone()[0]
-
-        # Get requests by status
-        cursor.execute("SELECT request_status, COUNT(*) FROM callbacks GROUP BY request_status")
-        by_status = {row[0]: row[1] for row in cursor.fetchall()}
-
-        conn.close()
+        # Get requests by status; the total is their sum
+        with get_db_connection() as conn:
+            by_status = dict(conn.execute(
+                "SELECT request_status, COUNT(*) FROM callbacks GROUP BY request_status"
+            ).fetchall())
+        total_requests = sum(by_status.values())
 
         return jsonify({
             "success": True,
             "total_requests": total_requests,
             "by_status": by_status,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_now().isoformat()
         })
     except Exception as e:
         logger.error(f"Error fetching public stats: {e}")
@@ -2263,7 +3547,7 @@ def worker_health_endpoint():
         "workers": health_report,
         "twilio_api": {
             "healthy": twilio_healthy,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_now().isoformat()
         }
     })
 
@@ -2300,7 +3584,7 @@ def concurrency_health_endpoint():
             "utilization_percent": round((concurrent_sms / MAX_CONCURRENT_SMS * 100) if MAX_CONCURRENT_SMS > 0 else 0, 2)
         },
         "overflow_action": CONCURRENCY_OVERFLOW_ACTION,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": utc_now().isoformat()
     })
 
 
@@ -2333,11 +3617,23 @@ def commit_mode_health_endpoint():
             else "Async mode - deferred processing"
         ),
         "transactional_integrity": COMMIT_MODE == "on_db_commit",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": utc_now().isoformat()
     })
 
 
+def scrape_address_allowed(remote_addr):
+    """True if remote_addr may scrape /metrics under ALLOWED_SCRAPE_CIDRS."""
+    if not ALLOWED_SCRAPE_CIDRS:
+        return True
+    try:
+        address = ipaddress.ip_address(remote_addr)
+    except ValueError:
+        return False
+    return any(address in network for network in ALLOWED_SCRAPE_CIDRS)
+
+
 @app.route("/metrics", methods=["GET"])
+@limiter.exempt  # Scrapes every 15s would exhaust the default per-hour limit
 def metrics():
     """
     Prometheus metrics endpoint (requires authentication).
@@ -2354,6 +3650,10 @@ def metrics():
     - verification_codes_sent_total: Total verification codes sent by channel
     - verification_attempts_total: Total verification attempts by result
     """
+    if not scrape_address_allowed(request.remote_addr):
+        logger.warning(f"Metrics scrape refused for {request.remote_addr}")
+        return jsonify({"success": False, "error": "Forbidden"}), 403
+
     # Check authentication
     is_valid, error_response = check_admin_auth()
     if not is_valid:
@@ -2361,7 +3661,7 @@ def metrics():
 
     try:
         # Update gauge metrics from database
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_read_connection()
         cursor = conn.cursor()
 
         # Reset all active gauges to 0 first
@@ -2376,7 +3676,7 @@ def metrics():
             GROUP BY request_status
         """)
         for status, count in cursor.fetchall():
-            callback_requests_active.labels(status=status).set(count)
+            safe_labels(callback_requests_active, status=status).set(count)
 
         conn.close()
     except Exception as e:
@@ -2385,6 +3685,51 @@ def metrics():
     return generate_latest(), 200, {'Content-Type': CONTENT_TYPE_LATEST}
 
 
+# The setup wizard writes .env to the project root (one level up from backend/)
+ENV_PATH = pathlib.Path(__file__).resolve().parent.parent / ".env"
+
+# .env written by the setup wizard; parsed once, filled in per save
+ENV_TEMPLATE = string.Template("""# Callback Service Environment Configuration
+# Generated by Twilio Setup Wizard on $GENERATED_AT
+
+# ============================================================
+# TWILIO CONFIGURATION
+# ============================================================
+TWILIO_SID=$TWILIO_SID
+TWILIO_AUTH_TOKEN=$TWILIO_AUTH_TOKEN
+TWILIO_NUMBER=$TWILIO_NUMBER
+
+# ============================================================
+# BUSINESS CONFIGURATION
+# ============================================================
+BUSINESS_NUMBER=$BUSINESS_NUMBER
+
+# ============================================================
+# FRONTEND CONFIGURATION
+# ============================================================
+FRONTEND_URL=$FRONTEND_URL
+ALLOWED_ORIGINS=$FRONTEND_URL
+
+# ============================================================
+# DATABASE CONFIGURATION
+# ============================================================
+DATABASE_PATH=/tmp/callbacks.db
+
+# ============================================================
+# RECAPTCHA CONFIGURATION
+# ============================================================
+RECAPTCHA_SECRET=$RECAPTCHA_SECRET
+
+# ============================================================
+# BUSINESS HOURS CONFIGURATION
+# ============================================================
+BUSINESS_HOURS_START=09:00
+BUSINESS_HOURS_END=17:00
+BUSINESS_TIMEZONE=America/New_York
+BUSINESS_WEEKDAYS_ONLY=true
+""")
+
+
 @app.route("/api/configure", methods=["POST"])
 def configure_twilio():
     """
@@ -2410,72 +3755,144 @@ def configure_twilio():
                 return jsonify(success=False, error=f"{field} must include country code (e.g., +15551234567)"), 400
 
         # Build .env content
-        env_content = f"""# Callback Service Environment Configuration
-# Generated by Twilio Setup Wizard on {datetime.utcnow().isoformat()}
+        env_content = ENV_TEMPLATE.substitute(
+            GENERATED_AT=utc_now().isoformat(),
+            TWILIO_SID=data['TWILIO_SID'],
+            TWILIO_AUTH_TOKEN=data['TWILIO_AUTH_TOKEN'],
+            TWILIO_NUMBER=data['TWILIO_NUMBER'],
+            BUSINESS_NUMBER=data['BUSINESS_NUMBER'],
+            FRONTEND_URL=data.get('FRONTEND_URL', 'http://localhost:3000'),
+            RECAPTCHA_SECRET=data.get('RECAPTCHA_SECRET', RECAPTCHA_TEST_SECRET)
+        )
 
-# ============================================================
-# TWILIO CONFIGURATION
-# ============================================================
-TWILIO_SID={data['TWILIO_SID']}
-TWILIO_AUTH_TOKEN={data['TWILIO_AUTH_TOKEN']}
-TWILIO_NUMBER={data['TWILIO_NUMBER']}
+        env_path = ENV_PATH
 
-# ============================================================
-# BUSINESS CONFIGURATION
-# ============================================================
-BUSINESS_NUMBER={data['BUSINESS_NUMBER']}
+        # Write .env file
+        env_path.write_bytes(env_content.encode("utf-8"))
 
-# ============================================================
-# FRONTEND CONFIGURATION
-# ============================================================
-FRONTEND_URL={data.get('FRONTEND_URL', 'http://localhost:3000')}
-ALLOWED_ORIGINS={data.get('FRONTEND_URL', 'http://localhost:3000')}
+        logger.info(f"Twilio configuration saved to {env_path}")
+        logger.info(f"Account SID: {data['TWILIO_SID']}")
+        logger.info(f"Twilio Number: {data['TWILIO_NUMBER']}")
+        logger.info(f"Business Number: {data['BUSINESS_NUMBER']}")
 
-# ============================================================
-# DATABASE CONFIGURATION
-# ============================================================
-DATABASE_PATH=/tmp/callbacks.db
+        return jsonify({
+            "success": True,
+            "message": "Configuration saved successfully",
+            "env_path": str(env_path),
+            "restart_required": True
+        })
 
-# ============================================================
-# RECAPTCHA CONFIGURATION
-# ============================================================
-RECAPTCHA_SECRET={data.get('RECAPTCHA_SECRET', '6LeIxAcTAAAAAGG-vFI1TnRWxMZNFuojJ4WifJWe')}
+    except Exception as e:
+        logger.error(f"Error saving configuration: {str(e)}")
+        return jsonify(success=False, error=str(e)), 500
 
-# ============================================================
-# BUSINESS HOURS CONFIGURATION
-# ============================================================
-BUSINESS_HOURS_START=09:00
-BUSINESS_HOURS_END=17:00
-BUSINESS_TIMEZONE=America/New_York
-BUSINESS_WEEKDAYS_ONLY=true
-"""
 
-        # Determine .env file path
-        # Try to write to project root (one level up from backend/)
-        import pathlib
-        backend_dir = pathlib.Path(__file__).parent
-        project_root = backend_dir.parent
-        env_path = project_root / '.env'
+# OAuth user info waiting to be picked up by the frontend, by random handle
+OAUTH_USER_HANDLE_TTL_SECONDS = 300
+OAUTH_USER_HANDLE_MAX_ENTRIES = 1024
+
+_oauth_user_handles = OrderedDict()
+_oauth_user_handles_lock = threading.Lock()
+
+
+def issue_oauth_user_handle(user_info):
+    """Store user info for OAUTH_USER_HANDLE_TTL_SECONDS and return its handle."""
+    handle = secrets.token_urlsafe(16)
+    with _oauth_user_handles_lock:
+        _oauth_user_handles[handle] = (user_info, time.monotonic() + OAUTH_USER_HANDLE_TTL_SECONDS)
+        while len(_oauth_user_handles) > OAUTH_USER_HANDLE_MAX_ENTRIES:
+            _oauth_user_handles.popitem(last=False)
+    return handle
+
+
+def lookup_oauth_user_handle(handle):
+    """Return the user info for a live handle, or None."""
+    with _oauth_user_handles_lock:
+        entry = _oauth_user_handles.get(handle)
+        if entry is None:
+            return None
+        user_info, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del _oauth_user_handles[handle]
+            return None
+        return user_info
+
+
+@app.route("/oauth/userinfo", methods=["GET"])
+@limiter.limit("30 per minute")
+def oauth_userinfo():
+    """
+    Exchange the handle from the OAuth redirect for the user's profile.
+
+    Handles expire after OAUTH_USER_HANDLE_TTL_SECONDS.
+    """
+    user_info = lookup_oauth_user_handle(request.args.get("token", ""))
+    if user_info is None:
+        return jsonify(success=False, error="Unknown or expired token"), 404
+    return jsonify(success=True, user=user_info)
+
 
-        # Write .env file
-        with open(env_path, 'w') as f:
-            f.write(env_content)
+# Everything that differs between OAuth providers; the login and callback
+# handlers below are driven entirely by this table
+OAUTH_PROVIDERS = {
+    "google": {
+        "name": "Google",
+        "client_id": GOOGLE_CLIENT_ID,
+        "client_id_setting": "GOOGLE_CLIENT_ID",
+        "client_secret": GOOGLE_CLIENT_SECRET,
+        "auth_url": "https://accounts.google.com/o/oauth2/v2/auth",
+        "auth_params": {
+            "scope": "openid email profile",
+            "access_type": "offline",
+            "prompt": "consent"
+        },
+        "token_url": "https://oauth2.googleapis.com/token",
+        # Google takes the code exchange as a form POST
+        "token_method": "post",
+        "token_params": {"grant_type": "authorization_code"},
+    },
+    "facebook": {
+        "name": "Facebook",
+        "client_id": FACEBOOK_APP_ID,
+        "client_id_setting": "FACEBOOK_APP_ID",
+        "client_secret": FACEBOOK_APP_SECRET,
+        "auth_url": "https://www.facebook.com/v18.0/dialog/oauth",
+        "auth_params": {"scope": "email public_profile"},
+        "token_url": "https://graph.facebook.com/v18.0/oauth/access_token",
+        # Facebook takes the code exchange as GET query parameters
+        "token_method": "get",
+        "token_params": {},
+    },
+}
 
-        logger.info(f"Twilio configuration saved to {env_path}")
-        logger.info(f"Account SID: {data['TWILIO_SID']}")
-        logger.info(f"Twilio Number: {data['TWILIO_NUMBER']}")
-        logger.info(f"Business Number: {data['BUSINESS_NUMBER']}")
+# OAuth redirect URIs per provider: (local development, production)
+OAUTH_REDIRECT_URIS = {
+    provider: (
+        f"http://localhost:8501/oauth/callback/{provider}",
+        f"https://api.swipswaps.com/oauth/callback/{provider}"
+    )
+    for provider in OAUTH_PROVIDERS
+}
 
-        return jsonify({
-            "success": True,
-            "message": "Configuration saved successfully",
-            "env_path": str(env_path),
-            "restart_required": True
+# Authorization URLs only vary by redirect URI, so both variants are
+# encoded once at import, in the same (local, production) order
+OAUTH_AUTH_URLS = {
+    provider: tuple(
+        config["auth_url"] + "?" + urlencode({
+            "client_id": config["client_id"],
+            "redirect_uri": redirect_uri,
+            "response_type": "code",
+            **config["auth_params"]
         })
+        for redirect_uri in OAUTH_REDIRECT_URIS[provider]
+    )
+    for provider, config in OAUTH_PROVIDERS.items()
+}
 
-    except Exception as e:
-        logger.error(f"Error saving configuration: {str(e)}")
-        return jsonify(success=False, error=str(e)), 500
+
+def _oauth_variant():
+    """Index into OAUTH_REDIRECT_URIS/OAUTH_AUTH_URLS for this request's host"""
+    return 0 if request.host.startswith("localhost") else 1
 
 
 @app.route("/oauth/login/<provider>", methods=["GET"])
@@ -2484,60 +3901,22 @@ def oauth_login(provider):
     Initiate OAuth login flow for specified provider.
     Redirects to the OAuth provider's authorization page.
     """
-    logger.info(f"🔐 OAuth login initiated for provider: {provider}")
+    logger.info("OAuth login initiated for provider: %s", provider)
     log_audit_event(None, "oauth_login_initiated", {"provider": provider})
 
-    if provider == "google":
-        if not GOOGLE_CLIENT_ID:
-            logger.error("❌ Google OAuth not configured - missing GOOGLE_CLIENT_ID")
-            return redirect(f"{FRONTEND_URL}?error=oauth_not_configured")
-
-        # Determine redirect URI based on request origin
-        if request.host.startswith("localhost"):
-            redirect_uri = "http://localhost:8501/oauth/callback/google"
-        else:
-            redirect_uri = "https://api.swipswaps.com/oauth/callback/google"
-
-        # Build Google OAuth authorization URL
-        from urllib.parse import urlencode
-        params = {
-            "client_id": GOOGLE_CLIENT_ID,
-            "redirect_uri": redirect_uri,
-            "response_type": "code",
-            "scope": "openid email profile",
-            "access_type": "offline",
-            "prompt": "consent"
-        }
-        auth_url = f"https://accounts.google.com/o/oauth2/v2/auth?{urlencode(params)}"
-        logger.info(f"✅ Redirecting to Google OAuth: {auth_url}")
-        return redirect(auth_url)
-
-    elif provider == "facebook":
-        if not FACEBOOK_APP_ID:
-            logger.error("❌ Facebook OAuth not configured - missing FACEBOOK_APP_ID")
-            return redirect(f"{FRONTEND_URL}?error=oauth_not_configured")
-
-        # Determine redirect URI based on request origin
-        if request.host.startswith("localhost"):
-            redirect_uri = "http://localhost:8501/oauth/callback/facebook"
-        else:
-            redirect_uri = "https://api.swipswaps.com/oauth/callback/facebook"
+    config = OAUTH_PROVIDERS.get(provider)
+    if config is None:
+        logger.error("Unsupported OAuth provider: %s", provider)
+        return redirect(f"{FRONTEND_URL}?error=unsupported_provider")
 
-        # Build Facebook OAuth authorization URL
-        from urllib.parse import urlencode
-        params = {
-            "client_id": FACEBOOK_APP_ID,
-            "redirect_uri": redirect_uri,
-            "response_type": "code",
-            "scope": "email public_profile"
-        }
-        auth_url = f"https://www.facebook.com/v18.0/dialog/oauth?{urlencode(params)}"
-        logger.info(f"✅ Redirecting to Facebook OAuth: {auth_url}")
-        return redirect(auth_url)
+    if not config["client_id"]:
+        logger.error("%s OAuth not configured - missing %s", config["name"], config["client_id_setting"])
+        return redirect(f"{FRONTEND_URL}?error=oauth_not_configured")
 
-    else:
-        logger.error(f"❌ Unsupported OAuth provider: {provider}")
-        return redirect(f"{FRONTEND_URL}?error=unsupported_provider")
+    # Authorization URL for the request origin
+    auth_url = OAUTH_AUTH_URLS[provider][_oauth_variant()]
+    logger.info("Redirecting to %s OAuth: %s", config["name"], auth_url)
+    return redirect(auth_url)
 
 
 @app.route("/oauth/callback/<provider>", methods=["GET"])
@@ -2546,135 +3925,76 @@ def oauth_callback(provider):
     Handle OAuth callback and fetch user information.
     Exchanges authorization code for access token and fetches user data.
     """
-    logger.info(f"🔄 OAuth callback received for provider: {provider}")
+    logger.info("OAuth callback received for provider: %s", provider)
 
     code = request.args.get("code")
     error = request.args.get("error")
 
     if error:
-        logger.error(f"❌ OAuth error from {provider}: {error}")
+        logger.error("OAuth error from %s: %s", provider, error)
         return redirect(f"{FRONTEND_URL}?error=oauth_failed")
 
     if not code:
-        logger.error(f"❌ No authorization code received in OAuth callback for {provider}")
+        logger.error("No authorization code received in OAuth callback for %s", provider)
         return redirect(f"{FRONTEND_URL}?error=oauth_failed")
 
-    if provider == "google":
-        try:
-            # Determine redirect URI (must match what was sent to Google)
-            if request.host.startswith("localhost"):
-                redirect_uri = "http://localhost:8501/oauth/callback/google"
-            else:
-                redirect_uri = "https://api.swipswaps.com/oauth/callback/google"
-
-            # Exchange authorization code for access token
-            logger.info(f"🔐 Exchanging authorization code for access token")
-            token_url = "https://oauth2.googleapis.com/token"
-            token_data = {
-                "code": code,
-                "client_id": GOOGLE_CLIENT_ID,
-                "client_secret": GOOGLE_CLIENT_SECRET,
-                "redirect_uri": redirect_uri,
-                "grant_type": "authorization_code"
-            }
-
-            token_response = requests.post(token_url, data=token_data, timeout=15)
-
-            if token_response.status_code != 200:
-                logger.error(f"❌ Token exchange failed: {token_response.status_code} - {token_response.text}")
-                return redirect(f"{FRONTEND_URL}?error=oauth_failed")
-
-            token_json = token_response.json()
-            access_token = token_json.get("access_token")
-
-            if not access_token:
-                logger.error(f"❌ No access token in response")
-                return redirect(f"{FRONTEND_URL}?error=oauth_failed")
-
-            logger.info(f"✅ Access token obtained successfully")
-
-            # Fetch user info using access token
-            user_info = get_user_info(provider, access_token)
-
-            if not user_info:
-                logger.error(f"❌ Failed to fetch user info from {provider}")
-                return redirect(f"{FRONTEND_URL}?error=oauth_failed")
-
-            # Encode user info and redirect to frontend
-            encoded_user = base64.b64encode(json.dumps(user_info).encode()).decode()
-            logger.info(f"✅ OAuth successful for {provider}, redirecting to frontend")
-            logger.info(f"📤 User: {user_info.get('name')} <{user_info.get('email')}>")
+    config = OAUTH_PROVIDERS.get(provider)
+    if config is None:
+        logger.error("Unsupported OAuth provider: %s", provider)
+        return redirect(f"{FRONTEND_URL}?error=unsupported_provider")
 
-            log_audit_event(None, "oauth_completed", {
-                "provider": provider,
-                "has_email": bool(user_info.get("email"))
-            })
+    try:
+        # Exchange authorization code for access token; the redirect URI
+        # must match what was sent to the provider
+        logger.info("Exchanging authorization code for access token")
+        token_params = {
+            "code": code,
+            "client_id": config["client_id"],
+            "client_secret": config["client_secret"],
+            "redirect_uri": OAUTH_REDIRECT_URIS[provider][_oauth_variant()],
+            **config["token_params"]
+        }
 
-            return redirect(f"{FRONTEND_URL}?user={encoded_user}")
+        if config["token_method"] == "post":
+            token_response = http_session.post(config["token_url"], data=token_params, timeout=15)
+        else:
+            token_response = http_session.get(config["token_url"], params=token_params, timeout=15)
 
-        except Exception as e:
-            logger.error(f"❌ OAuth callback error: {str(e)}")
+        if token_response.status_code != 200:
+            logger.error("Token exchange failed: %s - %s", token_response.status_code, token_response.text)
             return redirect(f"{FRONTEND_URL}?error=oauth_failed")
 
-    elif provider == "facebook":
-        try:
-            # Determine redirect URI (must match what was sent to Facebook)
-            if request.host.startswith("localhost"):
-                redirect_uri = "http://localhost:8501/oauth/callback/facebook"
-            else:
-                redirect_uri = "https://api.swipswaps.com/oauth/callback/facebook"
-
-            # Exchange authorization code for access token
-            logger.info(f"🔐 Exchanging authorization code for access token")
-            token_url = "https://graph.facebook.com/v18.0/oauth/access_token"
-            token_params = {
-                "code": code,
-                "client_id": FACEBOOK_APP_ID,
-                "client_secret": FACEBOOK_APP_SECRET,
-                "redirect_uri": redirect_uri
-            }
-
-            token_response = requests.get(token_url, params=token_params, timeout=15)
-
-            if token_response.status_code != 200:
-                logger.error(f"❌ Token exchange failed: {token_response.status_code} - {token_response.text}")
-                return redirect(f"{FRONTEND_URL}?error=oauth_failed")
+        token_json = token_response.json()
+        access_token = token_json.get("access_token")
 
-            token_json = token_response.json()
-            access_token = token_json.get("access_token")
-
-            if not access_token:
-                logger.error(f"❌ No access token in response")
-                return redirect(f"{FRONTEND_URL}?error=oauth_failed")
-
-            logger.info(f"✅ Access token obtained successfully")
+        if not access_token:
+            logger.error("No access token in response")
+            return redirect(f"{FRONTEND_URL}?error=oauth_failed")
 
-            # Fetch user info using access token
-            user_info = get_user_info(provider, access_token)
+        logger.info("Access token obtained successfully")
 
-            if not user_info:
-                logger.error(f"❌ Failed to fetch user info from {provider}")
-                return redirect(f"{FRONTEND_URL}?error=oauth_failed")
+        # Fetch user info using access token
+        user_info = get_user_info(provider, access_token)
 
-            # Encode user info and redirect to frontend
-            encoded_user = base64.b64encode(json.dumps(user_info).encode()).decode()
-            logger.info(f"✅ OAuth successful for {provider}, redirecting to frontend")
-            logger.info(f"📤 User: {user_info.get('name')} <{user_info.get('email')}>")
+        if not user_info:
+            logger.error("Failed to fetch user info from %s", provider)
+            return redirect(f"{FRONTEND_URL}?error=oauth_failed")
 
-            log_audit_event(None, "oauth_completed", {
-                "provider": provider,
-                "has_email": bool(user_info.get("email"))
-            })
+        # Park user info server-side and redirect with a short handle
+        handle = issue_oauth_user_handle(user_info)
+        logger.info("OAuth successful for %s, redirecting to frontend", provider)
+        logger.info("User: %s <%s>", user_info.get('name'), user_info.get('email'))
 
-            return redirect(f"{FRONTEND_URL}?user={encoded_user}")
+        log_audit_event(None, "oauth_completed", {
+            "provider": provider,
+            "has_email": bool(user_info.get("email"))
+        })
 
-        except Exception as e:
-            logger.error(f"❌ OAuth callback error: {str(e)}")
-            return redirect(f"{FRONTEND_URL}?error=oauth_failed")
+        return redirect(f"{FRONTEND_URL}?token={handle}")
 
-    else:
-        logger.error(f"❌ Unsupported OAuth provider: {provider}")
-        return redirect(f"{FRONTEND_URL}?error=unsupported_provider")
+    except Exception as e:
+        logger.error("OAuth callback error: %s", e)
+        return redirect(f"{FRONTEND_URL}?error=oauth_failed")
 
 
 @app.route("/send_verification", methods=["POST"])
@@ -2695,7 +4015,7 @@ def send_verification():
             return jsonify(success=False, error="Request ID is required"), 400
 
         # Get request details from database
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -2761,11 +4081,11 @@ def verify_code_endpoint():
 
         if not success:
             log_audit_event(request_id, "verification_failed", {"channel": "sms", "error": error})
-            commit_mode_transactions_total.labels(mode=COMMIT_MODE, operation='verification_failed').inc()
+            safe_labels(commit_mode_transactions_total, mode=COMMIT_MODE, operation='verification_failed').inc()
             return error_response(error, 400)
 
         # Track successful verification
-        commit_mode_transactions_total.labels(mode=COMMIT_MODE, operation='verification').inc()
+        safe_labels(commit_mode_transactions_total, mode=COMMIT_MODE, operation='verification').inc()
         log_audit_event(request_id, "verification_success", {"channel": "sms"})
 
         # COMMIT MODE: on_db_commit
@@ -2792,10 +4112,19 @@ def verify_code_endpoint():
 
     except Exception as e:
         logger.error(f"Error verifying code: {str(e)}")
-        commit_mode_transactions_total.labels(mode=COMMIT_MODE, operation='verification_error').inc()
+        safe_labels(commit_mode_transactions_total, mode=COMMIT_MODE, operation='verification_error').inc()
         return jsonify(success=False, error="Internal server error"), 500
 
 
+CALLBACK_INSERT_SQL = """
+    INSERT INTO callbacks (
+        request_id, visitor_name, visitor_email, visitor_phone,
+        request_status, created_at, updated_at, created_at_ts,
+        ip_address, user_agent, fingerprint, priority
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 @app.route("/request_callback", methods=["POST"])
 @limiter.limit("5 per minute")  # Prevent abuse - max 5 callback requests per minute
 def request_callback():
@@ -2810,7 +4139,9 @@ def request_callback():
     5. If business doesn't answer, send SMS to business
     """
     try:
-        data = request.get_json()
+        now = utc_now()
+        now_iso = now.isoformat()
+        data = read_json()
 
         # SECURITY LAYER 1: Honeypot check (bot detection)
         honeypot = data.get("website", "").strip()  # Hidden field - should be empty
@@ -2821,39 +4152,53 @@ def request_callback():
                 "honeypot_value": honeypot[:100]
             })
             # Return success to bot (don't reveal detection)
-            return jsonify(success=True, message="Request received"), 200
+            return json_response({"success": True, "message": "Request received"}, 200)
 
-        # SECURITY LAYER 2: Verify reCAPTCHA token
+        # SECURITY LAYER 2: Verify reCAPTCHA token. The round-trip to Google
+        # overlaps the read-only checks below; its verdict is still applied
+        # before any of their results.
         recaptcha_token = data.get("recaptcha_token", "")
-        if not verify_recaptcha(recaptcha_token):
-            logger.warning(f"reCAPTCHA verification failed for request from {request.remote_addr}")
+        recaptcha_result = start_recaptcha_verification(recaptcha_token, request.remote_addr)
+
+        # Validate and format phone number
+        visitor_phone = data.get("visitor_number", "").strip()
+        if visitor_phone:
+            is_valid, result = validate_phone_number(visitor_phone)
+        else:
+            is_valid, result = False, None
+
+        ip_address = request.remote_addr
+        user_agent = request.headers.get('User-Agent', 'Unknown')
+        if is_valid:
+            fingerprint = generate_request_fingerprint(ip_address, user_agent, result)
+            limit_check, abuse_check = check_request_limits(fingerprint, max_requests_per_day=20)
+
+        if not recaptcha_result.result():
+            logger.warning("reCAPTCHA verification failed for request from %s", request.remote_addr)
             log_audit_event(None, "captcha_failed", {
                 "remote_addr": request.remote_addr,
-                "user_agent": request.headers.get('User-Agent', 'Unknown')
+                "user_agent": user_agent
             })
-            return jsonify(success=False, error="CAPTCHA verification failed. Please try again."), 400
+            return json_response({"success": False, "error": "CAPTCHA verification failed. Please try again."}, 400)
 
         # Validate required fields
-        visitor_phone = data.get("visitor_number", "").strip()
         if not visitor_phone:
             logger.warning("Callback request missing visitor phone number")
-            return jsonify(success=False, error="Phone number is required"), 400
+            return json_response({"success": False, "error": "Phone number is required"}, 400)
 
-        # Validate and format phone number
-        is_valid, result = validate_phone_number(visitor_phone)
         if not is_valid:
-            logger.warning(f"Invalid phone number submitted: {visitor_phone} - {result}")
-            return jsonify(success=False, error=result), 400
+            logger.warning("Invalid phone number submitted: %s - %s", visitor_phone, result)
+            return json_response({"success": False, "error": result}, 400)
         visitor_phone = result  # Use E.164 formatted number
 
         # SECURITY LAYER 3: Check daily cost limits
-        within_limits, limit_message, limit_stats = check_daily_limits()
+        within_limits, limit_message, limit_stats = limit_check
         if not within_limits:
             log_audit_event(None, "daily_limit_reached", {
                 "remote_addr": request.remote_addr,
                 "stats": limit_stats
             })
-            return jsonify(success=False, error=limit_message), 503  # 503 Service Unavailable
+            return json_response({"success": False, "error": limit_message}, 503)  # 503 Service Unavailable
 
         # SECURITY LAYER 4: Check for duplicate requests (same phone number)
         # Auto-cancel old request if user submits a new one (better UX)
@@ -2861,21 +4206,18 @@ def request_callback():
         if is_duplicate:
             # Auto-cancel the old request
             try:
-                conn = sqlite3.connect(DATABASE_PATH)
-                cursor = conn.cursor()
-
-                cursor.execute("""
-                    UPDATE callbacks
-                    SET request_status = 'cancelled',
-                        status_message = 'Auto-cancelled: user submitted new request',
-                        updated_at = ?
-                    WHERE request_id = ?
-                """, (datetime.utcnow().isoformat(), existing_id))
-
-                conn.commit()
-                conn.close()
-
-                logger.info(f"Auto-cancelled old request {existing_id} for {visitor_phone} - user submitted new request")
+                with get_db_connection() as conn:
+                    conn.execute("""
+                        UPDATE callbacks
+                        SET request_status = 'cancelled',
+                            status_message = 'Auto-cancelled: user submitted new request',
+                            updated_at = ?
+                        WHERE request_id = ?
+                    """, (now_iso, existing_id))
+
+                publish_status(existing_id, 'cancelled', 'Auto-cancelled: user submitted new request', now_iso)
+
+                logger.info("Auto-cancelled old request %s for %s - user submitted new request", existing_id, visitor_phone)
                 log_audit_event(existing_id, "auto_cancelled_on_new_request", {
                     "remote_addr": request.remote_addr,
                     "visitor_phone": visitor_phone
@@ -2884,15 +4226,11 @@ def request_callback():
                 # Continue processing the new request (don't return error)
 
             except Exception as e:
-                logger.error(f"Error auto-cancelling old request: {str(e)}")
+                logger.error("Error auto-cancelling old request: %s", e)
                 # If auto-cancel fails, still allow the new request (fail open for better UX)
 
-        # SECURITY LAYER 5: Generate and check request fingerprint
-        ip_address = request.remote_addr
-        user_agent = request.headers.get('User-Agent', 'Unknown')
-        fingerprint = generate_request_fingerprint(ip_address, user_agent, visitor_phone)
-
-        is_abuse, abuse_message, abuse_count = check_fingerprint_abuse(fingerprint, max_requests_per_day=20)
+        # SECURITY LAYER 5: Check request fingerprint
+        is_abuse, abuse_message, abuse_count = abuse_check
         if is_abuse:
             log_audit_event(None, "fingerprint_abuse_blocked", {
                 "remote_addr": ip_address,
@@ -2900,68 +4238,211 @@ def request_callback():
                 "fingerprint": fingerprint,
                 "count_24h": abuse_count
             })
-            return jsonify(success=False, error=abuse_message), 429  # 429 Too Many Requests
+            return json_response({"success": False, "error": abuse_message}, 429)  # 429 Too Many Requests
 
         visitor_name = data.get("name", "").strip()
         visitor_email = data.get("email", "").strip()
 
         # Generate unique request ID
-        request_id = str(uuid.uuid4())
+        request_id = secrets.token_hex(16)
 
         # Determine priority based on visitor information
         priority = determine_priority(visitor_phone, visitor_email)
 
-        logger.info(f"Callback request received: {request_id} from {visitor_phone} [priority={priority}] (fingerprint: {fingerprint[:16]}...)")
+        logger.info("Callback request received: %s from %s [priority=%s] (fingerprint: %s...)", request_id, visitor_phone, priority, fingerprint[:16])
 
         # Store in database with security metadata and priority
-        conn = sqlite3.connect(DATABASE_PATH)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO callbacks (
-                request_id, visitor_name, visitor_email, visitor_phone,
-                request_status, created_at, updated_at,
-                ip_address, user_agent, fingerprint, priority
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            request_id,
-            visitor_name,
-            visitor_email,
-            visitor_phone,
-            "pending",
-            datetime.utcnow().isoformat(),
-            datetime.utcnow().isoformat(),
-            ip_address,
-            user_agent,
-            fingerprint,
-            priority
-        ))
-
-        conn.commit()
-        conn.close()
+        with get_db_connection() as conn:
+            conn.execute(CALLBACK_INSERT_SQL, (
+                request_id,
+                visitor_name,
+                visitor_email,
+                visitor_phone,
+                "pending",
+                now_iso,
+                now_iso,
+                epoch_us(now),
+                ip_address,
+                user_agent,
+                fingerprint,
+                priority
+            ))
+
+            # Audit record commits with the callback row: one transaction, and
+            # never a stored request without its audit trail
+            conn.execute(AUDIT_INSERT_SQL, audit_row(request_id, "callback_requested", {
+                "visitor_phone": visitor_phone,
+                "has_name": bool(visitor_name),
+                "has_email": bool(visitor_email),
+                "priority": priority
+            }, now_iso))
+
+        forget_fingerprint_count(fingerprint)
 
         # Increment Prometheus metrics for pending requests and priority
         callback_requests_total.labels(status='pending').inc()
-        callback_requests_by_priority.labels(priority=priority).inc()
-
-        log_audit_event(request_id, "callback_requested", {
-            "visitor_phone": visitor_phone,
-            "has_name": bool(visitor_name),
-            "has_email": bool(visitor_email),
-            "priority": priority
-        })
+        safe_labels(callback_requests_by_priority, priority=priority).inc()
 
         # NEW FLOW: Return request_id and ask user to verify phone via SMS
         # The call will only be initiated after verification via /initiate_callback endpoint
-        return jsonify(
-            success=True,
-            request_id=request_id,
-            message="Please verify your phone number to proceed"
-        ), 200
+        return json_response({
+            "success": True,
+            "request_id": request_id,
+            "message": "Please verify your phone number to proceed"
+        })
 
     except Exception as e:
-        logger.error(f"Error processing callback request: {str(e)}", exc_info=True)
-        return jsonify(success=False, error="Internal server error"), 500
+        logger.error("Error processing callback request: %s", e, exc_info=LOG_REQUEST_TRACEBACKS)
+        return json_response({"success": False, "error": "Internal server error"}, 500)
+
+
+# Bounded pool for provider API calls made on behalf of /initiate_callback
+CALLBACK_DISPATCH_WORKERS = int(os.environ.get("CALLBACK_DISPATCH_WORKERS", "8"))
+CALLBACK_DISPATCH_QUEUE_SIZE = int(os.environ.get("CALLBACK_DISPATCH_QUEUE_SIZE", "100"))
+
+callback_dispatch_executor = ThreadPoolExecutor(
+    max_workers=CALLBACK_DISPATCH_WORKERS,
+    thread_name_prefix="callback-dispatch"
+)
+callback_dispatch_slots = threading.BoundedSemaphore(CALLBACK_DISPATCH_QUEUE_SIZE)
+
+# SMS bodies sent on the business's behalf; filled with .format(name=..., phone=...)
+_SMS_OUTSIDE_HOURS_TMPL = "Callback request from {name} at {phone}. Received outside business hours. Please call back during business hours."
+_SMS_CALL_FAILED_TMPL = "Missed callback request from {name} at {phone}. Please call them back."
+_SMS_MISSED_TMPL = "Missed callback from {name} at {phone}. Please call back."
+_SMS_VISITOR_MISSED = "We missed you! Reply: VOICEMAIL to leave message, HELP for assistance, or CANCEL to stop."
+
+
+def dispatch_callback(request_id, visitor_name, visitor_phone, is_open, hours_message):
+    """
+    Place the call (or outside-hours SMS) for a verified request.
+
+    Runs on the callback dispatch pool; every outcome is recorded with
+    update_callback_status so the client sees it via /status/<request_id>.
+    """
+    # Initiate callback via configured provider
+    if callback_provider and callback_provider.is_configured() and BUSINESS_NUMBER:
+        # Determine from_number based on provider
+        from_number = visitor_phone if _PROVIDER_ASTERISK_USES_VISITOR else _PROVIDER_FROM_NUMBER
+
+        # If outside business hours, send SMS instead of calling (Twilio only)
+        if not is_open:
+            logger.info(f"Outside business hours for request {request_id} - sending SMS only")
+
+            if _PROVIDER_IS_TWILIO:
+                try:
+                    sms_result = callback_provider.send_sms(
+                        to_number=BUSINESS_NUMBER,
+                        from_number=from_number,
+                        message=_SMS_OUTSIDE_HOURS_TMPL.format(name=visitor_name or 'visitor', phone=visitor_phone)
+                    )
+
+                    if sms_result['success']:
+                        update_callback_status(request_id, "sms_sent", f"SMS sent ({hours_message})", sms_sid=sms_result['sms_sid'])
+                        logger.info(f"SMS sent for outside-hours request: {sms_result['sms_sid']}")
+                        log_audit_event(request_id, "sms_sent_outside_hours", {"sms_sid": sms_result['sms_sid']})
+
+                        return
+                    else:
+                        raise Exception(sms_result['message'])
+
+                except Exception as sms_error:
+                    logger.error(f"Failed to send outside-hours SMS: {str(sms_error)}")
+                    update_callback_status(request_id, "failed", f"SMS failed: {str(sms_error)}")
+                    return
+            else:
+                # Non-Twilio providers: store request for manual follow-up
+                update_callback_status(request_id, "pending", f"Outside business hours ({hours_message})")
+                return
+
+        try:
+            # Call business first (within business hours)
+            logger.info(f"Initiating callback via {callback_provider.__class__.__name__} for request {request_id} ({hours_message})")
+
+            call_result = callback_provider.make_call(
+                to_number=BUSINESS_NUMBER,
+                from_number=from_number,
+                request_id=request_id
+            )
+
+            if call_result['success']:
+                update_callback_status(request_id, "calling", "Calling business", call_sid=call_result['call_sid'])
+                # Increment Prometheus metrics
+                callback_requests_total.labels(status='calling').inc()
+                twilio_calls_total.labels(status='initiated').inc()
+                logger.info(f"Call initiated via {callback_provider.__class__.__name__}: {call_result['call_sid']}")
+            else:
+                raise Exception(call_result['message'])
+
+        except Exception as e:
+            logger.error(f"Callback failed: {str(e)}")
+            update_callback_status(request_id, "failed", f"Call failed: {str(e)}")
+            # Increment Prometheus metrics
+            callback_requests_total.labels(status='failed').inc()
+            twilio_calls_total.labels(status='failed').inc()
+
+            # Send SMS fallback to business (Twilio only)
+            if _PROVIDER_IS_TWILIO:
+                try:
+                    sms_result = callback_provider.send_sms(
+                        to_number=BUSINESS_NUMBER,
+                        from_number=from_number,
+                        message=_SMS_CALL_FAILED_TMPL.format(name=visitor_name or 'visitor', phone=visitor_phone)
+                    )
+
+                    if sms_result['success']:
+                        update_callback_status(request_id, "sms_sent", "SMS sent to business", sms_sid=sms_result['sms_sid'])
+                        logger.info(f"SMS fallback sent: {sms_result['sms_sid']}")
+                except Exception as sms_error:
+                    logger.error(f"SMS fallback failed: {str(sms_error)}")
+    else:
+        logger.warning("Callback provider not configured - callback request stored but not processed")
+        update_callback_status(request_id, "pending", "Provider not configured")
+
+
+def _run_callback_dispatch(*args):
+    """Dispatch pool entry point: never let an exception vanish in a Future."""
+    try:
+        dispatch_callback(*args)
+    except Exception as e:
+        logger.error(f"Callback dispatch failed for request {args[0]}: {str(e)}", exc_info=True)
+        update_callback_status(args[0], "failed", f"Dispatch error: {str(e)}")
+
+
+def _run_pooled_job(job, args):
+    try:
+        job(*args)
+    finally:
+        callback_dispatch_slots.release()
+
+
+def submit_pooled_job(job, *args):
+    """
+    Run job(*args) on the callback dispatch pool.
+
+    When CALLBACK_DISPATCH_QUEUE_SIZE jobs are already pending, the job
+    runs inline on the calling thread instead (backpressure, never dropped).
+
+    Returns:
+        bool: True if queued, False if it ran inline
+    """
+    if callback_dispatch_slots.acquire(blocking=False):
+        try:
+            callback_dispatch_executor.submit(_run_pooled_job, job, args)
+            return True
+        except RuntimeError:
+            # Executor shut down (process exiting) - fall through to inline
+            callback_dispatch_slots.release()
+
+    job(*args)
+    return False
+
+
+def submit_callback_dispatch(request_id, visitor_name, visitor_phone, is_open, hours_message):
+    """Queue dispatch_callback on the pool (inline when the queue is full)."""
+    args = (request_id, visitor_name, visitor_phone, is_open, hours_message)
+    if not submit_pooled_job(_run_callback_dispatch, *args):
+        logger.warning(f"Callback dispatch queue full - dispatched {request_id} inline")
 
 
 @app.route("/initiate_callback", methods=["POST"])
@@ -2983,7 +4464,7 @@ def initiate_callback():
             return error_response("Request ID is required", 400)
 
         # Check if request exists and get details
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -3011,105 +4492,21 @@ def initiate_callback():
         # Check business hours before initiating call
         is_open, hours_message = is_business_hours()
 
-        # Initiate callback via configured provider
-        if callback_provider and callback_provider.is_configured() and BUSINESS_NUMBER:
-            # Determine from_number based on provider
-            if isinstance(callback_provider, TwilioProvider):
-                from_number = TWILIO_NUMBER
-            elif isinstance(callback_provider, AsteriskProvider):
-                from_number = visitor_phone  # Asterisk uses visitor number as caller ID
-            else:
-                from_number = BUSINESS_NUMBER
-
-            # If outside business hours, send SMS instead of calling (Twilio only)
-            if not is_open:
-                logger.info(f"Outside business hours for request {request_id} - sending SMS only")
-
-                if isinstance(callback_provider, TwilioProvider):
-                    try:
-                        sms_result = callback_provider.send_sms(
-                            to_number=BUSINESS_NUMBER,
-                            from_number=from_number,
-                            message=f"Callback request from {visitor_name or 'visitor'} at {visitor_phone}. Received outside business hours. Please call back during business hours."
-                        )
-
-                        if sms_result['success']:
-                            update_callback_status(request_id, "sms_sent", f"SMS sent ({hours_message})", sms_sid=sms_result['sms_sid'])
-                            logger.info(f"SMS sent for outside-hours request: {sms_result['sms_sid']}")
-                            log_audit_event(request_id, "sms_sent_outside_hours", {"sms_sid": sms_result['sms_sid']})
-
-                            return jsonify(
-                                success=True,
-                                request_id=request_id,
-                                message=f"Request received. {hours_message}. We'll call you back during business hours."
-                            ), 200
-                        else:
-                            raise Exception(sms_result['message'])
-
-                    except Exception as sms_error:
-                        logger.error(f"Failed to send outside-hours SMS: {str(sms_error)}")
-                        update_callback_status(request_id, "failed", f"SMS failed: {str(sms_error)}")
-                        return jsonify(
-                            success=False,
-                            error="Failed to process request. Please try again later."
-                        ), 500
-                else:
-                    # Non-Twilio providers: store request for manual follow-up
-                    update_callback_status(request_id, "pending", f"Outside business hours ({hours_message})")
-                    return jsonify(
-                        success=True,
-                        request_id=request_id,
-                        message=f"Request received. {hours_message}. We'll call you back during business hours."
-                    ), 200
-
-            try:
-                # Call business first (within business hours)
-                logger.info(f"Initiating callback via {callback_provider.__class__.__name__} for request {request_id} ({hours_message})")
-
-                call_result = callback_provider.make_call(
-                    to_number=BUSINESS_NUMBER,
-                    from_number=from_number,
-                    request_id=request_id
-                )
-
-                if call_result['success']:
-                    update_callback_status(request_id, "calling", "Calling business", call_sid=call_result['call_sid'])
-                    # Increment Prometheus metrics
-                    callback_requests_total.labels(status='calling').inc()
-                    twilio_calls_total.labels(status='initiated').inc()
-                    logger.info(f"Call initiated via {callback_provider.__class__.__name__}: {call_result['call_sid']}")
-                else:
-                    raise Exception(call_result['message'])
-
-            except Exception as e:
-                logger.error(f"Callback failed: {str(e)}")
-                update_callback_status(request_id, "failed", f"Call failed: {str(e)}")
-                # Increment Prometheus metrics
-                callback_requests_total.labels(status='failed').inc()
-                twilio_calls_total.labels(status='failed').inc()
+        # Provider calls are TLS round-trips to the provider API; run them on
+        # the dispatch pool and let the client poll /status/<request_id>
+        submit_callback_dispatch(request_id, visitor_name, visitor_phone, is_open, hours_message)
 
-                # Send SMS fallback to business (Twilio only)
-                if isinstance(callback_provider, TwilioProvider):
-                    try:
-                        sms_result = callback_provider.send_sms(
-                            to_number=BUSINESS_NUMBER,
-                            from_number=from_number,
-                            message=f"Missed callback request from {visitor_name or 'visitor'} at {visitor_phone}. Please call them back."
-                        )
-
-                        if sms_result['success']:
-                            update_callback_status(request_id, "sms_sent", "SMS sent to business", sms_sid=sms_result['sms_sid'])
-                            logger.info(f"SMS fallback sent: {sms_result['sms_sid']}")
-                    except Exception as sms_error:
-                        logger.error(f"SMS fallback failed: {str(sms_error)}")
-        else:
-            logger.warning("Callback provider not configured - callback request stored but not processed")
-            update_callback_status(request_id, "pending", "Provider not configured")
+        if not is_open:
+            return jsonify(
+                success=True,
+                request_id=request_id,
+                message=f"Request received. {hours_message}. We'll call you back during business hours."
+            ), 202
 
-        return jsonify(success=True, request_id=request_id)
+        return jsonify(success=True, request_id=request_id), 202
 
     except Exception as e:
-        logger.error(f"Error processing callback request: {str(e)}", exc_info=True)
+        logger.error(f"Error processing callback request: {str(e)}", exc_info=LOG_REQUEST_TRACEBACKS)
         return jsonify(success=False, error="Internal server error"), 500
 
 
@@ -3128,7 +4525,7 @@ def cancel_request():
         if not request_id:
             return jsonify(success=False, error="Request ID is required"), 400
 
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
         # Check if request exists and is cancellable
@@ -3152,16 +4549,18 @@ def cancel_request():
             return jsonify(success=False, error=f"Cannot cancel {status} request"), 400
 
         # Update status to cancelled
+        now_iso = utc_now().isoformat()
         cursor.execute("""
             UPDATE callbacks
             SET request_status = 'cancelled',
                 status_message = 'Cancelled by user',
                 updated_at = ?
             WHERE request_id = ?
-        """, (datetime.utcnow().isoformat(), request_id))
+        """, (now_iso, request_id))
 
         conn.commit()
         conn.close()
+        publish_status(request_id, 'cancelled', 'Cancelled by user', now_iso)
 
         logger.info(f"Request cancelled by user: {request_id} (phone: {visitor_phone})")
         log_audit_event(request_id, "request_cancelled", {"phone": visitor_phone})
@@ -3177,35 +4576,115 @@ def cancel_request():
 def get_status(request_id):
     """Get current status of a callback request."""
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
-        cursor = conn.cursor()
+        entry = lookup_status(request_id)
 
-        cursor.execute("""
-            SELECT request_status, status_message, updated_at
-            FROM callbacks
-            WHERE request_id = ?
-        """, (request_id,))
+        if not entry:
+            logger.warning(f"Status requested for unknown request_id: {request_id}")
+            return json_response({"success": False, "error": "Request not found"}, 404)
 
-        row = cursor.fetchone()
-        conn.close()
+        status, message, updated_at = entry
 
-        if not row:
-            logger.warning(f"Status requested for unknown request_id: {request_id}")
-            return jsonify(success=False, error="Request not found"), 404
+        return json_response({
+            "success": True,
+            "status": status,
+            "message": message,
+            "updated_at": updated_at
+        })
 
-        status, message, updated_at = row
+    except Exception as e:
+        logger.error(f"Error fetching status: {str(e)}")
+        return json_response({"success": False, "error": "Internal server error"}, 500)
 
-        return jsonify(
-            success=True,
-            status=status,
-            message=message,
-            updated_at=updated_at
-        )
 
+@app.route("/status/<request_id>/stream", methods=["GET"])
+def stream_status(request_id):
+    """
+    Stream status changes of a callback request as server-sent events.
+
+    Sends the current status immediately and then each change, until a
+    final status or STATUS_STREAM_MAX_SECONDS. Returns 503 when
+    STATUS_STREAM_MAX_CLIENTS streams are already open; clients then fall
+    back to polling /status/<request_id>.
+    """
+    try:
+        entry = lookup_status(request_id)
     except Exception as e:
         logger.error(f"Error fetching status: {str(e)}")
         return jsonify(success=False, error="Internal server error"), 500
 
+    if not entry:
+        logger.warning(f"Status stream requested for unknown request_id: {request_id}")
+        return jsonify(success=False, error="Request not found"), 404
+
+    if not status_stream_slots.acquire(blocking=False):
+        return jsonify(success=False, error="Too many status streams, poll instead"), 503
+
+    def generate(current):
+        try:
+            deadline = time.monotonic() + STATUS_STREAM_MAX_SECONDS
+            last = None
+            while True:
+                if current != last:
+                    status, message, updated_at = current
+                    payload = json.dumps({"status": status, "message": message, "updated_at": updated_at})
+                    yield f"data: {payload}\n\n"
+                    last = current
+                    if status in FINAL_STATUSES:
+                        return
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                if not wait_for_status_change(request_id, last, min(remaining, STATUS_STREAM_HEARTBEAT_SECONDS)):
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": keepalive\n\n"
+                current = lookup_status(request_id) or last
+        except Exception as e:
+            logger.error(f"Error streaming status for {request_id}: {str(e)}")
+
+    response = Response(
+        generate(entry),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+    # Runs when the server closes the response, even if the client left early
+    response.call_on_close(status_stream_slots.release)
+    return response
+
+
+RETRY_STATE_SELECT_SQL = """
+    SELECT retry_count, max_retries, visitor_name, visitor_phone
+    FROM callbacks
+    WHERE request_id = ?
+"""
+
+
+def send_missed_call_sms(visitor_name, visitor_phone):
+    """Text the business and the visitor after the last callback attempt failed."""
+    try:
+        # SMS to business (existing behavior)
+        with concurrency_gate(_SMS_SEM, "sms"):
+            business_sms = twilio_client.messages.create(
+                to=BUSINESS_NUMBER,
+                from_=TWILIO_NUMBER,
+                body=_SMS_MISSED_TMPL.format(name=visitor_name or 'visitor', phone=visitor_phone)
+            )
+        twilio_sms_total.labels(type='missed_call_business').inc()
+        logger.info(f"SMS sent to business for missed call: {business_sms.sid}")
+
+        # SMS to visitor (NEW: inform them what happened)
+        # Keep message short to avoid carrier filtering (trial account adds ~40 char prefix)
+        with concurrency_gate(_SMS_SEM, "sms"):
+            visitor_sms = twilio_client.messages.create(
+                to=visitor_phone,
+                from_=TWILIO_NUMBER,
+                body=_SMS_VISITOR_MISSED
+            )
+        twilio_sms_total.labels(type='missed_call_visitor').inc()
+        logger.info(f"SMS sent to visitor for missed call: {visitor_sms.sid}")
+    except Exception as e:
+        logger.error(f"Failed to send SMS fallback: {str(e)}")
+
 
 @app.route("/twilio/status_callback", methods=["POST"])
 def twilio_status_callback():
@@ -3218,22 +4697,25 @@ def twilio_status_callback():
         request_id = request.args.get("request_id")
 
         # Verify Twilio signature to prevent spoofed callbacks
+        twilio_validator = get_twilio_validator()
         if twilio_validator:
             signature = request.headers.get('X-Twilio-Signature', '')
             url = request.url
-            params = request.form.to_dict()
 
             # DEBUG: Log URL details to diagnose signature validation issues
-            logger.debug(f"Signature validation - URL: {url}")
-            logger.debug(f"Signature validation - Scheme: {request.scheme}")
-            logger.debug(f"Signature validation - Host: {request.host}")
-            logger.debug(f"Signature validation - X-Forwarded-Proto: {request.headers.get('X-Forwarded-Proto')}")
-            logger.debug(f"Signature validation - X-Forwarded-Host: {request.headers.get('X-Forwarded-Host')}")
-
-            if not twilio_validator.validate(url, params, signature):
-                logger.warning(f"Invalid Twilio signature - possible spoofing attempt for request {request_id}")
-                logger.warning(f"URL used for validation: {url}")
-                logger.warning(f"Params: {params}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Signature validation - URL: %s", url)
+                logger.debug("Signature validation - Scheme: %s", request.scheme)
+                logger.debug("Signature validation - Host: %s", request.host)
+                logger.debug("Signature validation - X-Forwarded-Proto: %s", request.headers.get('X-Forwarded-Proto'))
+                logger.debug("Signature validation - X-Forwarded-Host: %s", request.headers.get('X-Forwarded-Host'))
+
+            # request.form is passed as is: the validator reads every value of
+            # repeated fields, which a to_dict() copy would drop
+            if not twilio_validator.validate(url, request.form, signature):
+                logger.warning("Invalid Twilio signature - possible spoofing attempt for request %s", request_id)
+                logger.warning("URL used for validation: %s", url)
+                logger.warning("Params: %s", request.form.to_dict(flat=False))
                 log_audit_event(request_id, "invalid_signature", {
                     "url": url,
                     "signature_provided": bool(signature),
@@ -3241,7 +4723,7 @@ def twilio_status_callback():
                 })
                 return "", 403
 
-            logger.debug(f"Twilio signature verified for request {request_id}")
+            logger.debug("Twilio signature verified for request %s", request_id)
         else:
             logger.warning("Twilio validator not configured - signature verification skipped")
 
@@ -3249,7 +4731,7 @@ def twilio_status_callback():
         call_sid = request.form.get("CallSid")
         call_duration = request.form.get("CallDuration", "0")
 
-        logger.info(f"Twilio status callback: {request_id} - {call_status} (duration: {call_duration}s)")
+        logger.info("Twilio status callback: %s - %s (duration: %ss)", request_id, call_status, call_duration)
 
         if not request_id:
             logger.error("Status callback missing request_id")
@@ -3271,15 +4753,8 @@ def twilio_status_callback():
             twilio_calls_total.labels(status='completed').inc()
         elif call_status in ["no-answer", "busy", "failed"] or (call_status == "completed" and duration_seconds < 20):
             # Check retry count and decide whether to retry or mark as failed
-            conn = sqlite3.connect(DATABASE_PATH)
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT retry_count, max_retries, visitor_name, visitor_phone
-                FROM callbacks
-                WHERE request_id = ?
-            """, (request_id,))
-            row = cursor.fetchone()
-            conn.close()
+            with get_db_connection() as conn:
+                row = conn.execute(RETRY_STATE_SELECT_SQL, (request_id,)).fetchone()
 
             if row:
                 retry_count, max_retries, visitor_name, visitor_phone = row
@@ -3289,42 +4764,23 @@ def twilio_status_callback():
 
                 if new_retry_count <= max_retries:
                     # Schedule retry with exponential backoff
-                    logger.info(f"Call failed for {request_id}, scheduling retry {new_retry_count}/{max_retries}")
+                    logger.info("Call failed for %s, scheduling retry %s/%s", request_id, new_retry_count, max_retries)
                     schedule_retry(request_id, new_retry_count)
                     # Increment Prometheus metrics for retry scheduled
                     callback_requests_total.labels(status='retry_scheduled').inc()
                     twilio_calls_total.labels(status='failed').inc()
                 else:
                     # Max retries exhausted - mark as dead letter
-                    logger.warning(f"Max retries exhausted for {request_id}, moving to dead letter queue")
+                    logger.warning("Max retries exhausted for %s, moving to dead letter queue", request_id)
                     mark_as_dead_letter(request_id, f"Max retries ({max_retries}) exhausted after {call_status}")
                     # Increment Prometheus metrics
                     callback_requests_total.labels(status='dead_letter').inc()
                     twilio_calls_total.labels(status='failed').inc()
 
-                    # Send SMS to BOTH business AND visitor as final fallback
+                    # Send SMS to BOTH business AND visitor as final fallback,
+                    # off the webhook thread so Twilio gets its 200 right away
                     if twilio_client:
-                        try:
-                            # SMS to business (existing behavior)
-                            business_sms = twilio_client.messages.create(
-                                to=BUSINESS_NUMBER,
-                                from_=TWILIO_NUMBER,
-                                body=f"Missed callback from {visitor_name or 'visitor'} at {visitor_phone}. Please call back."
-                            )
-                            twilio_sms_total.labels(type='missed_call_business').inc()
-                            logger.info(f"SMS sent to business for missed call: {business_sms.sid}")
-
-                            # SMS to visitor (NEW: inform them what happened)
-                            # Keep message short to avoid carrier filtering (trial account adds ~40 char prefix)
-                            visitor_sms = twilio_client.messages.create(
-                                to=visitor_phone,
-                                from_=TWILIO_NUMBER,
-                                body=f"We missed you! Reply: VOICEMAIL to leave message, HELP for assistance, or CANCEL to stop."
-                            )
-                            twilio_sms_total.labels(type='missed_call_visitor').inc()
-                            logger.info(f"SMS sent to visitor for missed call: {visitor_sms.sid}")
-                        except Exception as e:
-                            logger.error(f"Failed to send SMS fallback: {str(e)}")
+                        submit_pooled_job(send_missed_call_sms, visitor_name, visitor_phone)
             else:
                 # Fallback if we can't find the request (shouldn't happen)
                 update_callback_status(request_id, "failed", f"Call {call_status}")
@@ -3334,7 +4790,7 @@ def twilio_status_callback():
         return "", 200
 
     except Exception as e:
-        logger.error(f"Error in status callback: {str(e)}")
+        logger.error("Error in status callback: %s", e)
         return "", 500
 
 
@@ -3348,15 +4804,13 @@ def twilio_incoming_sms():
     - CANCEL: Cancel callback request
     """
     try:
-        from twilio.twiml.messaging_response import MessagingResponse
-
         # Verify Twilio signature
+        twilio_validator = get_twilio_validator()
         if twilio_validator:
             signature = request.headers.get('X-Twilio-Signature', '')
             url = request.url
-            params = request.form.to_dict()
 
-            if not twilio_validator.validate(url, params, signature):
+            if not twilio_validator.validate(url, request.form, signature):
                 logger.warning(f"Invalid Twilio signature on incoming SMS")
                 return "", 403
 
@@ -3368,7 +4822,7 @@ def twilio_incoming_sms():
         resp = MessagingResponse()
 
         # Find most recent callback request from this number
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
         cursor.execute("""
             SELECT request_id, visitor_name, request_status
@@ -3390,19 +4844,21 @@ def twilio_incoming_sms():
         # Handle different commands
         if 'VOICEMAIL' in body:
             # Initiate call that connects visitor directly to business voicemail
-            if twilio_client:
+            reserved, usage_day = reserve_daily_usage("calls") if twilio_client else (False, None)
+            if reserved:
                 try:
                     call = twilio_client.calls.create(
                         to=from_number,
                         from_=TWILIO_NUMBER,
-                        url=f"https://api.swipswaps.com/twilio/voicemail_connect",
-                        status_callback=f"https://api.swipswaps.com/twilio/status_callback?request_id={request_id}",
+                        url=VOICEMAIL_CONNECT_URL,
+                        status_callback=STATUS_CALLBACK_URL_PREFIX + request_id,
                         status_callback_event=["completed"]
                     )
                     resp.message(f"Calling you now to connect you to our voicemail. Please answer your phone.")
                     update_callback_status(request_id, "voicemail_requested", "Visitor requested voicemail", call_sid=call.sid)
                     logger.info(f"Voicemail call initiated for {from_number}: {call.sid}")
                 except Exception as e:
+                    release_daily_usage("calls", usage_day)
                     logger.error(f"Failed to initiate voicemail call: {str(e)}")
                     resp.message(f"Sorry, we couldn't connect you to voicemail. Please call us directly at {BUSINESS_NUMBER}.")
             else:
@@ -3440,15 +4896,13 @@ def twilio_voicemail_connect():
     If business doesn't answer, visitor reaches voicemail naturally.
     """
     try:
-        from twilio.twiml.voice_response import VoiceResponse, Dial
-
         resp = VoiceResponse()
         resp.say("Please wait while we connect you to our voicemail system.", voice='alice')
 
         # Dial business number - if no answer, caller reaches business voicemail
         dial = Dial(
             timeout=30,
-            action=f"https://api.swipswaps.com/twilio/voicemail_status",
+            action=VOICEMAIL_STATUS_URL,
             method="POST"
         )
         dial.number(BUSINESS_NUMBER)
@@ -3471,8 +4925,6 @@ def twilio_voicemail_status():
     Handle status after voicemail dial attempt.
     """
     try:
-        from twilio.twiml.voice_response import VoiceResponse
-
         dial_call_status = request.form.get('DialCallStatus')
         logger.info(f"Voicemail dial status: {dial_call_status}")
 
@@ -3585,44 +5037,26 @@ def admin_get_stats():
         return error_response
 
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
-        cursor = conn.cursor()
+        cutoff_time = utc_now() - timedelta(hours=24)
 
-        # Total requests
-        cursor.execute("SELECT COUNT(*) FROM callbacks")
-        total_requests = cursor.fetchone()[0]
+        # All-time and last-24h counts per status in a single pass
+        with get_db_connection() as conn:
+            rows = conn.execute("""
+                SELECT request_status, COUNT(*), SUM(created_at > ?)
+                FROM callbacks
+                GROUP BY request_status
+            """, (cutoff_time.isoformat(),)).fetchall()
 
-        # Requests by status
-        cursor.execute("""
-            SELECT request_status, COUNT(*) as count
-            FROM callbacks
-            GROUP BY request_status
-        """)
-        by_status = {row[0]: row[1] for row in cursor.fetchall()}
+        by_status = {status: count for status, count, _ in rows}
+        last_24h_by_status = {status: recent for status, _, recent in rows if recent}
+        total_requests = sum(by_status.values())
+        last_24h_total = sum(last_24h_by_status.values())
 
         # Success rate (completed / total calls attempted)
         completed = by_status.get('completed', 0)
         total_calls = sum(by_status.get(s, 0) for s in ['calling', 'connected', 'completed', 'failed'])
         success_rate = (completed / total_calls * 100) if total_calls > 0 else 0
 
-        # Last 24 hours stats
-        cutoff_time = datetime.utcnow() - timedelta(hours=24)
-        cursor.execute("""
-            SELECT COUNT(*) FROM callbacks
-            WHERE created_at > ?
-        """, (cutoff_time.isoformat(),))
-        last_24h_total = cursor.fetchone()[0]
-
-        cursor.execute("""
-            SELECT request_status, COUNT(*) as count
-            FROM callbacks
-            WHERE created_at > ?
-            GROUP BY request_status
-        """, (cutoff_time.isoformat(),))
-        last_24h_by_status = {row[0]: row[1] for row in cursor.fetchall()}
-
-        conn.close()
-
         return jsonify({
             "success": True,
             "stats": {
@@ -3637,7 +5071,7 @@ def admin_get_stats():
         }), 200
 
     except Exception as e:
-        logger.error(f"Error getting admin stats: {str(e)}", exc_info=True)
+        logger.error(f"Error getting admin stats: {str(e)}", exc_info=LOG_REQUEST_TRACEBACKS)
         return jsonify({"success": False, "error": "Internal server error"}), 500
 
 
@@ -3670,7 +5104,7 @@ def admin_get_requests():
         if order not in ['asc', 'desc']:
             order = 'desc'
 
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
         # Build query with filters
@@ -3748,7 +5182,7 @@ def admin_get_requests():
         }), 200
 
     except Exception as e:
-        logger.error(f"Error getting admin requests: {str(e)}", exc_info=True)
+        logger.error(f"Error getting admin requests: {str(e)}", exc_info=LOG_REQUEST_TRACEBACKS)
         return jsonify({"success": False, "error": "Internal server error"}), 500
 
 
@@ -3769,7 +5203,7 @@ def admin_retry_callback(request_id):
         return error_response
 
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
         # Check if request exists
@@ -3796,6 +5230,7 @@ def admin_retry_callback(request_id):
             }), 400
 
         # Reset status to verified
+        now_iso = utc_now().isoformat()
         cursor.execute("""
             UPDATE callbacks
             SET request_status = ?, status_message = ?, updated_at = ?
@@ -3803,12 +5238,13 @@ def admin_retry_callback(request_id):
         """, (
             'verified',
             'Retrying callback (admin action)',
-            datetime.utcnow().isoformat(),
+            now_iso,
             request_id
         ))
 
         conn.commit()
         conn.close()
+        publish_status(request_id, 'verified', 'Retrying callback (admin action)', now_iso)
 
         logger.info(f"Admin retry initiated for request {request_id} from {request.remote_addr}")
         log_audit_event(request_id, "admin_retry", {"admin_ip": request.remote_addr})
@@ -3831,11 +5267,11 @@ def admin_retry_callback(request_id):
                 }), 500
 
         except Exception as e:
-            logger.error(f"Error initiating retry callback: {str(e)}", exc_info=True)
+            logger.error(f"Error initiating retry callback: {str(e)}", exc_info=LOG_REQUEST_TRACEBACKS)
             return jsonify({"success": False, "error": "Failed to initiate callback"}), 500
 
     except Exception as e:
-        logger.error(f"Error retrying callback: {str(e)}", exc_info=True)
+        logger.error(f"Error retrying callback: {str(e)}", exc_info=LOG_REQUEST_TRACEBACKS)
         return jsonify({"success": False, "error": "Internal server error"}), 500
 
 
@@ -3869,12 +5305,7 @@ def initiate_callback_internal(request_id, visitor_name, visitor_email, visitor_
         #     return {"success": False, "error": limit_message}
 
         # Determine from_number based on provider
-        if isinstance(callback_provider, TwilioProvider):
-            from_number = TWILIO_NUMBER
-        elif isinstance(callback_provider, AsteriskProvider):
-            from_number = visitor_phone
-        else:
-            from_number = BUSINESS_NUMBER
+        from_number = visitor_phone if _PROVIDER_ASTERISK_USES_VISITOR else _PROVIDER_FROM_NUMBER
 
         # Initiate call
         logger.info(f"Initiating callback for request {request_id} (admin retry)")
@@ -3918,7 +5349,7 @@ def process_escalation_queue():
         return 0
 
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
         # Find requests in 'calling' status that might need escalation
@@ -3951,14 +5382,14 @@ def process_escalation_queue():
                 result = escalate_request(request_id, next_level, next_target)
 
                 # Track metrics
-                escalations_total.labels(level=str(next_level)).inc()
+                safe_labels(escalations_total, level=str(next_level)).inc()
 
                 if result['success']:
                     escalated_count += 1
-                    escalation_success_total.labels(level=str(next_level)).inc()
+                    safe_labels(escalation_success_total, level=str(next_level)).inc()
                     logger.info(f"Successfully escalated {request_id} to level {next_level}")
                 else:
-                    escalation_failures_total.labels(level=str(next_level)).inc()
+                    safe_labels(escalation_failures_total, level=str(next_level)).inc()
                     logger.error(f"Failed to escalate {request_id}: {result.get('error')}")
 
         if escalated_count > 0:
@@ -3984,10 +5415,10 @@ def cleanup_old_requests(max_age_days=90):
         int: Number of requests deleted
     """
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
-        cutoff_date = datetime.utcnow() - timedelta(days=max_age_days)
+        cutoff_date = utc_now() - timedelta(days=max_age_days)
 
         cursor.execute("""
             DELETE FROM callbacks
@@ -4000,6 +5431,7 @@ def cleanup_old_requests(max_age_days=90):
         conn.close()
 
         if deleted_count > 0:
+            forget_status()
             logger.info(f"Cleanup: deleted {deleted_count} old request(s) older than {max_age_days} days")
 
         return deleted_count
@@ -4021,10 +5453,10 @@ def cleanup_expired_verification_codes(max_age_hours=24):
         int: Number of codes deleted
     """
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
-        cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
+        cutoff_time = utc_now() - timedelta(hours=max_age_hours)
 
         cursor.execute("""
             DELETE FROM verification_codes
@@ -4057,10 +5489,10 @@ def cleanup_old_audit_logs(max_age_days=365):
         int: Number of logs deleted
     """
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
-        cutoff_date = datetime.utcnow() - timedelta(days=max_age_days)
+        cutoff_date = utc_now() - timedelta(days=max_age_days)
 
         cursor.execute("""
             DELETE FROM audit_log
@@ -4100,11 +5532,11 @@ def send_daily_compliance_report(recipients=None):
             logger.debug("No recipients configured for daily report")
             return False
 
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
         # Get stats for last 24 hours
-        yesterday = datetime.utcnow() - timedelta(days=1)
+        yesterday = utc_now() - timedelta(days=1)
 
         cursor.execute("""
             SELECT
@@ -4132,7 +5564,7 @@ def send_daily_compliance_report(recipients=None):
 
         # Format report
         report = f"""
-Daily Callback System Report - {datetime.utcnow().strftime('%Y-%m-%d')}
+Daily Callback System Report - {utc_now().strftime('%Y-%m-%d')}
 
 Summary (Last 24 Hours):
 - Total Requests: {total}
@@ -4170,11 +5602,11 @@ def analyze_fingerprint_abuse_patterns(threshold_multiplier=2.0):
         dict: Analysis results with suspicious fingerprints
     """
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_db_connection()
         cursor = conn.cursor()
 
         # Get fingerprints with unusually high request rates in last 24 hours
-        yesterday = datetime.utcnow() - timedelta(days=1)
+        yesterday = utc_now() - timedelta(days=1)
 
         cursor.execute("""
             SELECT fingerprint, COUNT(*) as request_count
@@ -4253,10 +5685,6 @@ def check_daily_cost_thresholds(warning_threshold=0.8):
 # RECURRING TASKS SCHEDULER (APScheduler)
 # ============================================================
 
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.cron import CronTrigger
-import yaml
-
 def load_recurring_tasks_config():
     """
     Load recurring tasks configuration from YAML file.
@@ -4279,7 +5707,7 @@ def load_recurring_tasks_config():
 
 
 # Initialize APScheduler
-scheduler = BackgroundScheduler(timezone=pytz.UTC)
+scheduler = BackgroundScheduler(timezone=timezone.utc)
 
 # Map task function names to actual functions
 task_functions = {
@@ -4324,7 +5752,7 @@ for task_name, task_config in tasks_config.items():
             day=parts[2],
             month=parts[3],
             day_of_week=parts[4],
-            timezone=pytz.UTC
+            timezone=timezone.utc
         )
 
         scheduler.add_job(
@@ -4354,16 +5782,12 @@ except Exception as e:
 # WORKER HEALTH MONITORING
 # ============================================================
 
-import signal
-import atexit
-
 # Worker heartbeat tracking
 worker_heartbeats = {}
 worker_start_times = {}
 worker_failure_counts = {}
 
 # Prometheus metrics for worker health
-from prometheus_client import Gauge, Counter
 worker_uptime_seconds = Gauge('worker_uptime_seconds', 'Worker uptime in seconds', ['worker'])
 worker_failures_total = Counter('worker_failures_total', 'Total worker failures', ['worker'])
 worker_last_heartbeat_timestamp = Gauge('worker_last_heartbeat_timestamp', 'Timestamp of last heartbeat', ['worker'])
@@ -4376,7 +5800,7 @@ twilio_api_failures_total = Counter('twilio_api_failures_total', 'Total Twilio A
 
 def update_worker_heartbeat(worker_name):
     """Update heartbeat timestamp for a worker."""
-    now = datetime.utcnow()
+    now = utc_now()
     worker_heartbeats[worker_name] = now
     worker_last_heartbeat_timestamp.labels(worker=worker_name).set(now.timestamp())
     worker_health_status.labels(worker=worker_name).set(1)  # Healthy
@@ -4389,7 +5813,7 @@ def check_worker_health():
     Returns:
         dict: Worker health status
     """
-    now = datetime.utcnow()
+    now = utc_now()
     health_report = {}
 
     for worker_name, last_heartbeat in worker_heartbeats.items():
@@ -4451,9 +5875,7 @@ def monitored_worker(worker_func, worker_name, restart_on_failure=True):
         worker_name: Name of the worker for logging/metrics
         restart_on_failure: Whether to restart worker on crash
     """
-    import time
-
-    worker_start_times[worker_name] = datetime.utcnow()
+    worker_start_times[worker_name] = utc_now()
     worker_failure_counts[worker_name] = 0
 
     logger.info(f"Worker {worker_name} started with monitoring")
@@ -4464,7 +5886,7 @@ def monitored_worker(worker_func, worker_name, restart_on_failure=True):
             update_worker_heartbeat(worker_name)
 
             # Update uptime metric
-            uptime = (datetime.utcnow() - worker_start_times[worker_name]).total_seconds()
+            uptime = (utc_now() - worker_start_times[worker_name]).total_seconds()
             worker_uptime_seconds.labels(worker=worker_name).set(uptime)
 
             # Run the worker function
@@ -4487,7 +5909,7 @@ def monitored_worker(worker_func, worker_name, restart_on_failure=True):
             time.sleep(restart_delay)
 
             # Reset start time on restart
-            worker_start_times[worker_name] = datetime.utcnow()
+            worker_start_times[worker_name] = utc_now()
 
 
 # Background retry processor
@@ -4498,8 +5920,6 @@ def retry_processor_worker():
     This runs in a separate thread and continuously checks for requests
     that are due for retry.
     """
-    import time
-
     while True:
         try:
             process_retry_queue()
@@ -4532,6 +5952,12 @@ def graceful_shutdown(signum, frame):
     except Exception as e:
         logger.error(f"✗ Error stopping scheduler: {e}")
 
+    # Stop accepting callback dispatch jobs; queued ones finish in the background
+    callback_dispatch_executor.shutdown(wait=False)
+    recaptcha_executor.shutdown(wait=False)
+    close_twilio_http_client()
+    http_session.close()
+
     # Log final worker health
     health_report = check_worker_health()
     logger.info(f"✓ Final worker health: {health_report}")
@@ -4552,7 +5978,6 @@ atexit.register(lambda: logger.info("Application exiting"))
 
 
 # Start background retry processor thread with monitoring
-import threading
 retry_thread = threading.Thread(
     target=lambda: monitored_worker(retry_processor_worker, "retry_processor", restart_on_failure=True),
     daemon=True
@@ -4586,7 +6011,8 @@ if __name__ == "__main__":
 
         # Use waitress for production-ready WSGI server
         from waitress import serve
-        serve(app, host="0.0.0.0", port=8501)
+        # Status streams each hold a thread, so run more than waitress's default 4
+        serve(app, host="0.0.0.0", port=8501, threads=int(os.environ.get("WAITRESS_THREADS", "16")))
     except Exception as e:
         # UX Directive #3: Include last_action in crash reports
         logger.error(f"❌ Fatal error during {last_action}: {e}", exc_info=True)
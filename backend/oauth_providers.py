@@ -15,6 +15,8 @@ Privacy: Minimal scopes requested (name, email, phone where available).
 import requests
 import logging
 import os
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Configure logging per Rule 25
 LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(funcName)s | %(message)s"
@@ -35,6 +37,38 @@ if not logger.handlers:
     logger.addHandler(file_handler)
 
 
+def _build_http_session():
+    """
+    Build the shared HTTP session for provider APIs.
+
+    One pooled session keeps TCP+TLS connections to Google, Meta and X
+    alive between requests instead of handshaking on every call.
+    Failed connection attempts are retried twice, as are GETs answered
+    with a gateway error; a POST is never re-sent once it reached the
+    server. After the last retry the provider's response is returned.
+    """
+    session = requests.Session()
+    # pool_maxsize is per host: enough keep-alive connections to
+    # google.com for every request thread verifying reCAPTCHA at once
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.1,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared with app.py (reCAPTCHA and OAuth token exchange)
+http_session = _build_http_session()
+
+
 def get_user_info(provider, access_token):
     """
     Fetch user information from OAuth provider.
@@ -71,7 +105,7 @@ def _get_google_user_info(token):
     """Fetch user info from Google OAuth API."""
     logger.debug("Requesting Google user info")
     
-    response = requests.get(
+    response = http_session.get(
         "https://www.googleapis.com/oauth2/v3/userinfo",
         headers={"Authorization": f"Bearer {token}"},
         timeout=15
@@ -95,7 +129,7 @@ def _get_facebook_user_info(token):
     """Fetch user info from Facebook Graph API."""
     logger.debug("Requesting Facebook user info")
     
-    response = requests.get(
+    response = http_session.get(
         "https://graph.facebook.com/me",
         params={
             "fields": "name,email",
@@ -122,7 +156,7 @@ def _get_instagram_user_info(token):
     """Fetch user info from Instagram Basic Display API."""
     logger.debug("Requesting Instagram user info")
     
-    response = requests.get(
+    response = http_session.get(
         "https://graph.instagram.com/me",
         params={
             "fields": "username",
@@ -149,7 +183,7 @@ def _get_x_user_info(token):
     """Fetch user info from X.com (Twitter) API v2."""
     logger.debug("Requesting X.com user info")
     
-    response = requests.get(
+    response = http_session.get(
         "https://api.twitter.com/2/users/me",
         headers={"Authorization": f"Bearer {token}"},
         params={"user.fields": "name,username"},
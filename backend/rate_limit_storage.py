@@ -0,0 +1,120 @@
+"""
+Striped In-Memory Rate Limit Storage
+
+A fixed-window counter store for flask-limiter, registered under the
+memory-striped:// scheme. Keys are spread over STRIPES shards, each with
+its own lock, so concurrent requests from different clients rarely
+contend. Expired windows are evicted lazily on write; there is no timer
+thread.
+
+Only the fixed-window strategy is supported. Counts are per process, like
+memory://; use a shared store (e.g. redis://) to limit across workers.
+"""
+
+import threading
+import time
+from limits.storage import Storage
+
+STRIPES = 16
+# Expired windows are swept from a shard once it holds this many keys
+# (and again each time it doubles), keeping sweeps rare and amortized
+SWEEP_THRESHOLD = 1024
+
+
+class _Shard:
+    """One lock-guarded slice of the key space: key -> [count, expires_at]"""
+
+    __slots__ = ("lock", "windows", "sweep_at")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.windows = {}
+        self.sweep_at = SWEEP_THRESHOLD
+
+    def sweep(self, now):
+        """Drop expired windows; call with the lock held."""
+        expired = [key for key, window in self.windows.items() if window[1] <= now]
+        for key in expired:
+            del self.windows[key]
+        self.sweep_at = max(SWEEP_THRESHOLD, 2 * len(self.windows))
+
+
+class StripedMemoryStorage(Storage):
+    """
+    Fixed-window rate limit counters in lock-striped dicts.
+
+    Windows start at a key's first hit and last ``expiry`` seconds, as with
+    the stock memory:// storage.
+    """
+
+    STORAGE_SCHEME = ["memory-striped"]
+
+    def __init__(self, uri=None, wrap_exceptions=False, **options):
+        self._shards = tuple(_Shard() for _ in range(STRIPES))
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+    @property
+    def base_exceptions(self):
+        return ValueError
+
+    def _shard(self, key):
+        return self._shards[hash(key) & (STRIPES - 1)]
+
+    def incr(self, key, expiry, elastic_expiry=False, amount=1):
+        """
+        Increment the counter for key, starting a new window if it expired.
+
+        elastic_expiry is accepted for older limits releases, which pass it.
+        """
+        now = time.time()
+        shard = self._shard(key)
+        with shard.lock:
+            window = shard.windows.get(key)
+            if window is None or window[1] <= now:
+                if len(shard.windows) >= shard.sweep_at:
+                    shard.sweep(now)
+                window = shard.windows[key] = [0, now + expiry]
+            elif elastic_expiry:
+                window[1] = now + expiry
+            window[0] += amount
+            return window[0]
+
+    def decr(self, key, amount=1):
+        """Decrement the counter for key, never below zero."""
+        shard = self._shard(key)
+        with shard.lock:
+            window = shard.windows.get(key)
+            if window is None or window[1] <= time.time():
+                return 0
+            window[0] = max(window[0] - amount, 0)
+            return window[0]
+
+    def get(self, key):
+        """Current count for key; reads take no lock."""
+        window = self._shard(key).windows.get(key)
+        if window is None or window[1] <= time.time():
+            return 0
+        return window[0]
+
+    def get_expiry(self, key):
+        """Epoch time at which key's window resets."""
+        window = self._shard(key).windows.get(key)
+        return window[1] if window is not None else time.time()
+
+    def check(self):
+        return True
+
+    def reset(self):
+        """Clear every window; returns the number of keys removed."""
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                removed += len(shard.windows)
+                shard.windows.clear()
+                shard.sweep_at = SWEEP_THRESHOLD
+        return removed
+
+    def clear(self, key):
+        shard = self._shard(key)
+        with shard.lock:
+            shard.windows.pop(key, None)
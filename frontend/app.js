@@ -489,6 +489,50 @@ function clearStatus() {
   statusEl.textContent = '';
 }
 
+// Show a callback status update; returns true once the status is final
+function handleCallbackStatus(data) {
+  if (data.status === 'completed') {
+    showStatus('success', '✓ Callback completed! Check your phone.');
+  } else if (data.status === 'failed') {
+    showStatus('error', `Callback failed: ${data.message || 'Unknown error'}`);
+  } else if (data.status === 'sms_sent') {
+    showStatus('info', 'We missed you! Check your SMS for our contact details.');
+  } else {
+    return false;
+  }
+  return true;
+}
+
+// Follow callback status via server-sent events, falling back to polling
+function watchCallbackStatus(requestId) {
+  if (typeof EventSource === 'undefined') {
+    pollCallbackStatus(requestId);
+    return;
+  }
+
+  const source = new EventSource(`${CONFIG.BACKEND_URL}/status/${requestId}/stream`);
+  let done = false;
+
+  source.onmessage = (event) => {
+    const data = JSON.parse(event.data);
+    log('info', 'Status stream update', { requestId, status: data.status });
+    done = handleCallbackStatus(data);
+    if (done) {
+      source.close();
+    }
+  };
+
+  // Fires when the server ends the stream or refuses it (e.g. too many
+  // open streams); keep following the request by polling instead
+  source.onerror = () => {
+    source.close();
+    if (!done) {
+      log('info', 'Status stream closed, falling back to polling', { requestId });
+      pollCallbackStatus(requestId);
+    }
+  };
+}
+
 // Poll for callback status
 async function pollCallbackStatus(requestId, pollCount = 0) {
   if (pollCount >= CONFIG.MAX_POLLS) {
@@ -503,13 +547,7 @@ async function pollCallbackStatus(requestId, pollCount = 0) {
     
     log('info', 'Status poll result', { requestId, status: data.status, pollCount });
     
-    if (data.status === 'completed') {
-      showStatus('success', '✓ Callback completed! Check your phone.');
-    } else if (data.status === 'failed') {
-      showStatus('error', `Callback failed: ${data.message || 'Unknown error'}`);
-    } else if (data.status === 'sms_sent') {
-      showStatus('info', 'We missed you! Check your SMS for our contact details.');
-    } else {
+    if (!handleCallbackStatus(data)) {
       // Continue polling
       setTimeout(() => pollCallbackStatus(requestId, pollCount + 1), CONFIG.POLL_INTERVAL);
     }
@@ -802,8 +840,8 @@ async function initiateCallback(requestId) {
       transitionTo(AppState.CONNECTED);
       hideVerificationUI();
 
-      // Start polling for status updates
-      pollCallbackStatus(requestId);
+      // Follow status updates (streamed, or polled as a fallback)
+      watchCallbackStatus(requestId);
     } else {
       log('error', 'Failed to initiate callback', { error: data.error });
 
@@ -946,7 +984,27 @@ function showUnauthenticatedUI() {
 }
 
 // Handle OAuth redirect with user data
+// Current backends send ?token=<handle> (resolved in init() once the backend
+// URL is known); ?user=<base64 JSON> is still accepted from older backends
 const params = new URLSearchParams(window.location.search);
+
+async function loadOAuthUser(token) {
+  try {
+    const res = await fetch(`${CONFIG.BACKEND_URL}/oauth/userinfo?token=${encodeURIComponent(token)}`);
+    const data = await res.json();
+    if (data.success) {
+      saveUserSession(data.user);
+    } else {
+      log('error', 'OAuth user token rejected', { error: data.error });
+    }
+  } catch (error) {
+    log('error', 'Failed to load OAuth user data', { error: error.message });
+  }
+
+  // Clean URL without reloading
+  window.history.replaceState({}, document.title, window.location.pathname);
+}
+
 if (params.has("user")) {
   try {
     const userData = JSON.parse(atob(params.get("user")));
@@ -975,6 +1033,10 @@ if (logoutBtn) {
   log('info', 'Initializing callback form...');
   await detectBackend();
 
+  if (params.has("token")) {
+    await loadOAuthUser(params.get("token"));
+  }
+
   // Check for existing session
   const user = loadUserSession();
   if (user) {
@@ -0,0 +1,218 @@
+"""
+Asterisk AMI provider tests.
+
+AsteriskProvider keeps logged-in AMI sessions in a pool. These tests run
+a minimal fake AMI server to pin that sessions are reused across calls
+and that a stale pooled session is replaced transparently, and that
+concurrent calls are pipelined without mixing up their results.
+"""
+
+import pytest
+import sys
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import app
+
+
+class FakeAMIServer:
+    """Accepts AMI connections and answers Login, Originate, Ping and Logoff"""
+
+    def __init__(self):
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.bind(("127.0.0.1", 0))
+        self.listener.listen()
+        self.port = self.listener.getsockname()[1]
+        self.logins = 0
+        self.actions = []
+        self.connections = []
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.listener.accept()
+            except OSError:
+                return
+            self.connections.append(conn)
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        conn.sendall(b"Asterisk Call Manager/5.0\r\n")
+        buffer = b""
+        while True:
+            try:
+                chunk = conn.recv(4096)
+            except OSError:
+                return
+            if not chunk:
+                return
+            buffer += chunk
+            while b"\r\n\r\n" in buffer:
+                block, buffer = buffer.split(b"\r\n\r\n", 1)
+                fields = dict(line.split(": ", 1) for line in block.decode().split("\r\n") if ": " in line)
+                action = fields.get("Action")
+                self.actions.append(action)
+                if action == "Login":
+                    self.logins += 1
+                    conn.sendall(b"Response: Success\r\nMessage: Authentication accepted\r\n\r\n")
+                elif action == "Logoff":
+                    conn.close()
+                    return
+                else:
+                    reply = f"Response: Success\r\nActionID: {fields.get('ActionID')}\r\n\r\n"
+                    conn.sendall(reply.encode())
+
+    def drop_connections(self):
+        for conn in self.connections:
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            conn.close()
+        self.connections.clear()
+
+    def close(self):
+        self.listener.close()
+
+
+@pytest.fixture(autouse=True)
+def unlimited_daily_usage(monkeypatch):
+    """Keep these tests independent of today's shared daily_usage counters"""
+    monkeypatch.setattr(app, "reserve_daily_usage", lambda kind: (True, None))
+
+
+@pytest.fixture
+def server():
+    fake = FakeAMIServer()
+    yield fake
+    fake.close()
+
+
+@pytest.fixture
+def provider(server):
+    return app.AsteriskProvider("127.0.0.1", server.port, "user", "secret")
+
+
+class TestAMISessionPool:
+    """Test reuse and recovery of pooled AMI sessions"""
+
+    def test_calls_reuse_one_login(self, server, provider):
+        """Consecutive calls share a single logged-in session"""
+        for i in range(3):
+            result = provider.make_call("+12025550100", "+12025550123", f"req-{i}")
+            assert result == {'success': True, 'call_sid': f"callback_req-{i}", 'message': 'Call originated'}
+        assert server.logins == 1
+        assert server.actions.count("Originate") == 3
+
+    def test_stale_session_is_replaced(self, server, provider):
+        """A pooled session closed by Asterisk is dropped and the call still goes out"""
+        provider.make_call("+12025550100", "+12025550123", "req-a")
+        server.drop_connections()
+        result = provider.make_call("+12025550100", "+12025550123", "req-b")
+        assert result['success']
+        assert server.logins == 2
+
+    def test_unreachable_ami_fails_cleanly(self):
+        """With nothing listening the call fails without raising"""
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        result = app.AsteriskProvider("127.0.0.1", port, "user", "secret").make_call("+1", "+2", "req")
+        assert result == {'success': False, 'call_sid': None, 'message': 'AMI connection failed'}
+
+
+class TestAMIFraming:
+    """Test that AMI messages are framed on the blank line, not on reads"""
+
+    def test_split_and_coalesced_messages(self):
+        """A message split across writes and two messages in one write both parse"""
+        ours, theirs = socket.socketpair()
+        session = app.AMISession(ours)
+        theirs.sendall(b"Asterisk Call Manager/5.0\r\nResponse: Succ")
+        assert session.read_until(b"\r\n") == b"Asterisk Call Manager/5.0"
+        theirs.sendall(b"ess\r\nActionID: a\r")
+        theirs.sendall(b"\n\r\nResponse: Error\r\nMessage: No such channel\r\nActionID: b\r\n\r\n")
+
+        assert session.read_frame() == {"response": "Success", "actionid": "a"}
+        assert session.read_frame() == {"response": "Error", "message": "No such channel", "actionid": "b"}
+        session.close()
+        theirs.close()
+
+    def test_closed_connection_raises(self):
+        """EOF mid-message surfaces as a connection error"""
+        ours, theirs = socket.socketpair()
+        theirs.sendall(b"Response: Success\r\n")
+        theirs.close()
+        with pytest.raises(ConnectionAbortedError):
+            app.AMISession(ours).read_frame()
+        ours.close()
+
+    def test_deadline_bounds_trickled_response(self):
+        """A response that never completes times out at the deadline"""
+        ours, theirs = socket.socketpair()
+        session = app.AMISession(ours)
+        theirs.sendall(b"Response: Succ")
+        with pytest.raises(socket.timeout):
+            session.read_frame(app.time.monotonic() + 0.1)
+        session.close()
+        theirs.close()
+
+
+class TestOriginatePipelining:
+    """Test batched Originate actions over one session"""
+
+    def test_batch_results_follow_input_order(self, server, provider):
+        """Each call gets the result for its own ActionID"""
+        calls = [("+12025550100", "+12025550123", f"batch-{i}") for i in range(5)]
+        results = provider.originate_batch(calls)
+        assert [r['call_sid'] for r in results] == [f"callback_batch-{i}" for i in range(5)]
+        assert server.logins == 1
+
+    def test_concurrent_calls_all_complete(self, server, provider):
+        """Callers queued behind a batch in flight each get their own result"""
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(
+                lambda i: provider.make_call("+12025550100", "+12025550123", f"burst-{i}"),
+                range(20)
+            ))
+        assert [r['call_sid'] for r in results] == [f"callback_burst-{i}" for i in range(20)]
+        assert server.actions.count("Originate") == 20
+        assert not provider._batch_in_flight
+
+
+    def test_leader_returns_after_its_own_batch(self, provider):
+        """Each batch is sent by its oldest caller, who returns once it is answered"""
+        senders = []
+        followers = []
+
+        def originate_batch(calls):
+            senders.append((threading.current_thread(), [call[2] for call in calls]))
+            if len(senders) < 3:
+                # Another call arrives while this batch is in flight
+                follower = threading.Thread(
+                    target=provider.make_call, args=("+12025550100", "+12025550123", f"late-{len(senders)}")
+                )
+                followers.append(follower)
+                follower.start()
+                while not provider._pending_calls:
+                    app.time.sleep(0.001)
+            return [{'success': True, 'call_sid': f"callback_{call[2]}", 'message': 'Call originated'} for call in calls]
+
+        provider.originate_batch = originate_batch
+        result = provider.make_call("+12025550100", "+12025550123", "first")
+        assert result['call_sid'] == "callback_first"
+        for follower in followers:
+            follower.join(timeout=5)
+
+        assert [ids for _, ids in senders] == [["first"], ["late-1"], ["late-2"]]
+        assert [thread for thread, _ in senders] == [threading.current_thread()] + followers
+        assert not provider._batch_in_flight
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,49 @@
+"""
+Business hours tests.
+
+The business-hours settings are parsed once at import and the result of
+is_business_hours() is reused for a short window; these tests pin both.
+"""
+
+import pytest
+import sys
+import os
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import app
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(app, "_business_hours_cache", (0.0, None))
+
+
+class TestBusinessHours:
+    """Test business hours parsing and result caching"""
+
+    def test_settings_parsed_at_import(self):
+        """Timezone and window are resolved once, not per call"""
+        tz, start_time, end_time = app._business_hours
+        assert str(tz) == app.BUSINESS_TIMEZONE
+        assert start_time.strftime("%H:%M") == app.BUSINESS_HOURS_START
+
+    def test_result_cached_within_window(self, monkeypatch):
+        """Bursts within BUSINESS_HOURS_CACHE_SECONDS reuse one evaluation"""
+        calls = []
+        monkeypatch.setattr(app, "_check_business_hours",
+                            lambda: calls.append(1) or (True, "Within business hours"))
+        app.is_business_hours()
+        app.is_business_hours()
+        assert len(calls) == 1
+
+    def test_invalid_settings_fail_open(self, monkeypatch):
+        """Unparseable settings allow calls instead of raising"""
+        monkeypatch.setattr(app, "BUSINESS_HOURS_START", "nine")
+        monkeypatch.setattr(app, "_business_hours", app._parse_business_hours())
+        assert app.is_business_hours() == (True, "Business hours check unavailable")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,174 @@
+"""
+Callback dispatch tests.
+
+/initiate_callback hands provider API calls to a bounded worker pool.
+These tests pin that every dispatch outcome lands in the database and
+that a full queue degrades to inline dispatch instead of dropping work.
+"""
+
+import pytest
+import sys
+import os
+import threading
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import app
+
+
+class FakeProvider:
+    """Provider stub that records calls from any thread"""
+
+    def __init__(self):
+        self.calls = []
+        self.from_numbers = []
+        self.done = threading.Event()
+
+    def is_configured(self):
+        return True
+
+    def make_call(self, to_number, from_number, request_id):
+        self.calls.append((request_id, threading.current_thread().name))
+        self.from_numbers.append(from_number)
+        self.done.set()
+        return {"success": True, "call_sid": "CA-test"}
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    fake = FakeProvider()
+    monkeypatch.setattr(app, "callback_provider", fake)
+    monkeypatch.setattr(app, "BUSINESS_NUMBER", "+12025550100")
+    monkeypatch.setattr(app, "update_callback_status", lambda *a, **k: None)
+    return fake
+
+
+class TestCallbackDispatch:
+    """Test that provider calls run off the request thread"""
+
+    def test_dispatch_runs_on_pool(self, provider):
+        """Submitted jobs run on a callback-dispatch worker thread"""
+        app.submit_callback_dispatch("req-pool", "Visitor", "+12025550123", True, "Open")
+        assert provider.done.wait(5)
+        assert provider.calls[0][1].startswith("callback-dispatch")
+
+    def test_full_queue_dispatches_inline(self, provider, monkeypatch):
+        """With no free slots the call is made on the caller's thread"""
+        monkeypatch.setattr(app, "callback_dispatch_slots", threading.BoundedSemaphore(1))
+        app.callback_dispatch_slots.acquire()
+        app.submit_callback_dispatch("req-inline", "Visitor", "+12025550123", True, "Open")
+        assert provider.calls == [("req-inline", threading.current_thread().name)]
+
+
+class FakeMessages:
+    """Twilio messages stub that records the sending thread"""
+
+    def __init__(self):
+        self.sent = []
+        self.bodies = []
+        self.done = threading.Event()
+
+    def create(self, to, from_, body):
+        self.sent.append((to, threading.current_thread().name))
+        self.bodies.append(body)
+        if len(self.sent) == 2:
+            self.done.set()
+        return type("Message", (), {"sid": "SM-test"})()
+
+
+class TestMissedCallSms:
+    """Test that the final missed-call SMS leaves the webhook thread"""
+
+    def test_sms_sent_on_pool(self, monkeypatch):
+        """Both texts are sent from a callback-dispatch worker"""
+        messages = FakeMessages()
+        monkeypatch.setattr(app, "twilio_client", type("Client", (), {"messages": messages})())
+        monkeypatch.setattr(app, "BUSINESS_NUMBER", "+12025550100")
+
+        assert app.submit_pooled_job(app.send_missed_call_sms, "Visitor", "+12025550123")
+        assert messages.done.wait(5)
+        assert [to for to, _ in messages.sent] == ["+12025550100", "+12025550123"]
+        assert all(name.startswith("callback-dispatch") for _, name in messages.sent)
+
+    def test_sms_bodies(self, monkeypatch):
+        """The templates render the same texts as before"""
+        messages = FakeMessages()
+        monkeypatch.setattr(app, "twilio_client", type("Client", (), {"messages": messages})())
+
+        app.send_missed_call_sms(None, "+12025550123")
+        assert messages.bodies == [
+            "Missed callback from visitor at +12025550123. Please call back.",
+            "We missed you! Reply: VOICEMAIL to leave message, HELP for assistance, or CANCEL to stop.",
+        ]
+
+
+class TestProviderCapabilities:
+    """Test the provider capability flags resolved at boot"""
+
+    def test_flags_match_provider(self):
+        """The flags agree with the provider instantiated at import"""
+        assert app._PROVIDER_IS_TWILIO == isinstance(app.callback_provider, app.TwilioProvider)
+        assert app._PROVIDER_ASTERISK_USES_VISITOR == isinstance(app.callback_provider, app.AsteriskProvider)
+        if app._PROVIDER_IS_TWILIO:
+            assert app._PROVIDER_FROM_NUMBER == app.TWILIO_NUMBER
+
+    def test_asterisk_calls_from_visitor(self, provider, monkeypatch):
+        """Asterisk dispatch presents the visitor's number as caller ID"""
+        monkeypatch.setattr(app, "_PROVIDER_ASTERISK_USES_VISITOR", True)
+        app.dispatch_callback("req-asterisk", "Visitor", "+12025550123", True, "Open")
+        assert provider.from_numbers == ["+12025550123"]
+
+
+class TestConcurrencyGate:
+    """Test the in-process cap on provider requests in flight"""
+
+    def test_reject_when_full(self, monkeypatch):
+        """With "reject" a full gate fails at once and frees nothing"""
+        monkeypatch.setattr(app, "CONCURRENCY_OVERFLOW_ACTION", "reject")
+        sem = threading.BoundedSemaphore(1)
+        with app.concurrency_gate(sem, "calls"):
+            with pytest.raises(app.ConcurrencyLimitExceeded):
+                with app.concurrency_gate(sem, "calls"):
+                    pass
+        # The outer slot was released on exit
+        assert sem.acquire(blocking=False)
+
+    def test_queue_waits_for_slot(self, monkeypatch):
+        """With "queue" a caller waits for a slot freed by another thread"""
+        monkeypatch.setattr(app, "CONCURRENCY_OVERFLOW_ACTION", "queue")
+        sem = threading.BoundedSemaphore(1)
+        sem.acquire()
+        threading.Timer(0.05, sem.release).start()
+        with app.concurrency_gate(sem, "sms"):
+            pass
+        assert sem.acquire(blocking=False)
+
+    def test_slot_released_on_error(self):
+        """An exception inside the gate still returns the slot"""
+        sem = threading.BoundedSemaphore(1)
+        with pytest.raises(RuntimeError):
+            with app.concurrency_gate(sem, "calls"):
+                raise RuntimeError("boom")
+        assert sem.acquire(blocking=False)
+
+
+class TestStartupConfig:
+    """Test routing settings parsed once at startup"""
+
+    def test_vip_numbers_get_high_priority(self, monkeypatch):
+        """determine_priority() checks the pre-parsed VIP set"""
+        monkeypatch.setattr(app, "VIP_PHONE_NUMBERS", frozenset({"+15551230000"}))
+        assert app.determine_priority("+15551230000") == app.PRIORITY_HIGH
+        assert app.determine_priority("+15551239999") == app.PRIORITY_DEFAULT
+
+    def test_escalation_targets_follow_chain(self, monkeypatch):
+        """Levels past the primary number index into the parsed chain"""
+        monkeypatch.setattr(app, "ESCALATION_CHAIN", ("+15550000001", "+15550000002"))
+        assert app.get_escalation_target(0) == app.BUSINESS_NUMBER
+        assert app.get_escalation_target(2) == "+15550000002"
+        assert app.get_escalation_target(3) is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,72 @@
+"""
+Setup wizard configuration tests.
+
+/api/configure renders ENV_TEMPLATE and writes it to ENV_PATH; these
+tests pin the written file and the input validation.
+"""
+
+import pytest
+import sys
+import os
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import app
+
+
+CONFIG = {
+    "TWILIO_SID": "AC" + "0" * 32,
+    "TWILIO_AUTH_TOKEN": "token$with$dollars",
+    "TWILIO_NUMBER": "+12025550100",
+    "BUSINESS_NUMBER": "+12025550101",
+    "FRONTEND_URL": "https://callback.example.com",
+}
+
+
+@pytest.fixture
+def env_path(monkeypatch, tmp_path):
+    path = tmp_path / ".env"
+    monkeypatch.setattr(app, "ENV_PATH", path)
+    return path
+
+
+@pytest.fixture
+def client():
+    return app.app.test_client()
+
+
+class TestConfigure:
+    """Test that the setup wizard writes a complete .env file"""
+
+    def test_env_file_written(self, client, env_path):
+        """Submitted values land in the .env file verbatim"""
+        res = client.post("/api/configure", json=CONFIG)
+        assert res.status_code == 200
+        assert res.get_json()["env_path"] == str(env_path)
+
+        content = env_path.read_text()
+        assert "TWILIO_AUTH_TOKEN=token$with$dollars\n" in content
+        assert "ALLOWED_ORIGINS=https://callback.example.com\n" in content
+        assert f"RECAPTCHA_SECRET={app.RECAPTCHA_TEST_SECRET}\n" in content
+
+    def test_env_file_is_utf8(self, client, env_path):
+        """Non-ASCII values are written as UTF-8 whatever the locale"""
+        res = client.post("/api/configure", json=dict(CONFIG, TWILIO_AUTH_TOKEN="tökén"))
+        assert res.status_code == 200
+        assert "TWILIO_AUTH_TOKEN=tökén\n" in env_path.read_bytes().decode("utf-8")
+
+    def test_invalid_sid_rejected(self, client, env_path):
+        """A malformed Account SID is rejected before anything is written"""
+        res = client.post("/api/configure", json=dict(CONFIG, TWILIO_SID="nope"))
+        assert res.status_code == 400
+        assert not env_path.exists()
+
+    def test_env_path_is_project_root(self):
+        """The default path is the .env next to backend/"""
+        root = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+        assert str(app.ENV_PATH) == os.path.join(root, ".env")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
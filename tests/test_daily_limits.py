@@ -0,0 +1,120 @@
+"""
+Daily cost limit tests.
+
+Provider placements reserve a unit of today's call/SMS budget in the
+daily_usage table, atomically against the cap, and give it back if the
+placement fails; check_daily_limits() reads today's counter row.
+"""
+
+import pytest
+import sys
+import os
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import app
+
+
+class FakeProvider:
+    """Provider stub whose placements all succeed or all fail"""
+
+    def __init__(self, success):
+        self.success = success
+        self.placed = 0
+
+    @app.counts_against_daily_limit("calls", "call_sid")
+    def make_call(self):
+        self.placed += 1
+        return {'success': self.success, 'call_sid': "CA1" if self.success else None, 'message': ''}
+
+    @app.counts_against_daily_limit("sms", "sms_sid")
+    def send_sms(self):
+        self.placed += 1
+        return {'success': self.success, 'sms_sid': "SM1" if self.success else None, 'message': ''}
+
+
+def today_usage():
+    conn = app.get_db_connection()
+    row = conn.execute(
+        "SELECT calls, sms FROM daily_usage WHERE day = ?",
+        (datetime.utcnow().date().isoformat(),)
+    ).fetchone()
+    conn.close()
+    return row or (0, 0)
+
+
+class TestDailyUsageCounters:
+    """Test that call/SMS placements drive the daily limit check"""
+
+    def test_placed_calls_and_sms_are_counted(self, monkeypatch):
+        """Successful placements bump today's counters; failed ones are given back"""
+        calls, sms = today_usage()
+        monkeypatch.setattr(app, "MAX_CALLS_PER_DAY", calls + 10)
+        monkeypatch.setattr(app, "MAX_SMS_PER_DAY", sms + 10)
+        assert FakeProvider(True).make_call()['success']
+        assert FakeProvider(True).send_sms()['success']
+        assert not FakeProvider(False).make_call()['success']
+        assert today_usage() == (calls + 1, sms + 1)
+
+    def test_status_updates_do_not_count(self):
+        """Recording a SID no longer counts it a second time"""
+        usage = today_usage()
+        app.update_callback_status("limits-test", "calling", "Calling business", call_sid="CA1")
+        assert today_usage() == usage
+
+    def test_limit_reached_blocks(self, monkeypatch):
+        """Reaching MAX_CALLS_PER_DAY makes the check fail"""
+        calls, _ = today_usage()
+        monkeypatch.setattr(app, "MAX_CALLS_PER_DAY", calls)
+        within_limits, message, stats = app.check_daily_limits()
+        assert not within_limits
+        assert stats['calls_24h'] == calls
+
+
+    def test_cap_blocks_placement(self, monkeypatch):
+        """At the cap the provider is never contacted"""
+        calls, _ = today_usage()
+        monkeypatch.setattr(app, "MAX_CALLS_PER_DAY", calls)
+        provider = FakeProvider(True)
+        result = provider.make_call()
+        assert result == {'success': False, 'call_sid': None,
+                          'message': "Daily call limit reached. Please try again tomorrow."}
+        assert provider.placed == 0
+
+    def test_concurrent_reservations_stop_at_cap(self, monkeypatch):
+        """Increment and cap comparison are one statement, so no overshoot"""
+        _, sms = today_usage()
+        monkeypatch.setattr(app, "MAX_SMS_PER_DAY", sms + 5)
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            reserved = list(pool.map(lambda _: app.reserve_daily_usage("sms")[0], range(20)))
+        assert reserved.count(True) == 5
+        assert today_usage()[1] == sms + 5
+
+
+class TestDailyUsageSeeding:
+    """Test that a mid-day upgrade counts what was already placed today"""
+
+    def test_new_table_seeded_from_callbacks(self, monkeypatch, tmp_path):
+        """Today's calls and SMS in callbacks seed the first counter row"""
+        monkeypatch.setattr(app, "DATABASE_PATH", str(tmp_path / "upgrade.db"))
+        app.init_database()
+        now = app.utc_now().isoformat()
+        rows = [("a", "completed", None, now), ("b", "calling", "SM1", now),
+                ("c", "failed", "SM2", now), ("d", "completed", "SM3", "2000-01-01T00:00:00")]
+        with app.get_db_connection() as conn:
+            conn.execute("DROP TABLE daily_usage")
+            conn.executemany(
+                "INSERT INTO callbacks (request_id, visitor_phone, request_status, sms_sid, created_at, updated_at) "
+                "VALUES (?, '+12025550123', ?, ?, ?, ?)",
+                [row + (row[3],) for row in rows]
+            )
+
+        app.init_database()
+        assert today_usage() == (2, 2)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,286 @@
+"""
+Database connection pool tests.
+
+These tests pin the checkout/release contract of get_db_connection() so
+that callers can keep the plain connect/commit/close pattern.
+"""
+
+import pytest
+import sys
+import os
+import json
+import sqlite3
+from datetime import datetime
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import app
+
+
+class TestConnectionPool:
+    """Test that pooled connections are reused safely"""
+
+    def test_released_connection_is_reused(self):
+        """close() returns the connection to the thread's pool"""
+        conn = app.get_db_connection()
+        conn.close()
+        assert app.get_db_connection() is conn
+
+    def test_nested_checkouts_get_distinct_connections(self):
+        """A nested caller must not share the outer caller's transaction"""
+        outer = app.get_db_connection()
+        inner = app.get_db_connection()
+        assert outer is not inner
+        inner.close()
+        outer.close()
+
+    def test_release_rolls_back_uncommitted_work(self):
+        """Uncommitted writes are discarded when the connection is released"""
+        conn = app.get_db_connection()
+        conn.execute(
+            "INSERT INTO audit_log (request_id, event_type, timestamp) VALUES (?, ?, ?)",
+            ("pool-test", "uncommitted", "2026-01-01T00:00:00"),
+        )
+        conn.close()
+
+        conn = app.get_db_connection()
+        count = conn.execute(
+            "SELECT COUNT(*) FROM audit_log WHERE request_id = 'pool-test'"
+        ).fetchone()[0]
+        conn.close()
+        assert count == 0
+
+    def test_context_manager_commits_and_releases(self):
+        """A with-block commits on success, rolls back on error, then releases"""
+        with app.get_db_connection() as conn:
+            conn.execute(
+                "INSERT INTO audit_log (request_id, event_type, timestamp) VALUES (?, ?, ?)",
+                ("pool-with", "committed", "2026-01-01T00:00:00"),
+            )
+        assert app.get_db_connection() is conn
+        conn.close()
+
+        with pytest.raises(RuntimeError):
+            with app.get_db_connection() as conn:
+                conn.execute(
+                    "INSERT INTO audit_log (request_id, event_type, timestamp) VALUES (?, ?, ?)",
+                    ("pool-with", "rolled-back", "2026-01-01T00:00:00"),
+                )
+                raise RuntimeError("boom")
+
+        with app.get_db_connection() as conn:
+            events = conn.execute(
+                "SELECT event_type FROM audit_log WHERE request_id = 'pool-with'"
+            ).fetchall()
+            conn.execute("DELETE FROM audit_log WHERE request_id = 'pool-with'")
+        assert events == [("committed",)]
+
+    def test_release_resets_row_factory(self):
+        """A row_factory set by one caller must not leak to the next"""
+        conn = app.get_db_connection()
+        conn.row_factory = app.sqlite3.Row
+        conn.close()
+        assert app.get_db_connection().row_factory is None
+
+    def test_connections_use_wal(self):
+        """New connections are tuned with the SQLITE_PRAGMAS settings"""
+        conn = app.get_db_connection()
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+        finally:
+            conn.close()
+
+    def test_double_close_is_harmless(self):
+        """Closing twice must not put the connection in the pool twice"""
+        conn = app.get_db_connection()
+        conn.close()
+        conn.close()
+        first = app.get_db_connection()
+        second = app.get_db_connection()
+        assert first is not second
+        first.close()
+        second.close()
+
+    def test_released_connection_refuses_use(self):
+        """Queries on a released handle fail loudly, even via an old cursor"""
+        conn = app.get_db_connection()
+        cursor = conn.cursor()
+        conn.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            cursor.execute("SELECT 1")
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.commit()
+
+        reused = app.get_db_connection()
+        assert reused is conn
+        assert reused.execute("SELECT 1").fetchone() == (1,)
+        reused.close()
+
+    def test_writes_begin_immediate(self):
+        """Implicit write transactions take the write lock up front"""
+        statements = []
+        with app.get_db_connection() as conn:
+            conn.set_trace_callback(statements.append)
+            conn.execute("DELETE FROM audit_log WHERE request_id = 'pool-immediate'")
+            conn.set_trace_callback(None)
+        assert "BEGIN IMMEDIATE" in statements
+
+    def test_read_connections_are_pooled_and_read_only(self):
+        """Reader connections come from their own pool and refuse writes"""
+        reader = app.get_db_read_connection()
+        try:
+            assert reader.execute("SELECT COUNT(*) FROM callbacks").fetchone()[0] >= 0
+            with pytest.raises(sqlite3.OperationalError):
+                reader.execute("DELETE FROM audit_log WHERE request_id = 'pool-ro'")
+        finally:
+            reader.close()
+
+        writer = app.get_db_connection()
+        assert writer is not reader
+        writer.close()
+        assert app.get_db_read_connection() is reader
+        reader.close()
+
+
+
+class TestAuditWriteBehind:
+    """Test that queued audit events reach the database"""
+
+    def test_flush_writes_queued_events(self):
+        """flush_audit_log() persists every queued event"""
+        for i in range(3):
+            app.log_audit_event("audit-test", "queued_event", {"n": i})
+        app.flush_audit_log()
+
+        conn = app.get_db_connection()
+        count = conn.execute(
+            "SELECT COUNT(*) FROM audit_log WHERE request_id = 'audit-test'"
+        ).fetchone()[0]
+        conn.execute("DELETE FROM audit_log WHERE request_id = 'audit-test'")
+        conn.commit()
+        conn.close()
+        assert count == 3
+
+    def test_event_data_round_trips(self):
+        """Encoded event_data decodes back to the logged dict"""
+        row = app.audit_row("audit-json", "event", {"status": "calling", "attempt": 2}, "ts")
+        assert json.loads(row[2]) == {"status": "calling", "attempt": 2}
+        assert app.audit_row("audit-json", "event")[2] is None
+
+
+class TestQueryPlans:
+    """Test that hot lookups are served by an index"""
+
+    def test_duplicate_check_uses_composite_index(self):
+        """The duplicate check is a range scan with no separate sort"""
+        with app.get_db_connection() as conn:
+            plan = conn.execute("""
+                EXPLAIN QUERY PLAN
+                SELECT request_id, request_status, created_at_ts
+                FROM callbacks
+                WHERE visitor_phone = ?
+                AND created_at_ts > ?
+                AND request_status IN ('pending', 'calling', 'connected', 'verified')
+                ORDER BY created_at_ts DESC
+                LIMIT 1
+            """, ("+12025550123", 0)).fetchall()
+        details = " ".join(row[3] for row in plan)
+        assert "idx_callbacks_phone_created_ts_status" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_fingerprint_count_uses_covering_index(self):
+        """The 24h fingerprint count never touches the table rows"""
+        with app.get_db_connection() as conn:
+            plan = conn.execute("""
+                EXPLAIN QUERY PLAN
+                SELECT COUNT(*) FROM callbacks
+                WHERE fingerprint = ? AND created_at_ts > ?
+            """, ("fp", 0)).fetchall()
+        details = " ".join(row[3] for row in plan)
+        assert "COVERING INDEX idx_callbacks_fingerprint_created_ts" in details
+
+
+class TestCreatedAtTimestamp:
+    """Test the integer created_at_ts column used for window cutoffs"""
+
+    def test_epoch_us_matches_sql_conversion(self):
+        """Python and SQLite agree on the epoch value of a created_at"""
+        created_at = datetime(2026, 3, 1, 12, 30, 45, 123456)
+        with app.get_db_connection() as conn:
+            sql_value = conn.execute(
+                "SELECT " + app.CREATED_AT_TS_SQL.format(column="?"),
+                (created_at.isoformat(),)
+            ).fetchone()[0]
+        assert app.epoch_us(created_at) == 1772368245123456
+        assert abs(sql_value - app.epoch_us(created_at)) < 1000
+
+    def test_insert_without_timestamp_is_filled(self):
+        """Rows written without created_at_ts get it from created_at"""
+        created_at = datetime(2026, 3, 1, 12, 0, 0)
+        with app.get_db_connection() as conn:
+            conn.execute(
+                "INSERT INTO callbacks (request_id, visitor_phone, request_status, created_at, updated_at) "
+                "VALUES ('ts-test', '+12025550123', 'cancelled', ?, ?)",
+                (created_at.isoformat(), created_at.isoformat())
+            )
+        with app.get_db_connection() as conn:
+            value = conn.execute(
+                "SELECT created_at_ts FROM callbacks WHERE request_id = 'ts-test'"
+            ).fetchone()[0]
+            conn.execute("DELETE FROM callbacks WHERE request_id = 'ts-test'")
+        assert abs(value - app.epoch_us(created_at)) < 1000
+
+
+class TestMigration:
+    """Test upgrading a database created by the first release"""
+
+    def test_legacy_schema_is_upgraded_in_one_commit(self, monkeypatch, tmp_path):
+        """All missing columns are added together and existing rows backfilled"""
+        path = str(tmp_path / "legacy.db")
+        legacy = sqlite3.connect(path)
+        legacy.execute("""
+            CREATE TABLE callbacks (
+                request_id TEXT PRIMARY KEY, visitor_name TEXT, visitor_email TEXT,
+                visitor_phone TEXT NOT NULL, request_status TEXT NOT NULL,
+                status_message TEXT, created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL, call_sid TEXT, sms_sid TEXT
+            )
+        """)
+        legacy.execute(
+            "INSERT INTO callbacks (request_id, visitor_phone, request_status, created_at, updated_at) "
+            "VALUES ('old', '+12025550123', 'completed', '2026-01-01T00:00:00', '2026-01-01T00:00:00')"
+        )
+        legacy.commit()
+        legacy.close()
+
+        statements = []
+        monkeypatch.setattr(app, "DATABASE_PATH", path)
+        original_connect = app.get_db_connection
+
+        def traced_connection():
+            conn = original_connect()
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        monkeypatch.setattr(app, "get_db_connection", traced_connection)
+        app.migrate_database()
+        monkeypatch.setattr(app, "get_db_connection", original_connect)
+
+        with app.get_db_connection() as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(callbacks)")}
+            created_at_ts = conn.execute(
+                "SELECT created_at_ts FROM callbacks WHERE request_id = 'old'"
+            ).fetchone()[0]
+            conn.set_trace_callback(None)
+        assert {name for name, _ in app.CALLBACK_MIGRATION_COLUMNS} <= columns
+        assert created_at_ts == app.epoch_us(datetime(2026, 1, 1))
+        assert sum(1 for sql in statements if sql.strip() == "COMMIT") == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
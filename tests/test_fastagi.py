@@ -0,0 +1,84 @@
+"""
+FastAGI server tests.
+
+The dialplan reaches callback_handler.py over AGI-over-TCP. These tests
+act as Asterisk on a loopback connection: send the agi_* environment
+block, answer each command, and pin that the call flow reads its
+dialplan arguments and drives the call over the socket.
+"""
+
+import pytest
+import sys
+import os
+import socket
+import threading
+
+# Add AGI script directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'asterisk', 'agi-bin'))
+
+import callback_handler
+
+
+AGI_ENV = (
+    "agi_network: yes\n"
+    "agi_request: agi://fastagi:4573\n"
+    "agi_channel: PJSIP/twilio-trunk-00000001\n"
+    "agi_arg_1: +15551230000\n"
+    "agi_arg_2: +15557654321\n"
+    "\n"
+)
+
+
+@pytest.fixture
+def server():
+    """FastAGI server on an ephemeral loopback port"""
+    server = callback_handler.FastAGIServer(("127.0.0.1", 0), callback_handler.FastAGIRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def run_call(server):
+    """Play Asterisk for one call; return the commands the script sent"""
+    commands = []
+    with socket.create_connection(server.server_address, timeout=5) as sock:
+        stream = sock.makefile("rw", encoding="utf-8", newline="\n")
+        stream.write(AGI_ENV)
+        stream.flush()
+        for line in stream:
+            commands.append(line.rstrip("\n"))
+            stream.write("200 result=0\n")
+            stream.flush()
+            if line.startswith("HANGUP"):
+                break
+    return commands
+
+
+class TestFastAGIServer:
+    """Test one call over a FastAGI connection"""
+
+    def test_call_flow_over_socket(self, server, caplog):
+        """Arguments come from agi_arg_1/2; ANSWER, STREAM FILE, HANGUP go to the socket"""
+        callback_handler.logger.propagate = True
+        try:
+            with caplog.at_level("INFO", logger=callback_handler.logger.name):
+                commands = run_call(server)
+        finally:
+            callback_handler.logger.propagate = False
+
+        assert commands[0] == "ANSWER"
+        assert commands[1].startswith("STREAM FILE beep")
+        assert commands[-1] == "HANGUP"
+        assert "Destination: +15551230000, CallerID: +15557654321" in caplog.text
+
+    def test_server_survives_broken_call(self, server):
+        """A connection dropped mid-call does not stop the next call"""
+        with socket.create_connection(server.server_address, timeout=5) as sock:
+            sock.sendall(AGI_ENV.encode("utf-8"))
+        assert run_call(server)[-1] == "HANGUP"
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
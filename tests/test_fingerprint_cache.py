@@ -0,0 +1,134 @@
+"""
+Fingerprint abuse cache tests.
+
+check_fingerprint_abuse() caches 24h counts per fingerprint so repeat
+offenders are rejected without a query; storing a request drops the
+entry so the next check sees the new row.
+"""
+
+import pytest
+import sys
+import os
+from datetime import datetime
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import app
+
+FINGERPRINT = "fp-cache-test"
+
+
+def store_request(request_id):
+    now_iso = datetime.utcnow().isoformat()
+    with app.get_db_connection() as conn:
+        conn.execute(
+            "INSERT INTO callbacks (request_id, visitor_phone, request_status, created_at, updated_at, fingerprint) "
+            "VALUES (?, '+12025550123', 'pending', ?, ?, ?)",
+            (request_id, now_iso, now_iso, FINGERPRINT)
+        )
+    app.forget_fingerprint_count(FINGERPRINT)
+
+
+@pytest.fixture(autouse=True)
+def clean():
+    app._fingerprint_cache.clear()
+    yield
+    with app.get_db_connection() as conn:
+        conn.execute("DELETE FROM callbacks WHERE fingerprint = ?", (FINGERPRINT,))
+    app._fingerprint_cache.clear()
+
+
+class TestFingerprintCache:
+    """Test that cached counts block repeat offenders and stay current"""
+
+    def test_blocked_fingerprint_skips_database(self, monkeypatch):
+        """Once over the limit, retries are rejected from the cache"""
+        store_request("fp-1")
+        assert app.check_fingerprint_abuse(FINGERPRINT, max_requests_per_day=1)[0]
+
+        monkeypatch.setattr(app, "get_db_connection", lambda: pytest.fail("database queried"))
+        assert app.check_fingerprint_abuse(FINGERPRINT, max_requests_per_day=1)[0]
+
+    def test_stored_request_refreshes_count(self):
+        """A stored request invalidates the cached count"""
+        assert app.check_fingerprint_abuse(FINGERPRINT, max_requests_per_day=1) == (False, "", 0)
+        store_request("fp-2")
+        assert app.check_fingerprint_abuse(FINGERPRINT, max_requests_per_day=1)[0]
+
+    def test_expired_count_is_reread(self, monkeypatch):
+        """Entries older than the TTL are counted again"""
+        app.check_fingerprint_abuse(FINGERPRINT)
+        with app.get_db_connection() as conn:
+            conn.execute(
+                "INSERT INTO callbacks (request_id, visitor_phone, request_status, created_at, updated_at, fingerprint) "
+                "VALUES ('fp-3', '+12025550123', 'pending', ?, ?, ?)",
+                (datetime.utcnow().isoformat(), datetime.utcnow().isoformat(), FINGERPRINT)
+            )
+        monkeypatch.setattr(app, "FINGERPRINT_CACHE_TTL_SECONDS", 0)
+        assert app.check_fingerprint_abuse(FINGERPRINT)[2] == 1
+
+
+class TestRequestLimits:
+    """Test the combined daily-limit and fingerprint check"""
+
+    def test_single_query_matches_separate_checks(self, monkeypatch):
+        """Both results equal the individual checks, from one statement"""
+        store_request("fp-4")
+        statements = []
+        original = app.get_db_read_connection
+
+        def traced():
+            conn = original()
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        monkeypatch.setattr(app, "get_db_read_connection", traced)
+        limits, abuse = app.check_request_limits(FINGERPRINT, max_requests_per_day=1)
+        monkeypatch.setattr(app, "get_db_read_connection", original)
+        with original() as conn:
+            conn.set_trace_callback(None)
+
+        assert sum(1 for sql in statements if "SELECT" in sql) == 1
+        assert abuse == app.check_fingerprint_abuse(FINGERPRINT, max_requests_per_day=1)
+        assert limits[0] == app.check_daily_limits()[0]
+        assert abuse[0] and abuse[2] == 1
+
+    def test_cached_count_skips_fingerprint_query(self, monkeypatch):
+        """A cached fingerprint count is used instead of re-counting"""
+        app.check_fingerprint_abuse(FINGERPRINT)
+        monkeypatch.setattr(app, "REQUEST_LIMITS_SQL", None)
+        assert app.check_request_limits(FINGERPRINT)[1] == (False, "", 0)
+
+
+class TestBulkFingerprints:
+    """Test bulk fingerprinting and the legacy fingerprint migration"""
+
+    def test_bulk_matches_single(self):
+        """Bulk results equal per-row fingerprints, in order"""
+        rows = [("203.0.113.7", "Mozilla/5.0", "+12025550123"),
+                (None, "curl/8.0 \u00e9", "+447700900123")]
+        expected = [app.generate_request_fingerprint(*row) for row in rows]
+        assert app.generate_request_fingerprints_bulk(rows) == expected
+
+    def test_migration_recomputes_sha256_fingerprints(self):
+        """Rows with 64-character digests are re-keyed on migration"""
+        now_iso = datetime.utcnow().isoformat()
+        with app.get_db_connection() as conn:
+            conn.execute(
+                "INSERT INTO callbacks (request_id, visitor_phone, request_status, created_at, "
+                "updated_at, ip_address, user_agent, fingerprint) "
+                "VALUES ('fp-legacy', '+12025550123', 'pending', ?, ?, '203.0.113.7', 'UA', ?)",
+                (now_iso, now_iso, "a" * 64)
+            )
+        app.migrate_database()
+        with app.get_db_connection() as conn:
+            fingerprint = conn.execute(
+                "SELECT fingerprint FROM callbacks WHERE request_id = 'fp-legacy'"
+            ).fetchone()[0]
+            conn.execute("DELETE FROM callbacks WHERE request_id = 'fp-legacy'")
+        assert fingerprint == app.generate_request_fingerprint("203.0.113.7", "UA", "+12025550123")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
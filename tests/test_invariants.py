@@ -8,6 +8,7 @@ If any invariant breaks, CI will fail and prevent merge.
 import pytest
 import sys
 import os
+import ast
 
 # Add backend directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
@@ -79,6 +80,65 @@ class TestErrorTierInvariants:
             f"Error tier invariant violated: Expected {expected_tiers}, got {actual_tiers}"
 
 
+class TestImportInvariants:
+    """Test that request-path code never imports inside functions"""
+
+    # Startup-only imports that are deliberately deferred
+    ALLOWED_LOCAL_IMPORTS = {"waitress"}
+
+    def test_backend_imports_are_module_level(self):
+        """Every backend import sits in the module's top-level import block"""
+        backend = os.path.join(os.path.dirname(__file__), '..', 'backend')
+        offenders = []
+        for name in ("app.py", "oauth_providers.py"):
+            with open(os.path.join(backend, name)) as f:
+                tree = ast.parse(f.read())
+            for func in ast.walk(tree):
+                if not isinstance(func, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    continue
+                for node in ast.walk(func):
+                    if isinstance(node, ast.Import):
+                        modules = [alias.name for alias in node.names]
+                    elif isinstance(node, ast.ImportFrom):
+                        modules = [node.module]
+                    else:
+                        continue
+                    for module in modules:
+                        if module.split('.')[0] not in self.ALLOWED_LOCAL_IMPORTS:
+                            offenders.append(f"{name}:{node.lineno} {module}")
+
+        assert not offenders, \
+            f"Import invariant violated: function-local imports {offenders}"
+
+
+class TestLoggingInvariants:
+    """Test that hot request handlers log with lazy %-formatting"""
+
+    HOT_HANDLERS = {"request_callback", "oauth_login", "oauth_callback", "twilio_status_callback"}
+
+    def test_hot_handlers_avoid_fstring_logging(self):
+        """Logger calls in hot handlers pass arguments instead of f-strings"""
+        backend = os.path.join(os.path.dirname(__file__), '..', 'backend')
+        with open(os.path.join(backend, "app.py")) as f:
+            tree = ast.parse(f.read())
+
+        offenders = []
+        for func in ast.walk(tree):
+            if not isinstance(func, ast.FunctionDef) or func.name not in self.HOT_HANDLERS:
+                continue
+            for node in ast.walk(func):
+                if (isinstance(node, ast.Call)
+                        and isinstance(node.func, ast.Attribute)
+                        and isinstance(node.func.value, ast.Name)
+                        and node.func.value.id == "logger"
+                        and node.args
+                        and isinstance(node.args[0], ast.JoinedStr)):
+                    offenders.append(f"{func.name}:{node.lineno}")
+
+        assert not offenders, \
+            f"Logging invariant violated: f-string log messages at {offenders}"
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
 
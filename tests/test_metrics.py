@@ -0,0 +1,72 @@
+"""
+Prometheus metrics tests.
+
+Label values that come from data or configuration go through
+safe_labels(), which maps anything outside METRIC_LABEL_VALUES to
+"other" so the number of time series stays bounded. /metrics itself is
+exempt from rate limiting and can be restricted to scrape networks.
+"""
+
+import pytest
+import sys
+import os
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import app
+from prometheus_client import REGISTRY
+
+
+def sample(metric_name, **labels):
+    return REGISTRY.get_sample_value(metric_name, labels) or 0
+
+
+class TestSafeLabels:
+    """Test that unknown label values collapse into "other\""""
+
+    def test_allowed_value_kept(self):
+        """Allowlisted values are recorded as given"""
+        before = sample("callback_requests_by_priority_total", priority="high")
+        app.safe_labels(app.callback_requests_by_priority, priority="high").inc()
+        assert sample("callback_requests_by_priority_total", priority="high") == before + 1
+
+    def test_unknown_value_becomes_other(self):
+        """A value outside the allowlist never creates its own series"""
+        before = sample("concurrency_limit_hits_total", type="calls", action="other")
+        app.safe_labels(app.concurrency_limit_hits_total, type="calls", action="drop-everything").inc()
+        assert sample("concurrency_limit_hits_total", type="calls", action="other") == before + 1
+        assert sample("concurrency_limit_hits_total", type="calls", action="drop-everything") == 0
+
+    def test_unlisted_labels_pass_through(self):
+        """Labels without an allowlist keep their literal values"""
+        assert "type" not in app.METRIC_LABEL_VALUES
+        child = app.safe_labels(app.concurrency_limit_hits_total, type="sms", action="queue")
+        assert child is app.concurrency_limit_hits_total.labels(type="sms", action="queue")
+
+
+class TestMetricsEndpoint:
+    """Test scrape access to /metrics"""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setattr(app, "ADMIN_API_TOKEN", "scrape-token")
+        return app.app.test_client()
+
+    def scrape(self, client, remote_addr="127.0.0.1"):
+        return client.get("/metrics", headers={"Authorization": "Bearer scrape-token"},
+                          environ_base={"REMOTE_ADDR": remote_addr})
+
+    def test_scrapes_are_not_rate_limited(self, client):
+        """More scrapes than the default hourly limit all succeed"""
+        assert all(self.scrape(client).status_code == 200 for _ in range(60))
+
+    def test_scrape_cidrs_enforced(self, client, monkeypatch):
+        """With ALLOWED_SCRAPE_CIDRS set, other addresses are refused"""
+        monkeypatch.setattr(app, "ALLOWED_SCRAPE_CIDRS", (app.ipaddress.ip_network("10.0.0.0/8"),))
+        assert self.scrape(client, "10.1.2.3").status_code == 200
+        assert self.scrape(client, "203.0.113.7").status_code == 403
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,98 @@
+"""
+OAuth user handle tests.
+
+The OAuth callback redirects with a short random handle instead of the
+base64-encoded profile; /oauth/userinfo resolves the handle.
+"""
+
+import pytest
+import sys
+import os
+from urllib.parse import parse_qs, urlparse
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import app
+
+
+@pytest.fixture
+def client():
+    return app.app.test_client()
+
+
+class TestOAuthUserHandles:
+    """Test issuing and resolving OAuth user handles"""
+
+    def test_handle_resolves_to_user(self, client):
+        """A fresh handle returns the stored profile"""
+        handle = app.issue_oauth_user_handle({"name": "Ada", "email": "ada@example.com"})
+        res = client.get(f"/oauth/userinfo?token={handle}")
+        assert res.status_code == 200
+        assert res.get_json()["user"]["name"] == "Ada"
+
+    def test_unknown_handle_is_rejected(self, client):
+        """Unknown handles return 404"""
+        res = client.get("/oauth/userinfo?token=nope")
+        assert res.status_code == 404
+
+    def test_expired_handle_is_rejected(self, client, monkeypatch):
+        """Handles stop resolving after the TTL"""
+        monkeypatch.setattr(app, "OAUTH_USER_HANDLE_TTL_SECONDS", 0)
+        handle = app.issue_oauth_user_handle({"name": "Ada"})
+        assert app.lookup_oauth_user_handle(handle) is None
+
+
+class TestOAuthLogin:
+    """Test the prebuilt OAuth authorization redirects"""
+
+    def test_login_redirect_matches_request_host(self, client, monkeypatch):
+        """Local and production hosts get their own redirect_uri"""
+        monkeypatch.setitem(app.OAUTH_PROVIDERS["google"], "client_id", "client-id")
+        local = client.get("/oauth/login/google", base_url="http://localhost:8501")
+        prod = client.get("/oauth/login/google", base_url="https://api.swipswaps.com")
+
+        local_query = parse_qs(urlparse(local.headers["Location"]).query)
+        prod_query = parse_qs(urlparse(prod.headers["Location"]).query)
+        assert local_query["redirect_uri"] == ["http://localhost:8501/oauth/callback/google"]
+        assert prod_query["redirect_uri"] == ["https://api.swipswaps.com/oauth/callback/google"]
+        assert prod_query["scope"] == ["openid email profile"]
+
+    def test_unconfigured_provider_rejected(self, client, monkeypatch):
+        """A provider without a client id never redirects to the provider"""
+        monkeypatch.setitem(app.OAUTH_PROVIDERS["facebook"], "client_id", "")
+        res = client.get("/oauth/login/facebook")
+        assert res.headers["Location"].endswith("?error=oauth_not_configured")
+        assert client.get("/oauth/login/nope").headers["Location"].endswith("?error=unsupported_provider")
+
+
+class TestOAuthCallback:
+    """Test the table-driven authorization code exchange"""
+
+    @pytest.mark.parametrize("provider,method,field", [
+        ("google", "post", "data"),
+        ("facebook", "get", "params"),
+    ])
+    def test_token_exchange_per_provider(self, client, monkeypatch, provider, method, field):
+        """Each provider's code exchange uses its own method and parameters"""
+        exchanges = []
+
+        def fake_exchange(url, timeout=None, **kwargs):
+            exchanges.append((url, kwargs[field]))
+            return type("Response", (), {"status_code": 200, "json": lambda self: {"access_token": "tok"}})()
+
+        monkeypatch.setattr(app.http_session, method, fake_exchange)
+        monkeypatch.setattr(app, "get_user_info", lambda p, token: {"name": "Ada"})
+
+        res = client.get(f"/oauth/callback/{provider}?code=abc", base_url="http://localhost:8501")
+        assert "?token=" in res.headers["Location"]
+
+        url, sent = exchanges[0]
+        assert url == app.OAUTH_PROVIDERS[provider]["token_url"]
+        assert sent["code"] == "abc"
+        assert sent["redirect_uri"] == f"http://localhost:8501/oauth/callback/{provider}"
+        assert ("grant_type" in sent) == (provider == "google")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
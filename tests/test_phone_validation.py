@@ -0,0 +1,63 @@
+"""
+Phone number validation tests.
+
+E.164 input takes a regex fast path; every form goes through the
+memoized phonenumbers check, so results must match the slow path.
+"""
+
+import pytest
+import sys
+import os
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import app
+
+
+class TestValidatePhoneNumber:
+    """Test formatting, rejection and caching of phone numbers"""
+
+    @pytest.mark.parametrize("number", [
+        "+13217047403", "(321) 704-7403", "321-704-7403", "321.704.7403", "13217047403",
+    ])
+    def test_formats_normalize_to_e164(self, number):
+        """Formatted and already-E.164 input give the same result"""
+        assert app.validate_phone_number(number) == (True, "+13217047403")
+
+    def test_invalid_e164_rejected(self):
+        """Numbers matching the E.164 shape are still checked against metadata"""
+        assert app.validate_phone_number("+10000000000") == (False, "Invalid phone number")
+
+    def test_unparseable_input_rejected(self):
+        """Parse errors are reported, not raised"""
+        is_valid, result = app.validate_phone_number("not a number")
+        assert not is_valid
+        assert result.startswith("Invalid phone number format")
+
+    @pytest.mark.parametrize("number", ["1-800-FLOWERS", "12345", "+1 " + "2" * 30])
+    def test_malformed_input_skips_parser(self, number, monkeypatch):
+        """Input that is not phone-shaped is rejected before phonenumbers runs"""
+        monkeypatch.setattr(app.phonenumbers, "parse", lambda *a: pytest.fail("parsed"))
+        is_valid, result = app.validate_phone_number(number)
+        assert not is_valid
+        assert result.startswith("Invalid phone number format")
+
+    def test_repeat_lookups_hit_cache(self):
+        """The same number is only parsed once"""
+        app._validate_e164_candidate.cache_clear()
+        app.validate_phone_number("+13217047403")
+        app.validate_phone_number("+13217047403")
+        assert app._validate_e164_candidate.cache_info().hits == 1
+
+    def test_parse_errors_are_cached(self):
+        """Unparseable input is remembered instead of re-parsed"""
+        app._validate_e164_candidate.cache_clear()
+        first = app.validate_phone_number("+0 (123) 456")
+        assert app.validate_phone_number("+0 (123) 456") == first
+        assert not first[0] and first[1].startswith("Invalid phone number format")
+        assert app._validate_e164_candidate.cache_info().hits == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,77 @@
+"""
+Striped rate limit storage tests.
+
+memory-striped:// is the default flask-limiter backend; these tests pin
+its fixed-window counting, expiry and registration with limits.
+"""
+
+import pytest
+import sys
+import os
+import time
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import rate_limit_storage
+from rate_limit_storage import StripedMemoryStorage
+from limits import RateLimitItemPerMinute
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter
+
+
+@pytest.fixture
+def storage():
+    return StripedMemoryStorage()
+
+
+class TestStripedMemoryStorage:
+    """Test fixed-window counting in the striped store"""
+
+    def test_scheme_registered(self):
+        """The memory-striped:// URI resolves to this storage"""
+        assert isinstance(storage_from_string("memory-striped://"), StripedMemoryStorage)
+
+    def test_counts_within_window(self, storage):
+        """Hits accumulate until the window expires, then start over"""
+        assert storage.incr("k", 60) == 1
+        assert storage.incr("k", 60, amount=2) == 3
+        assert storage.get("k") == 3
+        assert storage.get_expiry("k") > time.time()
+
+        storage.incr("short", 0.01)
+        time.sleep(0.02)
+        assert storage.get("short") == 0
+        assert storage.incr("short", 60) == 1
+
+    def test_limiter_enforces_limit(self, storage):
+        """A fixed-window limiter over this storage allows exactly the limit"""
+        limiter = FixedWindowRateLimiter(storage)
+        item = RateLimitItemPerMinute(5)
+        results = [limiter.hit(item, "203.0.113.7") for _ in range(6)]
+        assert results == [True] * 5 + [False]
+        assert limiter.hit(item, "203.0.113.8")
+
+    def test_expired_windows_swept_on_write(self, storage, monkeypatch):
+        """A full shard drops its expired keys when a new window opens"""
+        monkeypatch.setattr(rate_limit_storage, "STRIPES", 1)
+        monkeypatch.setattr(rate_limit_storage, "SWEEP_THRESHOLD", 4)
+        storage = StripedMemoryStorage()
+        for i in range(4):
+            storage.incr(f"old-{i}", 0.01)
+        time.sleep(0.02)
+        storage.incr("new", 60)
+        assert list(storage._shards[0].windows) == ["new"]
+
+    def test_clear_and_reset(self, storage):
+        """clear() drops one key, reset() drops them all"""
+        storage.incr("a", 60)
+        storage.incr("b", 60)
+        storage.clear("a")
+        assert storage.get("a") == 0
+        assert storage.reset() == 1
+        assert storage.get("b") == 0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
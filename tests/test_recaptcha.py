@@ -0,0 +1,152 @@
+"""
+reCAPTCHA verification cache tests.
+
+verify_recaptcha() caches answers by token and client IP; these tests
+pin which results are cached and for how long.
+"""
+
+import pytest
+import sys
+import os
+import threading
+from urllib.parse import parse_qs
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import app
+
+
+@pytest.fixture
+def remote(monkeypatch):
+    """Replace the Google round-trip with a scripted, counting stub"""
+    calls = []
+    answers = {}
+
+    def fake_remote(token, remote_ip=None):
+        calls.append(token)
+        return answers.get(token)
+
+    monkeypatch.setattr(app, "_verify_recaptcha_remote", fake_remote)
+    monkeypatch.setattr(app, "RECAPTCHA_SKIP_REMOTE", False)
+    app._recaptcha_cache.clear()
+    yield calls, answers
+    app._recaptcha_cache.clear()
+
+
+class TestRecaptchaCache:
+    """Test that repeated tokens skip the remote verification"""
+
+    def test_repeated_token_is_served_from_cache(self, remote):
+        """Only the first verification of a token goes to Google"""
+        calls, answers = remote
+        answers["tok"] = True
+        assert app.verify_recaptcha("tok") is True
+        assert app.verify_recaptcha("tok") is True
+        assert calls == ["tok"]
+
+    def test_network_errors_are_not_cached(self, remote):
+        """A failed round-trip is retried on the next call"""
+        calls, _ = remote
+        assert app.verify_recaptcha("flaky") is False
+        assert app.verify_recaptcha("flaky") is False
+        assert calls == ["flaky", "flaky"]
+
+    def test_expired_entries_are_reverified(self, remote, monkeypatch):
+        """Entries older than the TTL are verified again"""
+        calls, answers = remote
+        answers["tok"] = False
+        app.verify_recaptcha("tok")
+        monkeypatch.setattr(app, "RECAPTCHA_CACHE_TTL_SECONDS", 0)
+        app.verify_recaptcha("tok")
+        assert calls == ["tok", "tok"]
+
+    def test_cache_is_per_client_ip(self, remote):
+        """The same token from another address is verified again"""
+        calls, answers = remote
+        answers["tok"] = True
+        app.verify_recaptcha("tok", "203.0.113.7")
+        app.verify_recaptcha("tok", "203.0.113.7")
+        app.verify_recaptcha("tok", "198.51.100.9")
+        assert calls == ["tok", "tok"]
+
+
+class TestRecaptchaTestSecret:
+    """Test the short-circuit for Google's always-pass test secret"""
+
+    def test_test_secret_skips_remote(self, remote, monkeypatch):
+        """Non-empty tokens pass without a round-trip; empty ones still fail"""
+        calls, _ = remote
+        monkeypatch.setattr(app, "RECAPTCHA_SKIP_REMOTE", True)
+        assert app.verify_recaptcha("anything") is True
+        assert app.verify_recaptcha("") is False
+        assert calls == []
+
+
+class TestRecaptchaRequest:
+    """Test the form body sent to Google's siteverify endpoint"""
+
+    def test_body_encodes_secret_and_token(self, monkeypatch):
+        """The prebuilt body decodes to exactly the secret and the token"""
+        sent = {}
+
+        class FakeResponse:
+            def json(self):
+                return {"success": True}
+
+        def fake_post(url, data=None, headers=None, timeout=None):
+            sent.update(url=url, data=data, headers=headers)
+            return FakeResponse()
+
+        monkeypatch.setattr(app.http_session, "post", fake_post)
+        token = "03A+b/c=d&e f"
+        assert app._verify_recaptcha_remote(token) is True
+        assert sent["url"] == app.RECAPTCHA_VERIFY_URL
+        assert sent["headers"]["Content-Type"] == "application/x-www-form-urlencoded"
+        assert parse_qs(sent["data"]) == {"secret": [app.RECAPTCHA_SECRET], "response": [token]}
+
+        app._verify_recaptcha_remote(token, "203.0.113.7")
+        assert parse_qs(sent["data"])["remoteip"] == ["203.0.113.7"]
+
+
+class TestRecaptchaOverlap:
+    """Test that /request_callback checks run during the reCAPTCHA round-trip"""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.setattr(app, "RECAPTCHA_SKIP_REMOTE", False)
+        monkeypatch.setattr(app.limiter, "enabled", False)
+        return app.app.test_client()
+
+    def test_local_checks_overlap_verification(self, client, monkeypatch):
+        """The daily-limit check runs while Google is still answering"""
+        limits_checked = threading.Event()
+
+        def slow_verify(token, remote_ip=None):
+            return limits_checked.wait(5) and False
+
+        def fake_limits(usage=None):
+            limits_checked.set()
+            return False, "limit", {}
+
+        monkeypatch.setattr(app, "verify_recaptcha", slow_verify)
+        monkeypatch.setattr(app, "check_daily_limits", fake_limits)
+        response = client.post("/request_callback", json={
+            "recaptcha_token": "tok", "visitor_number": "+12025550123"
+        })
+        assert limits_checked.is_set()
+        assert response.status_code == 400
+        assert "CAPTCHA" in response.get_json()["error"]
+
+    def test_captcha_failure_reported_before_phone_errors(self, client, monkeypatch):
+        """A bad token still wins over an invalid phone number"""
+        monkeypatch.setattr(app, "verify_recaptcha", lambda token, remote_ip=None: False)
+        response = client.post("/request_callback", json={
+            "recaptcha_token": "tok", "visitor_number": "not a phone"
+        })
+        assert response.status_code == 400
+        assert "CAPTCHA" in response.get_json()["error"]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,94 @@
+"""
+Statistics and health endpoint tests.
+
+/stats and /admin/api/stats derive their totals from a single grouped
+query; the numbers must match direct counts over the callbacks table.
+/health serves a body re-rendered at most once per HEALTH_CACHE_SECONDS.
+"""
+
+import pytest
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import app
+
+
+def direct_counts(since=None):
+    with app.get_db_connection() as conn:
+        query = "SELECT request_status, COUNT(*) FROM callbacks"
+        params = ()
+        if since:
+            query += " WHERE created_at > ?"
+            params = (since,)
+        return dict(conn.execute(query + " GROUP BY request_status", params).fetchall())
+
+
+@pytest.fixture
+def client():
+    return app.app.test_client()
+
+
+@pytest.fixture
+def old_request():
+    """A request created two days ago, outside the 24h window"""
+    created = (datetime.utcnow() - timedelta(days=2)).isoformat()
+    with app.get_db_connection() as conn:
+        conn.execute(
+            "INSERT INTO callbacks (request_id, visitor_phone, request_status, created_at, updated_at) "
+            "VALUES ('stats-old', '+12025550123', 'completed', ?, ?)",
+            (created, created)
+        )
+    yield
+    with app.get_db_connection() as conn:
+        conn.execute("DELETE FROM callbacks WHERE request_id = 'stats-old'")
+
+
+class TestStats:
+    """Test that aggregated statistics match the table"""
+
+    def test_public_stats_match_counts(self, client, old_request):
+        """Totals and per-status counts match direct queries"""
+        data = client.get("/stats").get_json()
+        counts = direct_counts()
+        assert data["by_status"] == counts
+        assert data["total_requests"] == sum(counts.values())
+
+    def test_admin_stats_split_last_24h(self, client, old_request, monkeypatch):
+        """Requests older than 24h count toward totals only"""
+        monkeypatch.setattr(app, "ADMIN_API_TOKEN", "stats-token")
+        cutoff = (datetime.utcnow() - timedelta(hours=24)).isoformat()
+        response = client.get("/admin/api/stats", headers={"Authorization": "Bearer stats-token"})
+        stats = response.get_json()["stats"]
+
+        assert stats["by_status"] == direct_counts()
+        assert stats["last_24h"]["by_status"] == direct_counts(cutoff)
+        assert stats["last_24h"]["total"] == sum(direct_counts(cutoff).values())
+
+
+class TestHealth:
+    """Test the cached health response"""
+
+    def test_health_matches_jsonify(self, client, monkeypatch):
+        """The pre-rendered body is what jsonify would produce"""
+        monkeypatch.setattr(app, "_health_body", (0.0, b""))
+        response = client.get("/health")
+        data = response.get_json()
+        assert response.mimetype == "application/json"
+        with app.app.app_context():
+            assert response.data == app.jsonify(data).data
+        assert data["status"] == "healthy"
+
+    def test_health_body_reused_within_window(self, client, monkeypatch):
+        """Probes inside the cache window get the same timestamp"""
+        monkeypatch.setattr(app, "_health_body", (0.0, b""))
+        monkeypatch.setattr(app, "HEALTH_CACHE_SECONDS", 60)
+        first = client.get("/health").get_json()["timestamp"]
+        assert client.get("/health").get_json()["timestamp"] == first
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,121 @@
+"""
+Status cache and stream tests.
+
+/status reads a request's status from an in-memory cache filled by
+status writers, falling back to SQLite on a miss. /status/<id>/stream
+pushes each change as a server-sent event until a final status.
+"""
+
+import pytest
+import sys
+import os
+import json
+import threading
+import uuid
+from datetime import datetime
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import app
+
+
+@pytest.fixture
+def request_id():
+    """Insert a pending callback row and return its request_id"""
+    rid = uuid.uuid4().hex
+    now_iso = datetime.utcnow().isoformat()
+    conn = app.get_db_connection()
+    conn.execute(
+        "INSERT INTO callbacks (request_id, visitor_phone, request_status, status_message, created_at, updated_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (rid, "+12025550123", "pending", "Waiting", now_iso, now_iso)
+    )
+    conn.commit()
+    conn.close()
+    yield rid
+    app.forget_status(rid)
+
+
+@pytest.fixture
+def client():
+    return app.app.test_client()
+
+
+class TestStatusCache:
+    """Test that cached status always matches the committed row"""
+
+    def test_miss_reads_database(self, request_id, client):
+        """A status never cached is served from SQLite"""
+        app.forget_status(request_id)
+        data = client.get(f"/status/{request_id}").get_json()
+        assert data["status"] == "pending"
+        assert app._status_cache[request_id][0] == "pending"
+
+    def test_update_refreshes_cache(self, request_id, client):
+        """update_callback_status writes through to the cache"""
+        client.get(f"/status/{request_id}")
+        app.update_callback_status(request_id, "calling", "Calling business")
+        assert client.get(f"/status/{request_id}").get_json()["status"] == "calling"
+
+    def test_bulk_write_invalidates(self, request_id):
+        """forget_status() makes the next lookup go back to SQLite"""
+        app.lookup_status(request_id)
+        conn = app.get_db_connection()
+        conn.execute("UPDATE callbacks SET request_status = 'failed' WHERE request_id = ?", (request_id,))
+        conn.commit()
+        conn.close()
+        app.forget_status()
+        assert app.lookup_status(request_id)[0] == "failed"
+
+    def test_unknown_request_is_404(self, client):
+        """Unknown ids are not found on either endpoint"""
+        assert client.get("/status/nope").status_code == 404
+        assert client.get("/status/nope/stream").status_code == 404
+
+    def test_status_response_is_json(self, request_id, client):
+        """json_response keeps the mimetype and body jsonify produced"""
+        res = client.get(f"/status/{request_id}")
+        assert res.mimetype == "application/json"
+        assert json.loads(res.data) == {
+            "success": True,
+            "status": "pending",
+            "message": res.get_json()["message"],
+            "updated_at": res.get_json()["updated_at"],
+        }
+
+
+class TestStatusStream:
+    """Test server-sent event delivery of status changes"""
+
+    def test_stream_follows_changes_until_final(self, request_id, client):
+        """The stream sends the current status, each change, then ends"""
+        def advance():
+            app.update_callback_status(request_id, "calling", "Calling business")
+            app.update_callback_status(request_id, "completed", "Done")
+
+        response = client.get(f"/status/{request_id}/stream", buffered=False)
+        assert response.mimetype == "text/event-stream"
+        chunks = response.response
+        first = next(chunks)
+        threading.Timer(0.05, advance).start()
+        body = first + b"".join(chunks)
+        response.close()
+
+        events = [json.loads(line[len(b"data: "):]) for line in body.split(b"\n") if line.startswith(b"data: ")]
+        assert events[0]["status"] == "pending"
+        assert events[-1]["status"] == "completed"
+
+    def test_stream_slots_released(self, request_id, client, monkeypatch):
+        """Streams beyond the cap are refused and closed streams free their slot"""
+        monkeypatch.setattr(app, "status_stream_slots", threading.BoundedSemaphore(1))
+        app.update_callback_status(request_id, "completed", "Done")
+
+        response = client.get(f"/status/{request_id}/stream")
+        assert client.get(f"/status/{request_id}/stream").status_code == 503
+        response.close()
+        assert client.get(f"/status/{request_id}/stream").status_code == 200
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
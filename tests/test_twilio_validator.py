@@ -0,0 +1,111 @@
+"""
+Twilio request validator tests.
+
+CachedKeyRequestValidator reuses a keyed HMAC; its signatures must match
+the stock twilio RequestValidator exactly. The Twilio client and
+validator are built once per process and shared.
+"""
+
+import pytest
+import sys
+import os
+
+# Add backend directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from twilio.request_validator import RequestValidator
+from werkzeug.datastructures import MultiDict
+
+import app
+from app import CachedKeyRequestValidator
+
+TOKEN = "12345"
+URL = "https://mycompany.com/myapp.php?foo=1&bar=2"
+PARAMS = {
+    "CallSid": "CA1234567890ABCDE",
+    "Caller": "+12349013030",
+    "Digits": "1234",
+    "From": "+12349013030",
+    "To": "+18005551212",
+}
+
+
+class TestCachedKeyRequestValidator:
+    """Test that the cached-key validator matches the stock validator"""
+
+    def test_signature_matches_stock_validator(self):
+        """Signatures are byte-for-byte those of RequestValidator"""
+        stock = RequestValidator(TOKEN)
+        cached = CachedKeyRequestValidator(TOKEN)
+        assert cached.compute_signature(URL, PARAMS) == stock.compute_signature(URL, PARAMS)
+
+    def test_repeated_values_match(self):
+        """Multi-valued form fields are signed like the stock validator"""
+        params = MultiDict([("b", "2"), ("a", "1"), ("b", "1")])
+        stock = RequestValidator(TOKEN)
+        cached = CachedKeyRequestValidator(TOKEN)
+        assert cached.compute_signature(URL, params) == stock.compute_signature(URL, params)
+
+    def test_validate_accepts_stock_signature(self):
+        """validate() accepts a signature produced by the stock validator"""
+        signature = RequestValidator(TOKEN).compute_signature(URL, PARAMS)
+        cached = CachedKeyRequestValidator(TOKEN)
+        assert cached.validate(URL, PARAMS, signature)
+        assert cached.validate(URL, PARAMS, signature)
+        assert not cached.validate(URL, PARAMS, "bogus")
+
+
+class TestSharedTwilioClient:
+    """Test that Twilio SDK objects are built once and reused"""
+
+    def test_client_and_validator_are_singletons(self):
+        """Repeated lookups return the same instances"""
+        sid = "AC" + "0" * 32
+        assert app._get_twilio_client(sid, TOKEN) is app._get_twilio_client(sid, TOKEN)
+        assert app._get_twilio_validator(TOKEN) is app._get_twilio_validator(TOKEN)
+
+    def test_client_uses_keep_alive_pool(self):
+        """The client's session is mounted with the larger connection pool"""
+        client = app._get_twilio_client("AC" + "1" * 32, TOKEN)
+        adapter = client.http_client.session.get_adapter("https://api.twilio.com")
+        assert adapter._pool_maxsize == 50
+
+    def test_retries_never_resend_posts(self):
+        """Gateway errors and 429s are retried, but only for idempotent methods"""
+        client = app._get_twilio_client("AC" + "1" * 32, TOKEN)
+        retry = client.http_client.session.get_adapter("https://api.twilio.com").max_retries
+        assert 429 in retry.status_forcelist
+        assert not retry.is_retry("POST", 503)
+        assert retry.is_retry("GET", 503)
+
+    def test_provider_validator_is_lazy_and_shared(self):
+        """The provider builds no validator until one is needed"""
+        provider = app.TwilioProvider("AC" + "2" * 32, TOKEN, "+12025550100")
+        assert "validator" not in vars(provider)
+        assert provider.validator is app._get_twilio_validator(TOKEN)
+        assert app.TwilioProvider("", "", "").validator is None
+
+
+class TestWebhookSignature:
+    """Test signature checks on the Twilio webhooks"""
+
+    def test_repeated_form_fields_validate(self, monkeypatch):
+        """A signed webhook with a repeated field is accepted, a forged one is not"""
+        validator = CachedKeyRequestValidator(TOKEN)
+        monkeypatch.setattr(app, "get_twilio_validator", lambda: validator)
+        monkeypatch.setattr(app, "update_callback_status", lambda *a, **k: None)
+        client = app.app.test_client()
+
+        url = "http://localhost/twilio/status_callback?request_id=sig-test"
+        form = MultiDict([("CallStatus", "completed"), ("CallDuration", "30"),
+                          ("Tag", "b"), ("Tag", "a")])
+        signature = RequestValidator(TOKEN).compute_signature(url, form)
+
+        ok = client.post(url, data=form, headers={"X-Twilio-Signature": signature})
+        forged = client.post(url, data=form, headers={"X-Twilio-Signature": "bogus"})
+        assert ok.status_code == 200
+        assert forged.status_code == 403
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
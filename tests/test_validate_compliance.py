@@ -0,0 +1,208 @@
+"""
+Compliance validator tests.
+
+These tests pin the behaviour of the byte-level checks in
+.augment/validate_compliance.py so that scanning optimizations
+(fused regexes, bytes input, mmap input) never change what passes
+and what fails.
+"""
+
+import pytest
+import sys
+import os
+import mmap
+
+REPO_ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+# Add .augment directory to path
+sys.path.insert(0, os.path.join(REPO_ROOT, '.augment'))
+
+import validate_compliance as vc
+
+
+GOOD_OUTPUT = (
+    "## Self-Audit\n"
+    "Request → Artifact Mapping: see `backend/app.py` and [README.md].\n"
+    "Assumption: none\n"
+    "Failure Mode: fails safely\n"
+    "```python\nprint(1)\n```\n"
+).encode("utf-8")
+
+
+@pytest.fixture
+def rubric(monkeypatch):
+    """Load the real rubric with the repository root as working directory"""
+    monkeypatch.chdir(REPO_ROOT)
+    return vc.load_rubric()
+
+
+def run_checks(output, rubric):
+    vc.check_repo_grounding(output, rubric)
+    vc.check_artifact_emission(output, rubric)
+    vc.check_self_audit(output, rubric)
+    vc.check_assumptions(output)
+    vc.check_failure_modes(output)
+
+
+class TestOutputChecks:
+    """Test that each check passes good output and rejects bad output"""
+
+    def test_good_output_passes(self, rubric):
+        """A complete, grounded output must pass every check"""
+        run_checks(GOOD_OUTPUT, rubric)
+
+    def test_missing_file_reference_fails(self, rubric):
+        """References to files that do not exist must fail"""
+        output = GOOD_OUTPUT.replace(b"backend/app.py", b"backend/nope.py")
+        with pytest.raises(SystemExit) as exc:
+            vc.check_repo_grounding(output, rubric)
+        assert exc.value.code == 1
+
+    def test_all_missing_references_reported(self, rubric, capsys):
+        """Every missing file is reported once, in a single failure"""
+        output = GOOD_OUTPUT + b"`a/nope.py` `b/nope.py` `a/nope.py`"
+        with pytest.raises(SystemExit):
+            vc.check_repo_grounding(output, rubric)
+        err = capsys.readouterr().err
+        assert "a/nope.py, b/nope.py" in err
+        assert err.count("a/nope.py") == 1
+
+    def test_bracket_file_reference_fails(self, rubric):
+        """The second reference pattern must be scanned too"""
+        output = GOOD_OUTPUT.replace(b"[README.md]", b"[NOPE.md]")
+        with pytest.raises(SystemExit):
+            vc.check_repo_grounding(output, rubric)
+
+    def test_forbidden_phrase_is_case_insensitive(self, rubric):
+        """Forbidden phrases must be detected regardless of case"""
+        with pytest.raises(SystemExit):
+            vc.check_artifact_emission(GOOD_OUTPUT + b"You Could try this", rubric)
+
+    def test_missing_marker_fails(self, rubric):
+        """Every required self-audit marker must be present"""
+        output = GOOD_OUTPUT.replace(b"## Self-Audit", b"## Audit")
+        with pytest.raises(SystemExit):
+            vc.check_self_audit(output, rubric)
+
+    def test_mid_line_markers_found(self, rubric):
+        """Markers that do not start a line fall back to the full scan"""
+        output = b"See Self-Audit, Request \xe2\x86\x92 Artifact Mapping, Assumption: x, Failure Mode"
+        vc.check_self_audit(output, rubric)
+
+    def test_missing_failure_mode_fails(self):
+        """Output without a failure-mode explanation must fail"""
+        with pytest.raises(SystemExit):
+            vc.check_failure_modes(b"no explanation here")
+
+    def test_assumption_without_colon_fails(self):
+        """The "Assumption" prefix alone is not a declaration"""
+        with pytest.raises(SystemExit):
+            vc.check_assumptions(b"Assumption none, Assumptions pending")
+        vc.check_assumptions(b"Assumption none\nAssumptions: none")
+
+    def test_required_phrases_single_scan(self, capsys):
+        """The combined scan reports the first missing category"""
+        vc.check_required_phrases(b"Fails safely. Assumptions: none")
+        with pytest.raises(SystemExit):
+            vc.check_required_phrases(b"Assumption: none")
+        assert "failure mode" in capsys.readouterr().err
+
+    def test_output_without_dot_skips_grounding(self, rubric):
+        """Outputs with no '.' cannot name a file and pass grounding"""
+        assert rubric['file_reference_gate'] == b"."
+        vc.check_repo_grounding(b"no file names here", rubric)
+
+
+class TestRepoSnapshot:
+    """Test existence checks with and without the repository snapshot"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_caches(self, monkeypatch):
+        monkeypatch.chdir(REPO_ROOT)
+        vc._repo_snapshot.cache_clear()
+        vc._exists.cache_clear()
+        yield
+        vc._repo_snapshot.cache_clear()
+        vc._exists.cache_clear()
+
+    def test_snapshot_answers_existing_paths(self):
+        """Known files are found in the snapshot, unknown ones are missing"""
+        assert "README.md" in vc._repo_snapshot()
+        assert vc._missing_files(["README.md", "./backend/app.py", "nope.md"]) == ["nope.md"]
+
+    def test_oversized_repo_falls_back_to_filesystem(self, monkeypatch):
+        """Above the size cap no snapshot is kept and results are unchanged"""
+        monkeypatch.setattr(vc, 'REPO_SNAPSHOT_LIMIT', 1)
+        assert vc._repo_snapshot() is None
+        assert vc._missing_files(["README.md", "nope.md"]) == ["nope.md"]
+
+
+class TestRubricCache:
+    """Test that the pickled rubric cache follows the YAML file"""
+
+    @pytest.fixture
+    def rubric_paths(self, monkeypatch, tmp_path):
+        source = os.path.join(REPO_ROOT, '.augment', 'compliance_rubric.yaml')
+        yaml_path = tmp_path / "compliance_rubric.yaml"
+        with open(source, 'rb') as f:
+            yaml_path.write_bytes(f.read())
+        cache_path = tmp_path / "compliance_rubric.yaml.pkl"
+        monkeypatch.setattr(vc, 'RUBRIC_PATH', yaml_path)
+        monkeypatch.setattr(vc, 'RUBRIC_CACHE_PATH', cache_path)
+        return yaml_path, cache_path
+
+    def test_cache_written_and_reused(self, rubric_paths, monkeypatch):
+        """A second load must come from the pickle, not the YAML parser"""
+        _, cache_path = rubric_paths
+        first = vc.load_rubric()
+        assert cache_path.exists()
+
+        monkeypatch.setattr(vc, '_parse_rubric', lambda: pytest.fail("YAML re-parsed"))
+        second = vc.load_rubric()
+        assert second['forbidden_phrases'] == first['forbidden_phrases']
+        assert second['markers_regex'].pattern == first['markers_regex'].pattern
+
+    def test_empty_lists_skip_checks(self, rubric_paths):
+        """Empty rubric sections compile to no-ops instead of erroring"""
+        yaml_path, _ = rubric_paths
+        yaml_path.write_text("forbidden_phrases:\nrequired_markers: []\n")
+        rubric = vc.load_rubric()
+        assert rubric['forbidden_regex'] is None
+        vc.check_artifact_emission(b"```consider```", rubric)
+        vc.check_self_audit(b"", rubric)
+
+    def test_cache_invalidated_by_mtime(self, rubric_paths):
+        """Editing the YAML must invalidate the cached rubric"""
+        yaml_path, _ = rubric_paths
+        vc.load_rubric()
+
+        yaml_path.write_text("forbidden_phrases:\n  - nope\n")
+        stat = yaml_path.stat()
+        os.utime(yaml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert vc.load_rubric()['forbidden_phrases'] == [b"nope"]
+
+
+class TestLargeOutputs:
+    """Test that memory-mapped outputs behave exactly like bytes"""
+
+    def test_mmap_output_matches_bytes(self, rubric, tmp_path):
+        """Outputs above MMAP_THRESHOLD are mapped and must still pass"""
+        path = tmp_path / "output.md"
+        path.write_bytes(GOOD_OUTPUT + b"x" * vc.MMAP_THRESHOLD)
+
+        with vc._open_output(path) as output:
+            assert isinstance(output, mmap.mmap)
+            run_checks(output, rubric)
+
+    def test_mmap_output_detects_violation(self, rubric, tmp_path):
+        """Violations deep in a mapped output must still be found"""
+        path = tmp_path / "output.md"
+        path.write_bytes(GOOD_OUTPUT + b"x" * vc.MMAP_THRESHOLD + b"\nconsider this")
+
+        with pytest.raises(SystemExit):
+            with vc._open_output(path) as output:
+                vc.check_artifact_emission(output, rubric)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])